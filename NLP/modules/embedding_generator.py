@@ -155,3 +155,39 @@ class EmbeddingGenerator:
             "embedding_dimension": self.embedding_dim,
             "max_seq_length": self.model.max_seq_length,
         }
+
+
+def quantize_embedding(embedding: np.ndarray) -> Tuple[np.ndarray, float]:
+    """
+    Quantifie un embedding float32 en int8 avec une échelle par vecteur
+
+    Args:
+        embedding: Embedding float (1 dimension)
+
+    Returns:
+        Tuple (vecteur int8, échelle float) tel que embedding ≈ q * scale
+    """
+    embedding = np.asarray(embedding, dtype=np.float32)
+    max_abs = float(np.max(np.abs(embedding))) if embedding.size else 0.0
+
+    # Vecteur nul : échelle arbitraire pour éviter une division par zéro
+    scale = max_abs / 127 if max_abs > 0 else 1.0
+    q = np.round(embedding / scale).astype(np.int8)
+
+    return q, scale
+
+
+def dequantize_embedding(q: Union[bytes, np.ndarray, List[int]], scale: float) -> np.ndarray:
+    """
+    Reconstruit un embedding float32 depuis sa version int8
+
+    Args:
+        q: Vecteur int8 (bytes stockés en BDD, numpy array ou liste)
+        scale: Échelle retournée par quantize_embedding
+
+    Returns:
+        Embedding float32 approché
+    """
+    if isinstance(q, (bytes, bytearray, memoryview)):
+        q = np.frombuffer(q, dtype=np.int8)
+    return np.asarray(q, dtype=np.int8).astype(np.float32) * np.float32(scale)
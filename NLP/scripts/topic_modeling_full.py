@@ -15,6 +15,7 @@ from sklearn.feature_extraction.text import CountVectorizer
 from sklearn.decomposition import LatentDirichletAllocation
 import re
 import pickle
+from collections import Counter, defaultdict
 from datetime import datetime
 
 print("="*80)
@@ -123,24 +124,34 @@ def clean_title(title):
     title = re.sub(r'\s+', ' ', title).strip()
     return title
 
-def lemmatize_title(title, nlp_model):
+# Dictionnaire {forme de surface: lemme ou None} pour l'inférence (api/routers/topic_predictor.py)
+# None = token connu mais filtré (stopword, verbe, ...). On garde l'analyse la plus fréquente.
+lemma_counts = defaultdict(Counter)
+
+def lemmatize_title_and_record(title, nlp_model):
     if not title:
         return ""
     doc = nlp_model(title)
-    lemmas = [
-        token.lemma_.lower()
-        for token in doc 
-        if (token.pos_ in ['NOUN', 'ADJ', 'PROPN']
-            and not token.is_stop
-            and token.lemma_.lower() not in TITLE_STOPWORDS
-            and len(token.lemma_) > 2
-            and token.is_alpha)
-    ]
+    lemmas = []
+    for token in doc:
+        keep = (token.pos_ in ['NOUN', 'ADJ', 'PROPN']
+                and not token.is_stop
+                and token.lemma_.lower() not in TITLE_STOPWORDS
+                and len(token.lemma_) > 2
+                and token.is_alpha)
+        lemma = token.lemma_.lower() if keep else None
+        lemma_counts[token.text.lower()][lemma] += 1
+        if lemma:
+            lemmas.append(lemma)
     return ' '.join(lemmas)
 
 # Appliquer
 df['title_cleaned'] = df['title'].apply(clean_title)
-df['title_lemmatized'] = df['title_cleaned'].apply(lambda x: lemmatize_title(x, nlp))
+df['title_lemmatized'] = df['title_cleaned'].apply(lambda x: lemmatize_title_and_record(x, nlp))
+
+title_lemma_dict = {
+    surface: counts.most_common(1)[0][0] for surface, counts in lemma_counts.items()
+}
 
 print(f"   ✅ {len(df):,} titres lemmatisés\n")
 
@@ -227,6 +238,13 @@ with open(model_file, 'wb') as f:
 
 print(f"✅ Modèle sauvegardé : {model_file}")
 
+# Sauvegarder le dictionnaire de lemmes (évite spaCy à l'inférence sur les titres connus)
+lemma_dict_file = "title_lemma_dict.pkl"
+with open(lemma_dict_file, 'wb') as f:
+    pickle.dump(title_lemma_dict, f)
+
+print(f"✅ Dictionnaire de lemmes sauvegardé : {lemma_dict_file} ({len(title_lemma_dict):,} formes)")
+
 print("\n" + "="*80)
 print("✨ TOPIC MODELING TERMINÉ !")
 print("="*80)
\ No newline at end of file
@@ -0,0 +1,67 @@
+"""
+test_quantization.py
+
+Tests de la quantification int8 des embeddings (stockage en BDD).
+
+Teste :
+- Aller-retour quantize_embedding → dequantize_embedding (erreur ≤ échelle / 2)
+- Vecteur nul (pas de division par zéro)
+- Lecture depuis les bytes stockés en BDD
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Ajouter le chemin des modules NLP
+sys.path.insert(0, str(Path(__file__).parent.parent / "modules"))
+
+from embedding_generator import dequantize_embedding, quantize_embedding
+
+
+def test_roundtrip_error_bounded():
+    """Chaque composante est reconstruite à une demi-échelle près"""
+    rng = np.random.default_rng(42)
+    embedding = rng.normal(size=384).astype(np.float32)
+
+    q, scale = quantize_embedding(embedding)
+
+    assert q.dtype == np.int8
+    assert q.shape == embedding.shape
+    assert np.abs(q).max() == 127  # Composante de plus grande valeur absolue
+    restored = dequantize_embedding(q, scale)
+    assert restored.dtype == np.float32
+    assert np.abs(restored - embedding).max() <= scale / 2 + 1e-6
+
+    # Similarité cosinus quasi inchangée
+    cosine = np.dot(restored, embedding) / (np.linalg.norm(restored) * np.linalg.norm(embedding))
+    assert cosine > 0.999
+
+
+def test_zero_vector():
+    """Vecteur nul : échelle arbitraire, reconstruction exacte"""
+    q, scale = quantize_embedding(np.zeros(8, dtype=np.float32))
+
+    assert scale > 0
+    assert not q.any()
+    assert not dequantize_embedding(q, scale).any()
+
+
+def test_dequantize_from_bytes():
+    """Les bytes stockés en BDD donnent le même vecteur que le tableau int8"""
+    embedding = np.array([0.5, -1.0, 0.25, 0.0], dtype=np.float32)
+    q, scale = quantize_embedding(embedding)
+
+    from_bytes = dequantize_embedding(q.tobytes(), scale)
+    from_list = dequantize_embedding(q.tolist(), scale)
+
+    assert np.array_equal(from_bytes, dequantize_embedding(q, scale))
+    assert np.array_equal(from_list, from_bytes)
+
+
+if __name__ == "__main__":
+    test_roundtrip_error_bounded()
+    test_zero_vector()
+    test_dequantize_from_bytes()
+    print("✅ Tests de quantification réussis")
@@ -7,6 +7,7 @@ API REST pour l'analyse textuelle des offres d'emploi.
 
 from fastapi import FastAPI, Depends, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker, Session
 from typing import List, Dict, Optional
@@ -57,6 +58,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,  # Sérialisation JSON rapide (orjson)
 )
 
 # CORS
@@ -83,6 +85,12 @@ app.include_router(offers.router, prefix="/api", tags=["offers"])
 app.include_router(trends.router, prefix="/api", tags=["trends"])
 
 
+@app.on_event("startup")
+async def warmup_nlp_models():
+    """Précharge les modèles NLP pour éviter la latence du premier /scrape"""
+    await scraper.warmup()
+
+
 def get_db():
     db = SessionLocal()
     try:
@@ -7,8 +7,9 @@ dans PostgreSQL (schéma compatible avec db_inserter_v2.py)
 """
 
 import psycopg2
+import numpy as np
 import os
-from datetime import datetime
+from datetime import date, datetime
 from typing import Dict
 import logging
 import re
@@ -21,7 +22,7 @@ project_root = Path(__file__).parent.parent.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
-from collectors.geo_matcher import GeoMatcher
+from collectors.geo_matcher import get_default_matcher
 
 try:
     from api.routers.topic_predictor import get_topic_predictor
@@ -64,7 +65,10 @@ def save_offer_to_database(
         category_info = nlp_results.get("steps", {}).get("category", {})
 
         # ===== VÉRIFICATION DE DOUBLON PAR EMBEDDING =====
+        # Le NLP renvoie un numpy array : conversion en liste pour psycopg2/pgvector
         embedding_vector = final.get("embedding_vector")
+        if embedding_vector is not None:
+            embedding_vector = np.asarray(embedding_vector).tolist()
         if embedding_vector:
             logger.info("🔍 Vérification des doublons par similarité d'embedding...")
             duplicate_check = _check_duplicate_by_embedding(
@@ -95,12 +99,12 @@ def save_offer_to_database(
             cursor, conn, raw_data.get("source", "unknown")
         )
 
-        # 2. date_id (basé sur published_date)
-        date_id = _get_or_create_date(cursor, conn, raw_data.get("published_date"))
+        # 2. date_id (basé sur published_date, parsée une seule fois)
+        published_date = _parse_published_date(raw_data.get("published_date"))
+        date_id = _get_or_create_date(cursor, conn, published_date)
 
         # 3. commune_id (via GeoMatcher)
         commune_id = _get_commune_id(
-            database_url,
             raw_data.get("location_city", "").strip(),
             raw_data.get("location_code_postal", "").strip(),
         )
@@ -158,7 +162,7 @@ def save_offer_to_database(
             contract_type=contract_type,
             salary_min=salary_min,
             salary_max=salary_max,
-            published_date=_parse_published_date(raw_data.get("published_date")),
+            published_date=published_date,
             experience_years=experience_years,
             profile_category=final.get("profile_category"),
             profile_confidence=final.get("profile_confidence"),
@@ -192,8 +196,10 @@ def save_offer_to_database(
             cursor,
             conn,
             offer_id,
-            final.get("embedding_vector"),
+            embedding_vector,
             final.get("embedding_model"),
+            final.get("embedding_q"),
+            final.get("embedding_scale"),
         )
 
         conn.commit()
@@ -292,16 +298,9 @@ def _get_or_create_source(cursor, conn, source_name: str) -> int:
     return cursor.fetchone()[0]
 
 
-def _get_or_create_date(cursor, conn, published_date_str: str) -> int:
-    """Récupère ou crée une date"""
-    if not published_date_str:
-        return None
-
-    try:
-        pub_date = datetime.fromisoformat(
-            published_date_str.replace("Z", "+00:00")
-        ).date()
-    except:
+def _get_or_create_date(cursor, conn, pub_date: date) -> int:
+    """Récupère ou crée une date (déjà parsée par _parse_published_date)"""
+    if pub_date is None:
         return None
 
     cursor.execute("SELECT date_id FROM dim_dates WHERE full_date = %s", (pub_date,))
@@ -309,63 +308,21 @@ def _get_or_create_date(cursor, conn, published_date_str: str) -> int:
     if result:
         return result[0]
 
-    # Créer la date
-    month_names = [
-        "",
-        "Janvier",
-        "Février",
-        "Mars",
-        "Avril",
-        "Mai",
-        "Juin",
-        "Juillet",
-        "Août",
-        "Septembre",
-        "Octobre",
-        "Novembre",
-        "Décembre",
-    ]
-    day_names = [
-        "Lundi",
-        "Mardi",
-        "Mercredi",
-        "Jeudi",
-        "Vendredi",
-        "Samedi",
-        "Dimanche",
-    ]
-
+    # Créer la date (attributs calculés par PostgreSQL : colonnes générées)
     cursor.execute(
-        """
-        INSERT INTO dim_dates
-        (full_date, year, quarter, month, month_name, week, day_of_week, day_name, is_weekend)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-        RETURNING date_id
-        """,
-        (
-            pub_date,
-            pub_date.year,
-            (pub_date.month - 1) // 3 + 1,
-            pub_date.month,
-            month_names[pub_date.month],
-            pub_date.isocalendar()[1],
-            pub_date.weekday() + 1,
-            day_names[pub_date.weekday()],
-            pub_date.weekday() >= 5,
-        ),
+        "INSERT INTO dim_dates (full_date) VALUES (%s) RETURNING date_id",
+        (pub_date,),
     )
     conn.commit()
     return cursor.fetchone()[0]
 
 
-def _get_commune_id(database_url: str, city: str, postal_code: str) -> int:
-    """Récupère le commune_id via GeoMatcher"""
+def _get_commune_id(city: str, postal_code: str) -> int:
+    """Récupère le commune_id via le GeoMatcher partagé"""
     if not city:
         return None
 
-    geo_matcher = GeoMatcher(database_url)
-    commune_id = geo_matcher.find_commune_id(city, postal_code)
-    geo_matcher.close()
+    commune_id = get_default_matcher().find_commune_id(city, postal_code)
 
     if not commune_id:
         logger.warning(f"  ⚠️ Commune non trouvée: {city} ({postal_code})")
@@ -443,9 +400,11 @@ def _parse_published_date(published_date_str: str):
     if not published_date_str:
         return None
 
+    if published_date_str.endswith("Z"):
+        published_date_str = published_date_str[:-1] + "+00:00"
     try:
-        return datetime.fromisoformat(published_date_str.replace("Z", "+00:00")).date()
-    except:
+        return datetime.fromisoformat(published_date_str).date()
+    except ValueError:
         return None
 
 
@@ -594,21 +553,39 @@ def _insert_skills_and_relations(
         )
 
 
-def _insert_embedding(cursor, conn, offer_id: int, embedding_vector, model_name: str):
-    """Insère l'embedding dans job_embeddings"""
+def _insert_embedding(
+    cursor,
+    conn,
+    offer_id: int,
+    embedding_vector,
+    model_name: str,
+    embedding_q=None,
+    embedding_scale: float = None,
+):
+    """Insère l'embedding (float + version quantifiée int8) dans job_embeddings"""
     if not embedding_vector:
         return
 
+    # Version int8 stockée en BYTEA (1 octet/dimension au lieu de 4)
+    embedding_q_bytes = None
+    if embedding_q is not None and embedding_scale is not None:
+        embedding_q_bytes = psycopg2.Binary(
+            np.asarray(embedding_q, dtype=np.int8).tobytes()
+        )
+
     logger.info("💾 Insertion de l'embedding...")
     cursor.execute(
         """
-        INSERT INTO job_embeddings (offer_id, embedding, model_name, created_at)
-        VALUES (%s, %s, %s, NOW())
+        INSERT INTO job_embeddings
+        (offer_id, embedding, embedding_q, embedding_scale, model_name, created_at)
+        VALUES (%s, %s, %s, %s, %s, NOW())
         ON CONFLICT (offer_id) 
         DO UPDATE SET 
             embedding = EXCLUDED.embedding,
+            embedding_q = EXCLUDED.embedding_q,
+            embedding_scale = EXCLUDED.embedding_scale,
             model_name = EXCLUDED.model_name,
             created_at = NOW()
         """,
-        (offer_id, embedding_vector, model_name),
+        (offer_id, embedding_vector, embedding_q_bytes, embedding_scale, model_name),
     )
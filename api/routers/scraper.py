@@ -10,11 +10,14 @@ Et traiter l'offre avec les modules NLP.
 """
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import Dict, Optional, List
 from datetime import datetime
+import asyncio
 import logging
 import sys
+import traceback
 import requests
 from pathlib import Path
 import psycopg2
@@ -34,10 +37,13 @@ from collectors.france_travail_collector import FranceTravailCollector
 # Import des modules de traitement
 try:
     from api.routers.database_saver import save_offer_to_database
-    from api.routers.topic_predictor import predict_topic_for_offer
+    from api.routers.topic_predictor import (
+        get_topic_predictor,
+        predict_topic_for_offer,
+    )
 except (ModuleNotFoundError, ImportError):
     from routers.database_saver import save_offer_to_database
-    from routers.topic_predictor import predict_topic_for_offer
+    from routers.topic_predictor import get_topic_predictor, predict_topic_for_offer
 
 logger = logging.getLogger("scraper")
 
@@ -47,6 +53,10 @@ router = APIRouter()
 load_dotenv()
 DATABASE_URL = os.getenv("DATABASE_URL")
 
+# Taille max de la description traitée par le NLP (le modèle d'embedding
+# tronque de toute façon à 256-512 tokens)
+MAX_DESCRIPTION_CHARS = 8000
+
 
 # ============================================================================
 # MODELS
@@ -59,6 +69,7 @@ class ScrapeRequest(BaseModel):
     source: str  # "wttj" ou "france_travail"
     identifier: str  # URL pour WTTJ, ID pour France Travail
     save_to_db: bool = False  # Sauvegarder en BDD après scraping
+    include_embedding: bool = False  # Inclure le vecteur d'embedding dans la réponse
 
 
 class ScrapeResponse(BaseModel):
@@ -165,6 +176,89 @@ def scrape_france_travail_offer(offer_id: str) -> Dict:
         raise HTTPException(status_code=500, detail=f"Erreur traitement: {str(e)}")
 
 
+# ============================================================================
+# NLP SINGLETONS
+# ============================================================================
+
+# Instances globales (chargées une seule fois : spaCy, SentenceTransformer, ...)
+_cleaner_instance = None
+_info_extractor_instance = None
+_skill_extractor_instance = None
+_embedding_gen_instance = None
+
+
+def _get_cleaner():
+    """Retourne une instance singleton du TextCleaner"""
+    global _cleaner_instance
+    if _cleaner_instance is None:
+        from NLP.modules.text_cleaner import TextCleaner
+
+        _cleaner_instance = TextCleaner()
+    return _cleaner_instance
+
+
+def _get_info_extractor():
+    """Retourne une instance singleton de l'InfoExtractor"""
+    global _info_extractor_instance
+    if _info_extractor_instance is None:
+        from NLP.modules.info_extractor import InfoExtractor
+
+        _info_extractor_instance = InfoExtractor()
+    return _info_extractor_instance
+
+
+def _get_skill_extractor():
+    """Retourne une instance singleton du SkillExtractor"""
+    global _skill_extractor_instance
+    if _skill_extractor_instance is None:
+        from NLP.modules.skill_extractor import SkillExtractor
+
+        _skill_extractor_instance = SkillExtractor()
+    return _skill_extractor_instance
+
+
+def _get_embedding_gen():
+    """Retourne une instance singleton de l'EmbeddingGenerator"""
+    global _embedding_gen_instance
+    if _embedding_gen_instance is None:
+        from NLP.modules.embedding_generator import EmbeddingGenerator
+
+        _embedding_gen_instance = EmbeddingGenerator()
+    return _embedding_gen_instance
+
+
+async def warmup():
+    """
+    Précharger les modèles NLP au démarrage de l'API
+
+    Les chargements tournent en parallèle dans des threads ; un échec
+    (ex: modèle LDA absent) est loggé sans bloquer le démarrage.
+    """
+    logger.info("🔥 Préchargement des modèles NLP...")
+
+    loaders = (
+        _get_cleaner,
+        _get_info_extractor,
+        _get_skill_extractor,
+        _get_embedding_gen,
+        get_topic_predictor,
+    )
+    results = await asyncio.gather(
+        *[asyncio.to_thread(fn) for fn in loaders], return_exceptions=True
+    )
+    for fn, result in zip(loaders, results):
+        if isinstance(result, Exception):
+            logger.warning(f"⚠️ Préchargement {fn.__name__} échoué: {result}")
+
+    # Premier encodage : initialise les kernels du transformer hors requête
+    if _embedding_gen_instance is not None:
+        await asyncio.to_thread(
+            _embedding_gen_instance.generate, "warmup text pour le modèle d'embedding"
+        )
+
+    logger.info("✅ Modèles NLP préchargés")
+
+
 # ============================================================================
 # NLP PROCESSING
 # ============================================================================
@@ -183,21 +277,25 @@ def process_nlp(job_data: Dict) -> Dict:
     logger.info("🧠 Traitement NLP...")
 
     try:
-        # Import des modules NLP
-        from NLP.modules.text_cleaner import TextCleaner
-        from NLP.modules.skill_extractor import SkillExtractor
-        from NLP.modules.info_extractor import InfoExtractor
-        from NLP.modules.embedding_generator import EmbeddingGenerator
+        from NLP.modules.embedding_generator import quantize_embedding
 
         description = job_data.get("description", "")
 
         if not description:
             return {"error": "Pas de description disponible", "steps_completed": []}
 
+        # Borne le coût CPU sur les descriptions anormalement longues
+        # (job_data garde le texte complet pour la BDD)
+        if len(description) > MAX_DESCRIPTION_CHARS:
+            logger.info(
+                f"  ✂️ Description tronquée: {len(description)} -> {MAX_DESCRIPTION_CHARS} caractères"
+            )
+            description = description[:MAX_DESCRIPTION_CHARS]
+
         nlp_results = {"steps": {}, "final": {}}
 
         # 1. Nettoyage du texte
-        cleaner = TextCleaner()
+        cleaner = _get_cleaner()
         clean_result = cleaner.clean_and_lemmatize(description)
 
         cleaned_text = clean_result.get("cleaned_text", "")
@@ -210,13 +308,13 @@ def process_nlp(job_data: Dict) -> Dict:
         logger.info("  ✅ Texte nettoyé")
 
         # 2. Extraction d'informations
-        info_extractor = InfoExtractor()
+        info_extractor = _get_info_extractor()
         info = info_extractor.extract_all(description)
         nlp_results["steps"]["info_extraction"] = info
         logger.info("  ✅ Informations extraites")
 
         # 3. Extraction de compétences et catégorisation
-        skill_extractor = SkillExtractor()
+        skill_extractor = _get_skill_extractor()
         skills = skill_extractor.extract_skills(description)
         category = skill_extractor.categorize_offer(description)
         nlp_results["steps"]["skills_extracted"] = skills
@@ -275,17 +373,20 @@ def process_nlp(job_data: Dict) -> Dict:
 
         logger.info(f"  📝 Texte pour embedding: {len(text_for_embedding)} caractères")
 
-        embedding_gen = EmbeddingGenerator()
+        embedding_gen = _get_embedding_gen()
         embedding = embedding_gen.generate(text_for_embedding)
 
         # Vérifier que l'embedding est valide
         if embedding is None or (hasattr(embedding, "size") and embedding.size == 0):
             raise ValueError("Embedding vide généré")
 
+        # Version quantifiée int8 (4x plus compacte) pour le stockage en BDD
+        embedding_q, embedding_scale = quantize_embedding(embedding)
+
         nlp_results["steps"]["embedding"] = {
             "shape": list(embedding.shape),  # Convertir tuple en liste pour JSON
             "model": embedding_gen.model_name,
-            "vector": embedding.tolist(),  # Convertir numpy array en liste
+            "vector": embedding,  # Retiré par strip_embedding sauf include_embedding
         }
         logger.info(f"  ✅ Embedding généré ({embedding.shape[0]} dimensions)")
 
@@ -338,7 +439,9 @@ def process_nlp(job_data: Dict) -> Dict:
             "skills_by_category": skills,
             "embedding_dimensions": int(embedding.shape[0]),
             "description_cleaned": lemmas_str,  # Pour la BDD
-            "embedding_vector": embedding.tolist(),  # Pour la BDD
+            "embedding_vector": embedding,  # Pour la BDD (numpy, sérialisé par orjson)
+            "embedding_q": embedding_q,  # Pour la BDD (int8)
+            "embedding_scale": embedding_scale,  # Pour la BDD
             "embedding_model": embedding_gen.model_name,  # Pour la BDD
             "topic_id": topic_result.get("topic_id"),  # Pour la BDD
             "topic_label": topic_result.get("topic_label"),  # Pour la BDD
@@ -349,12 +452,36 @@ def process_nlp(job_data: Dict) -> Dict:
         return nlp_results
 
     except Exception as e:
-        import traceback
+        # Traceback dans les logs serveur uniquement (formatée par le handler)
+        logger.exception("❌ Erreur NLP: %s", e)
+        nlp_error = {"error": str(e), "steps_completed": []}
+        if logger.isEnabledFor(logging.DEBUG):
+            nlp_error["error_details"] = traceback.format_exc()
+        return nlp_error
 
-        error_details = traceback.format_exc()
-        logger.error(f"❌ Erreur NLP: {e}")
-        logger.error(f"Détails: {error_details}")
-        return {"error": str(e), "error_details": error_details, "steps_completed": []}
+
+def strip_embedding(nlp_results: Optional[Dict]) -> Optional[Dict]:
+    """
+    Retirer les vecteurs d'embedding des résultats NLP avant la réponse HTTP
+
+    Les vecteurs (384 floats + version int8) représentent l'essentiel du
+    payload JSON et ne servent qu'à la sauvegarde en BDD.
+
+    Args:
+        nlp_results: Résultats NLP (modifiés en place)
+
+    Returns:
+        Les mêmes résultats NLP, sans les vecteurs
+    """
+    if not nlp_results:
+        return nlp_results
+    if isinstance(nlp_results.get("final"), dict):
+        for key in ("embedding_vector", "embedding_q", "embedding_scale"):
+            nlp_results["final"].pop(key, None)
+    embedding_step = (nlp_results.get("steps") or {}).get("embedding")
+    if isinstance(embedding_step, dict):
+        embedding_step.pop("vector", None)
+    return nlp_results
 
 
 # ============================================================================
@@ -382,6 +509,16 @@ def save_to_database(raw_data: Dict, nlp_results: Dict) -> Dict:
 # ============================================================================
 
 
+def _orjson_response(response: ScrapeResponse) -> ORJSONResponse:
+    """
+    Sérialiser la réponse directement avec orjson
+
+    model_dump() (mode python) conserve les numpy arrays, qu'orjson sérialise
+    nativement (OPT_SERIALIZE_NUMPY) sans passer par .tolist().
+    """
+    return ORJSONResponse(response.model_dump())
+
+
 @router.post("/scrape", response_model=ScrapeResponse)
 async def scrape_offer(request: ScrapeRequest):
     """
@@ -391,7 +528,8 @@ async def scrape_offer(request: ScrapeRequest):
         request: Source (wttj/france_travail) et identifiant (URL/ID)
 
     Returns:
-        Données brutes + résultats NLP
+        Données brutes + résultats NLP (vecteur d'embedding seulement si
+        include_embedding=True)
     """
     logger.info(f"📥 Requête scraping: {request.source} - {request.identifier[:50]}")
 
@@ -423,13 +561,17 @@ async def scrape_offer(request: ScrapeRequest):
                 logger.warning(
                     f"   Offre existante: {db_result.get('existing_title', 'N/A')}"
                 )
-                return ScrapeResponse(
-                    success=False,
-                    source=request.source,
-                    raw_data=raw_data,
-                    nlp_results=nlp_results,
-                    saved_to_db=False,
-                    error=f"Doublon détecté: {db_result['message']} (Offre #{db_result.get('existing_offer_id')})",
+                if not request.include_embedding:
+                    strip_embedding(nlp_results)
+                return _orjson_response(
+                    ScrapeResponse(
+                        success=False,
+                        source=request.source,
+                        raw_data=raw_data,
+                        nlp_results=nlp_results,
+                        saved_to_db=False,
+                        error=f"Doublon détecté: {db_result['message']} (Offre #{db_result.get('existing_offer_id')})",
+                    )
                 )
 
             saved_to_db = db_result.get("success", False)
@@ -440,13 +582,18 @@ async def scrape_offer(request: ScrapeRequest):
                     f"⚠️ Sauvegarde en BDD échouée: {db_result.get('message')}"
                 )
 
-        # 4. Réponse
-        return ScrapeResponse(
-            success=True,
-            source=request.source,
-            raw_data=raw_data,
-            nlp_results=nlp_results,
-            saved_to_db=saved_to_db,
+        # 4. Réponse (vecteur d'embedding opt-in : payload 3-5x plus léger)
+        if not request.include_embedding:
+            strip_embedding(nlp_results)
+
+        return _orjson_response(
+            ScrapeResponse(
+                success=True,
+                source=request.source,
+                raw_data=raw_data,
+                nlp_results=nlp_results,
+                saved_to_db=saved_to_db,
+            )
         )
 
     except HTTPException:
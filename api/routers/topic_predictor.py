@@ -9,6 +9,8 @@ Utilise le modèle LDA pré-entraîné.
 import pickle
 import spacy
 import re
+import numpy as np
+from scipy.sparse import csr_matrix
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 import logging
@@ -67,6 +69,9 @@ TITLE_STOPWORDS = set(
     ]
 )
 
+# Sentinelle : token absent du dictionnaire de lemmes (≠ None = token filtré)
+_UNKNOWN = object()
+
 
 class TopicPredictor:
     """Prédit le topic d'une offre avec le modèle LDA"""
@@ -126,6 +131,29 @@ class TopicPredictor:
         except Exception as e:
             raise RuntimeError(f"❌ Erreur chargement modèle LDA : {e}")
 
+        # Vectorisation directe (évite la boucle Python de vectorizer.transform)
+        # Seulement pour un CountVectorizer simple : TF-IDF / binaire -> transform
+        self._vocab = self.vectorizer.vocabulary_
+        self._n_features = len(self._vocab)
+        self._analyzer = self.vectorizer.build_analyzer()
+        self._direct_vectorize = not hasattr(self.vectorizer, "idf_") and not getattr(
+            self.vectorizer, "binary", False
+        )
+
+        # Charger le dictionnaire de lemmes (optionnel, généré avec le modèle LDA)
+        # {forme de surface: lemme ou None si le token est filtré}
+        self._lemma_dict = {}
+        lemma_dict_path = Path(model_path).parent / "title_lemma_dict.pkl"
+        if lemma_dict_path.exists():
+            try:
+                with open(lemma_dict_path, "rb") as f:
+                    self._lemma_dict = pickle.load(f)
+                logger.info(
+                    f"✅ Dictionnaire de lemmes chargé : {len(self._lemma_dict)} formes"
+                )
+            except Exception as e:
+                logger.warning(f"⚠️ Dictionnaire de lemmes illisible : {e}")
+
         # Charger spaCy
         try:
             self.nlp = spacy.load("fr_core_news_md")
@@ -160,26 +188,60 @@ class TopicPredictor:
         return title
 
     def lemmatize_title(self, title: str) -> str:
-        """Lemmatise un titre"""
+        """
+        Lemmatise un titre
+
+        Les tokens connus sont résolus par le dictionnaire de lemmes, seuls
+        les tokens inconnus passent par spaCy.
+        """
         if not title:
             return ""
 
-        doc = self.nlp(title)
-
-        lemmas = [
-            token.lemma_.lower()
-            for token in doc
-            if (
-                token.pos_ in ["NOUN", "ADJ", "PROPN"]
-                and not token.is_stop
-                and token.lemma_.lower() not in TITLE_STOPWORDS
-                and len(token.lemma_) > 2
-                and token.is_alpha
+        lemmas = []
+        unknown_tokens = []
+        for tok in title.split():
+            lemma = self._lemma_dict.get(tok, _UNKNOWN)
+            if lemma is _UNKNOWN:
+                unknown_tokens.append(tok)
+            elif lemma and lemma not in TITLE_STOPWORDS:
+                lemmas.append(lemma)
+
+        if unknown_tokens:
+            doc = self.nlp(" ".join(unknown_tokens))
+            lemmas.extend(
+                token.lemma_.lower()
+                for token in doc
+                if (
+                    token.pos_ in ["NOUN", "ADJ", "PROPN"]
+                    and not token.is_stop
+                    and token.lemma_.lower() not in TITLE_STOPWORDS
+                    and len(token.lemma_) > 2
+                    and token.is_alpha
+                )
             )
-        ]
 
         return " ".join(lemmas)
 
+    def _vectorize(self, title_lemmatized: str) -> csr_matrix:
+        """Vectorise un titre lemmatisé (matrice creuse 1 x n_features)"""
+        if not self._direct_vectorize:
+            return self.vectorizer.transform([title_lemmatized])
+
+        indices = [
+            self._vocab[t] for t in self._analyzer(title_lemmatized) if t in self._vocab
+        ]
+        data = np.ones(len(indices), dtype=np.int64)
+        indptr = np.array([0, len(indices)])
+
+        title_vec = csr_matrix(
+            (data, indices, indptr),
+            shape=(1, self._n_features),
+            dtype=self.vectorizer.dtype,
+        )
+        # Additionner les occurrences multiples d'un même terme (comme CountVectorizer)
+        title_vec.sum_duplicates()
+        return title_vec
+
     def predict_topic(self, title: str) -> Dict:
         """
         Prédit le topic d'une offre depuis son titre
@@ -203,7 +265,7 @@ class TopicPredictor:
                 return {"topic_id": None, "topic_label": None, "topic_confidence": 0.0}
 
             # Vectoriser
-            title_vec = self.vectorizer.transform([title_lemmatized])
+            title_vec = self._vectorize(title_lemmatized)
 
             # Prédire
             topic_dist = self.lda.transform(title_vec)
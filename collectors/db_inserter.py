@@ -14,20 +14,95 @@ Usage:
 """
 
 import os
+import io
+import re
+import csv
 import logging
+from functools import lru_cache
+from collections import OrderedDict
 from typing import Dict, List
-from datetime import datetime
+from datetime import date, datetime
 from dotenv import load_dotenv
+import pandas as pd
 
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.exc import IntegrityError
+from psycopg2.extras import execute_values
+
+# Automate Aho-Corasick (optionnel) pour la catégorisation des titres
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 # Configuration
 load_dotenv()
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger("DBInserter")
 
+# Regex précompilées (appelées pour chaque offre)
+_RE_MULTINL = re.compile(r'\n{3,}')
+_RE_SAL_RANGE = re.compile(r'(\d+K?\s*[€]?\s*[àa-]\s*\d+K?\s*[€]?)', re.IGNORECASE)
+_RE_SAL_LABEL = re.compile(r'[Ss]alaire\s*:?\s*(\d+\s*K?\s*[€]?\s*[àa-]?\s*\d*\s*K?\s*[€]?)')
+_RE_SAL_ENTRE = re.compile(r'[Ee]ntre\s*(\d+K?\s*et\s*\d+K?)')
+_RE_HAS_K = re.compile(r'\d+\s*K', re.IGNORECASE)
+_RE_NUMS = re.compile(r'(\d+(?:\.\d+)?)')
+
+
+@lru_cache(maxsize=1024)
+def _parse_iso(iso_date: str):
+    """
+    Parser une date ISO 8601 (suffixe "Z" accepté) en date
+
+    Mis en cache : les offres d'un batch partagent peu de dates distinctes
+    et chaque date est demandée plusieurs fois (dates groupées puis offre).
+
+    Returns:
+        date ou None si la chaîne est vide ou invalide
+    """
+    if not iso_date:
+        return None
+    try:
+        if iso_date.endswith("Z"):
+            iso_date = iso_date[:-1] + "+00:00"
+        return datetime.fromisoformat(iso_date).date()
+    except ValueError:
+        return None
+
+
+# Mapping titre → catégorie (par ordre de priorité)
+TITLE_CATEGORY_RULES = [
+    (('Data Analyst', 'WTTJ_DA'), ['data analyst', 'analyste de données', 'analyste data', 'business analyst data']),
+    (('Data Scientist', 'WTTJ_DS'), ['data scientist', 'scientist']),
+    (('Data Engineer', 'WTTJ_DE'), ['data engineer', 'ingénieur data', 'ingénieur de données']),
+    (('Tech Lead Data', 'WTTJ_TL'), ['tech lead', 'lead data', 'lead dev']),
+    (('Consultant Data / BI', 'WTTJ_CD'), ['consultant data', 'consultant bi', 'consultant analytics', 'consultant amoa']),
+    (('Stage / Alternance Data', 'WTTJ_ST'), ['stage', 'stagiaire', 'intern', 'alternance']),
+    (('Business Intelligence', 'WTTJ_BI'), ['business intelligence', 'bi engineer', 'bi analyst']),
+]
+
+# Mot-clé → priorité (index de la règle), un mot-clé garde sa première règle
+_TITLE_KEYWORD_PRIORITY = {}
+for _priority, (_, _keywords) in enumerate(TITLE_CATEGORY_RULES):
+    for _kw in _keywords:
+        _TITLE_KEYWORD_PRIORITY.setdefault(_kw, _priority)
+
+if AHOCORASICK_AVAILABLE:
+    _TITLE_AUTOMATON = ahocorasick.Automaton()
+    for _kw, _priority in _TITLE_KEYWORD_PRIORITY.items():
+        _TITLE_AUTOMATON.add_word(_kw, _priority)
+    _TITLE_AUTOMATON.make_automaton()
+
+# Fallback sans pyahocorasick : alternance dans un lookahead pour trouver
+# aussi les mots-clés qui se chevauchent (ex: "lead data engineer")
+_TITLE_PATTERN = re.compile(
+    "(?=(" + "|".join(
+        re.escape(kw) for kw in sorted(_TITLE_KEYWORD_PRIORITY, key=_TITLE_KEYWORD_PRIORITY.get)
+    ) + "))"
+)
+
 
 class DBInserter:
     """Inserteur d'offres dans PostgreSQL"""
@@ -70,92 +145,159 @@ class DBInserter:
         "31": "Haute-Garonne", "33": "Gironde",
     }
     
+    # Table (nom du département, région) indexée par int(code département)
+    _DEPT_TABLE = [("Non spécifié", "Non spécifié")] * 100
+    for _code in set(DEPT_TO_REGION) | set(DEPT_NAMES):
+        _DEPT_TABLE[int(_code)] = (
+            DEPT_NAMES.get(_code, "Non spécifié"),
+            DEPT_TO_REGION.get(_code, "Non spécifié"),
+        )
+    del _code
+    
+    # Taille max du cache LRU des localisations
+    LOCATION_CACHE_SIZE = 5000
+    
+    # Requêtes des dimensions (construites une seule fois, réutilisées à chaque appel)
+    SELECT_SOURCES_SQL = text("SELECT source_name, source_id FROM dim_sources")
+    SELECT_DATES_SQL = text("SELECT full_date, date_id FROM dim_dates")
+    # MIN() : robustesse si la contrainte unique sur category_code est absente
+    SELECT_CATEGORIES_SQL = text("""
+        SELECT category_code, MIN(job_category_id)
+        FROM dim_job_categories
+        WHERE category_code IS NOT NULL
+        GROUP BY category_code
+    """)
+    UPSERT_SOURCE_SQL = text("""
+        INSERT INTO dim_sources (source_name, source_type, is_official, description)
+        VALUES (:name, :type, :official, :desc)
+        ON CONFLICT (source_name) DO UPDATE SET source_name = EXCLUDED.source_name
+        RETURNING source_id
+    """)
+    # Attributs de la date calculés par PostgreSQL (colonnes générées)
+    UPSERT_DATE_SQL = text("""
+        INSERT INTO dim_dates (full_date)
+        VALUES (:d)
+        ON CONFLICT (full_date) DO UPDATE SET full_date = EXCLUDED.full_date
+        RETURNING date_id
+    """)
+    SELECT_LOCATION_PARTIAL_SQL = text("""
+        SELECT location_id FROM dim_locations
+        WHERE (city = :city OR :city = '') 
+          AND (department_code = :dept OR :dept = '')
+        LIMIT 1
+    """)
+    UPSERT_LOCATION_SQL = text("""
+        INSERT INTO dim_locations
+        (city, postal_code, department, department_code, region, latitude, longitude)
+        VALUES (:city, :pc, :dept_name, :dept_code, :region, :lat, :lon)
+        ON CONFLICT (city, department_code) DO UPDATE SET city = EXCLUDED.city
+        RETURNING location_id
+    """)
+    UPSERT_CATEGORY_SQL = text("""
+        INSERT INTO dim_job_categories (category_name, category_code, level)
+        VALUES (:name, :code, 1)
+        ON CONFLICT (category_name) DO UPDATE SET category_name = EXCLUDED.category_name
+        RETURNING job_category_id
+    """)
+    SELECT_EXISTING_IDS_SQL = text(
+        "SELECT external_id FROM fact_job_offers WHERE external_id = ANY(:ids)"
+    )
+    
     def __init__(self):
         """Initialiser la connexion PostgreSQL"""
         database_url = os.getenv("DATABASE_URL")
         if not database_url:
             raise ValueError("❌ DATABASE_URL requis dans .env")
         
-        self.engine = create_engine(database_url)
-        Session = sessionmaker(bind=self.engine)
+        # executemany psycopg2 regroupé (execute_values / execute_batch)
+        self.engine = create_engine(
+            database_url,
+            executemany_mode="values_plus_batch",
+            insertmanyvalues_page_size=self.BATCH_SIZE,
+            executemany_batch_page_size=500,
+            pool_size=10,
+            pool_pre_ping=True,
+        )
+        # Requêtes Core uniquement : rien à expirer après commit
+        Session = sessionmaker(bind=self.engine, expire_on_commit=False)
         self.session = Session()
         
         logger.info("✅ Connexion PostgreSQL établie")
+        
+        # Caches des dimensions (évite un SELECT par offre)
+        self._source_cache: Dict[str, int] = {}
+        self._date_cache: Dict = {}
+        self._category_cache: Dict[str, int] = {}
+        self._location_cache: OrderedDict = OrderedDict()  # LRU (city, dept_code)
+        self._known_external_ids: set = set()  # external_id déjà en base
+        self._load_dimension_caches()
+    
+    def _rollback(self):
+        """Annuler la transaction et resynchroniser les caches (ids non commités)"""
+        self.session.rollback()
+        self._location_cache.clear()
+        self._load_dimension_caches()
+    
+    def _load_dimension_caches(self):
+        """Précharger les petites dimensions en mémoire"""
+        self._source_cache = dict(self.session.execute(self.SELECT_SOURCES_SQL).fetchall())
+        self._date_cache = dict(self.session.execute(self.SELECT_DATES_SQL).fetchall())
+        self._category_cache = dict(self.session.execute(self.SELECT_CATEGORIES_SQL).fetchall())
+        
+        logger.info(
+            f"📦 Caches chargés: {len(self._source_cache)} sources, "
+            f"{len(self._date_cache)} dates, {len(self._category_cache)} catégories"
+        )
     
     def get_or_create_source(self, source_name: str) -> int:
         """Récupère ou crée une source"""
-        q = text("SELECT source_id FROM dim_sources WHERE source_name=:name")
-        r = self.session.execute(q, {"name": source_name}).fetchone()
-        
-        if r:
-            return r[0]
+        source_id = self._source_cache.get(source_name)
+        if source_id is not None:
+            return source_id
         
         # Créer la source
         source_type = "api" if source_name == "france_travail" else "scraping"
         is_official = source_name == "france_travail"
         
-        q = text("""
-            INSERT INTO dim_sources (source_name, source_type, is_official, description)
-            VALUES (:name, :type, :official, :desc)
-            RETURNING source_id
-        """)
-        
-        r = self.session.execute(q, {
-            "name": source_name,
-            "type": source_type,
-            "official": is_official,
-            "desc": f"Source {source_name}"
-        })
-        self.session.commit()
+        with self.session.begin_nested():
+            r = self.session.execute(self.UPSERT_SOURCE_SQL, {
+                "name": source_name,
+                "type": source_type,
+                "official": is_official,
+                "desc": f"Source {source_name}"
+            }).fetchone()
         
-        return r.fetchone()[0]
+        self._source_cache[source_name] = r[0]
+        return r[0]
     
-    def get_or_create_date(self, iso_date: str) -> int:
-        """Récupère ou crée une date"""
-        if not iso_date:
-            return None
-        
-        try:
-            d = datetime.fromisoformat(iso_date.replace("Z", "+00:00")).date()
-        except:
+    def get_or_create_date(self, d: date) -> int:
+        """Récupère ou crée une date (déjà parsée, cf. _parse_iso)"""
+        if d is None:
             return None
         
         # Chercher date existante
-        q = text("SELECT date_id FROM dim_dates WHERE full_date=:d")
-        r = self.session.execute(q, {"d": d}).fetchone()
-        
-        if r:
-            return r[0]
+        date_id = self._date_cache.get(d)
+        if date_id is not None:
+            return date_id
         
         # Créer nouvelle date
-        month_names = ['', 'Janvier', 'Février', 'Mars', 'Avril', 'Mai', 'Juin',
-                       'Juillet', 'Août', 'Septembre', 'Octobre', 'Novembre', 'Décembre']
-        day_names = ['Lundi', 'Mardi', 'Mercredi', 'Jeudi', 'Vendredi', 'Samedi', 'Dimanche']
-        
-        q = text("""
-            INSERT INTO dim_dates
-            (full_date, year, quarter, month, month_name, week, day_of_week, day_name, is_weekend)
-            VALUES (:d, :y, :q, :m, :mn, :w, :dw, :dn, :we)
-            RETURNING date_id
-        """)
-        
-        r = self.session.execute(q, {
-            "d": d,
-            "y": d.year,
-            "q": (d.month - 1) // 3 + 1,
-            "m": d.month,
-            "mn": month_names[d.month],
-            "w": d.isocalendar()[1],
-            "dw": d.weekday() + 1,
-            "dn": day_names[d.weekday()],
-            "we": d.weekday() >= 5
-        })
-        self.session.commit()
+        with self.session.begin_nested():
+            r = self.session.execute(self.UPSERT_DATE_SQL, {"d": d}).fetchone()
         
-        return r.fetchone()[0]
+        self._date_cache[d] = r[0]
+        return r[0]
     
-    def get_or_create_location(self, offer: Dict) -> int:
-        """Récupère ou crée une localisation"""
+    def _dept_info(self, dept_code: str) -> tuple:
+        """Retourne (nom du département, région) pour un code département"""
+        try:
+            if dept_code.isdigit():
+                return self._DEPT_TABLE[int(dept_code)]
+        except IndexError:
+            pass
+        return "Non spécifié", "Non spécifié"
+    
+    def _location_key(self, offer: Dict) -> tuple:
+        """Extraire (ville, code postal, code département) d'une offre"""
         city = offer.get("location_city", "").strip()
         postal_code = offer.get("location_postal_code", "")
         
@@ -168,81 +310,181 @@ class DBInserter:
         elif postal_code and len(postal_code) >= 2:
             dept_code = postal_code[:2]
         
-        if not city and not dept_code:
-            return None
+        return city, postal_code, dept_code
+    
+    def resolve_locations_bulk(self, offers: List[Dict]):
+        """
+        Résoudre en bloc les localisations (ville + département connus)
         
-        # Chercher location existante
-        q = text("""
-            SELECT location_id FROM dim_locations
-            WHERE (city = :city OR :city = '') 
-              AND (department_code = :dept OR :dept = '')
-            LIMIT 1
-        """)
-        r = self.session.execute(q, {
-            "city": city if city else "",
-            "dept": dept_code if dept_code else ""
-        }).fetchone()
-        
-        if r:
-            return r[0]
-        
-        # Créer nouvelle location
-        region = self.DEPT_TO_REGION.get(dept_code, "Non spécifié")
-        dept_name = self.DEPT_NAMES.get(dept_code, "Non spécifié")
-        
-        q = text("""
-            INSERT INTO dim_locations
-            (city, postal_code, department, department_code, region, latitude, longitude)
-            VALUES (:city, :pc, :dept_name, :dept_code, :region, :lat, :lon)
-            RETURNING location_id
-        """)
-        
-        r = self.session.execute(q, {
-            "city": city or "Non spécifié",
-            "pc": postal_code,
-            "dept_name": dept_name,
-            "dept_code": dept_code,
-            "region": region,
-            "lat": offer.get("location_lat"),
-            "lon": offer.get("location_lon")
-        })
-        self.session.commit()
+        Un seul INSERT multi-lignes ON CONFLICT DO UPDATE RETURNING crée les
+        manquantes et renvoie les existantes ; tout part dans le cache,
+        get_or_create_location n'a plus de requête à faire.
+        Les clés partielles (ville ou département vide) restent résolues
+        ligne par ligne.
         
-        return r.fetchone()[0]
+        Args:
+            offers: Offres normalisées
+        """
+        pending = {}
+        for offer in offers:
+            city, postal_code, dept_code = self._location_key(offer)
+            key = (city, dept_code)
+            if city and dept_code and key not in self._location_cache and key not in pending:
+                pending[key] = (offer, postal_code)
+        
+        if not pending:
+            return
+        
+        rows = []
+        for (city, dept_code), (offer, postal_code) in pending.items():
+            dept_name, region = self._dept_info(dept_code)
+            rows.append((
+                city, postal_code, dept_name, dept_code, region,
+                offer.get("location_lat"), offer.get("location_lon"),
+            ))
+        
+        # Existantes et nouvelles en un seul UPSERT (l'UPDATE neutre renvoie l'id existant)
+        cursor = self.session.connection().connection.cursor()
+        try:
+            resolved = execute_values(
+                cursor,
+                """
+                INSERT INTO dim_locations
+                (city, postal_code, department, department_code, region, latitude, longitude)
+                VALUES %s
+                ON CONFLICT (city, department_code) DO UPDATE SET city = EXCLUDED.city
+                RETURNING city, department_code, location_id
+                """,
+                rows,
+                page_size=len(rows),
+                fetch=True,
+            )
+            for city, dept_code, location_id in resolved:
+                self._cache_location((city, dept_code), location_id)
+            
+            logger.info(f"📍 {len(resolved)} localisation(s) résolue(s)")
+        finally:
+            cursor.close()
     
-    def get_job_category_from_title(self, title: str) -> tuple:
+    def resolve_dates_bulk(self, offers: List[Dict]):
         """
-        Déterminer la catégorie depuis le titre (pour sources sans ROME)
+        Créer en bloc les dates de publication manquantes dans dim_dates
         
-        Returns:
-            (category_name, category_code)
+        Les dates sont parsées en une passe vectorisée pandas puis insérées en
+        un INSERT multi-lignes ; les attributs (année, trimestre, semaine ISO,
+        ...) sont des colonnes générées par PostgreSQL.
+        
+        Args:
+            offers: Offres normalisées
         """
-        title_lower = title.lower()
+        raw = pd.Series([o.get("published_date") or "" for o in offers], dtype="object")
         
-        # Mapping titre → catégorie
-        if any(kw in title_lower for kw in ['data analyst', 'analyste de données', 'analyste data', 'business analyst data']):
-            return ('Data Analyst', 'WTTJ_DA')
+        # Partie date de la chaîne ISO (= .date() de fromisoformat, fuseau conservé)
+        dates = pd.to_datetime(raw.str[:10], format="%Y-%m-%d", errors="coerce")
+        rows = [
+            (d,) for d in {ts.date() for ts in dates.dropna()}
+            if d not in self._date_cache
+        ]
         
-        elif any(kw in title_lower for kw in ['data scientist', 'scientist']):
-            return ('Data Scientist', 'WTTJ_DS')
+        if not rows:
+            return
         
-        elif any(kw in title_lower for kw in ['data engineer', 'ingénieur data', 'ingénieur de données']):
-            return ('Data Engineer', 'WTTJ_DE')
+        cursor = self.session.connection().connection.cursor()
+        try:
+            created = execute_values(
+                cursor,
+                """
+                INSERT INTO dim_dates (full_date)
+                VALUES %s
+                ON CONFLICT (full_date) DO UPDATE SET full_date = EXCLUDED.full_date
+                RETURNING full_date, date_id
+                """,
+                rows,
+                page_size=len(rows),
+                fetch=True,
+            )
+            self._date_cache.update(created)
+            
+            logger.info(f"📅 {len(created)} date(s) résolue(s)")
+        finally:
+            cursor.close()
+    
+    def get_or_create_location(self, offer: Dict) -> int:
+        """Récupère ou crée une localisation"""
+        city, postal_code, dept_code = self._location_key(offer)
         
-        elif any(kw in title_lower for kw in ['tech lead', 'lead data', 'lead dev']):
-            return ('Tech Lead Data', 'WTTJ_TL')
+        if not city and not dept_code:
+            return None
         
-        elif any(kw in title_lower for kw in ['consultant data', 'consultant bi', 'consultant analytics', 'consultant amoa']):
-            return ('Consultant Data / BI', 'WTTJ_CD')
+        # Cache LRU
+        cache_key = (city, dept_code)
+        location_id = self._location_cache.get(cache_key)
+        if location_id is not None:
+            self._location_cache.move_to_end(cache_key)
+            return location_id
+        
+        # Ville ou département inconnu : recherche souple sur l'autre critère
+        if not city or not dept_code:
+            r = self.session.execute(self.SELECT_LOCATION_PARTIAL_SQL, {
+                "city": city if city else "",
+                "dept": dept_code if dept_code else ""
+            }).fetchone()
+            
+            if r:
+                self._cache_location(cache_key, r[0])
+                return r[0]
         
-        elif any(kw in title_lower for kw in ['stage', 'stagiaire', 'intern', 'alternance']):
-            return ('Stage / Alternance Data', 'WTTJ_ST')
+        # Créer la location (ou récupérer l'existante) en un aller-retour
+        dept_name, region = self._dept_info(dept_code)
+        
+        with self.session.begin_nested():
+            r = self.session.execute(self.UPSERT_LOCATION_SQL, {
+                "city": city or "Non spécifié",
+                "pc": postal_code,
+                "dept_name": dept_name,
+                "dept_code": dept_code,
+                "region": region,
+                "lat": offer.get("location_lat"),
+                "lon": offer.get("location_lon")
+            })
+            location_id = r.fetchone()[0]
         
-        elif any(kw in title_lower for kw in ['business intelligence', 'bi engineer', 'bi analyst']):
-            return ('Business Intelligence', 'WTTJ_BI')
+        self._cache_location(cache_key, location_id)
+        return location_id
+    
+    def _cache_location(self, key: tuple, location_id: int):
+        """Ajouter une localisation au cache LRU (éviction de la plus ancienne)"""
+        self._location_cache[key] = location_id
+        self._location_cache.move_to_end(key)
+        if len(self._location_cache) > self.LOCATION_CACHE_SIZE:
+            self._location_cache.popitem(last=False)
+    
+    def get_job_category_from_title(self, title: str) -> tuple:
+        """
+        Déterminer la catégorie depuis le titre (pour sources sans ROME)
         
+        Tous les mots-clés sont cherchés en une seule passe ; la catégorie
+        retenue est la première de TITLE_CATEGORY_RULES qui matche.
+        
+        Returns:
+            (category_name, category_code)
+        """
+        title_lower = title.lower()
+        
+        best = None
+        if AHOCORASICK_AVAILABLE:
+            for _, priority in _TITLE_AUTOMATON.iter(title_lower):
+                if best is None or priority < best:
+                    best = priority
         else:
+            for match in _TITLE_PATTERN.finditer(title_lower):
+                priority = _TITLE_KEYWORD_PRIORITY[match.group(1)]
+                if best is None or priority < best:
+                    best = priority
+        
+        if best is None:
             return ('Autre métier Data', 'WTTJ_OTHER')
+        return TITLE_CATEGORY_RULES[best][0]
     
     def get_or_create_job_category(self, offer: Dict) -> int:
         """Récupère ou crée une catégorie de poste"""
@@ -259,25 +501,20 @@ class DBInserter:
         
         # Chercher par code si disponible
         if code:
-            q = text("SELECT job_category_id FROM dim_job_categories WHERE category_code=:code")
-            r = self.session.execute(q, {"code": code}).fetchone()
-            if r:
-                return r[0]
+            category_id = self._category_cache.get(code)
+            if category_id is not None:
+                return category_id
         
         # Créer nouvelle catégorie
-        q = text("""
-            INSERT INTO dim_job_categories (category_name, category_code, level)
-            VALUES (:name, :code, 1)
-            RETURNING job_category_id
-        """)
-        
-        r = self.session.execute(q, {
-            "name": name or "Non spécifié",
-            "code": code
-        })
-        self.session.commit()
+        with self.session.begin_nested():
+            r = self.session.execute(self.UPSERT_CATEGORY_SQL, {
+                "name": name or "Non spécifié",
+                "code": code
+            }).fetchone()
         
-        return r.fetchone()[0]
+        if code:
+            self._category_cache[code] = r[0]
+        return r[0]
     
     def clean_description(self, description: str) -> str:
         """
@@ -296,8 +533,7 @@ class DBInserter:
         description = description.replace('¶', '\n')
         
         # Supprimer les sauts de ligne multiples
-        import re
-        description = re.sub(r'\n{3,}', '\n\n', description)
+        description = _RE_MULTINL.sub('\n\n', description)
         
         # Supprimer les espaces en début/fin
         description = description.strip()
@@ -319,20 +555,18 @@ class DBInserter:
         if not description:
             return ""
         
-        import re
-        
         # Pattern 1: "XXK à YYK" ou "XXK - YYK"
-        match = re.search(r'(\d+K?\s*[€]?\s*[àa-]\s*\d+K?\s*[€]?)', description, re.IGNORECASE)
+        match = _RE_SAL_RANGE.search(description)
         if match:
             return match.group(1)
         
         # Pattern 2: "Salaire : XXX€"
-        match = re.search(r'[Ss]alaire\s*:?\s*(\d+\s*K?\s*[€]?\s*[àa-]?\s*\d*\s*K?\s*[€]?)', description)
+        match = _RE_SAL_LABEL.search(description)
         if match:
             return match.group(1)
         
         # Pattern 3: "Entre XXK et YYK"
-        match = re.search(r'[Ee]ntre\s*(\d+K?\s*et\s*\d+K?)', description)
+        match = _RE_SAL_ENTRE.search(description)
         if match:
             return match.group(1)
         
@@ -353,13 +587,11 @@ class DBInserter:
         if not salary_text:
             return None, None
         
-        import re
-        
         # Détecter format "K" (milliers)
-        has_k = bool(re.search(r'\d+\s*K', salary_text, re.IGNORECASE))
+        has_k = bool(_RE_HAS_K.search(salary_text))
         
         # Capturer nombres
-        numbers = re.findall(r'(\d+(?:\.\d+)?)', salary_text)
+        numbers = _RE_NUMS.findall(salary_text)
         
         # Filtrage intelligent
         if has_k:
@@ -382,6 +614,185 @@ class DBInserter:
         
         return salary_min, salary_max
     
+    # Requête d'insertion d'une ligne de fait (exécutée en executemany par chunks)
+    INSERT_OFFER_SQL = text("""
+        INSERT INTO fact_job_offers (
+            source_id, date_id, location_id, job_category_id,
+            external_id, title, description, url, company_name,
+            contract_type, salary_min, salary_max,
+            published_date, collected_date
+        ) VALUES (
+            :source, :date, :loc, :cat,
+            :eid, :title, :desc, :url, :company,
+            :contract, :sal_min, :sal_max,
+            :pub, NOW()
+        )
+        ON CONFLICT (external_id) DO NOTHING
+    """)
+    
+    # Taille des chunks d'insertion (PostgreSQL plafonne au-delà de ~1000 lignes)
+    BATCH_SIZE = 1000
+    
+    # Variante multi-lignes pour psycopg2 execute_values (RETURNING = offres insérées)
+    INSERT_OFFER_VALUES_SQL = """
+        INSERT INTO fact_job_offers (
+            source_id, date_id, location_id, job_category_id,
+            external_id, title, description, url, company_name,
+            contract_type, salary_min, salary_max,
+            published_date, collected_date
+        ) VALUES %s
+        ON CONFLICT (external_id) DO NOTHING
+        RETURNING external_id
+    """
+    INSERT_OFFER_VALUES_TEMPLATE = (
+        "(%(source)s, %(date)s, %(loc)s, %(cat)s, %(eid)s, %(title)s, %(desc)s, %(url)s, "
+        "%(company)s, %(contract)s, %(sal_min)s, %(sal_max)s, %(pub)s, NOW())"
+    )
+    
+    # Au-delà de ce nombre d'offres, chargement via COPY (plus rapide que INSERT)
+    COPY_THRESHOLD = 200
+    
+    # Colonnes chargées par COPY, dans l'ordre des clés de prepare_offer_row
+    COPY_COLUMNS = (
+        ("source", "source_id"), ("date", "date_id"), ("loc", "location_id"),
+        ("cat", "job_category_id"), ("eid", "external_id"), ("title", "title"),
+        ("desc", "description"), ("url", "url"), ("company", "company_name"),
+        ("contract", "contract_type"), ("sal_min", "salary_min"),
+        ("sal_max", "salary_max"), ("pub", "published_date"),
+    )
+    
+    def prepare_offer_row(self, offer: Dict) -> Dict:
+        """
+        Résoudre les dimensions et préparer les paramètres d'insertion d'une offre
+        
+        Args:
+            offer: Offre normalisée
+        
+        Returns:
+            Paramètres pour INSERT_OFFER_SQL
+        """
+        # Date de publication (parsée une seule fois)
+        pub_date = _parse_iso(offer.get("published_date"))
+        
+        # Résoudre les dimensions
+        source_id = self.get_or_create_source(offer["source"])
+        date_id = self.get_or_create_date(pub_date)
+        location_id = self.get_or_create_location(offer)
+        category_id = self.get_or_create_job_category(offer)
+        
+        # Parser le salaire
+        salary_text_to_parse = offer.get("salary_text", "")
+        
+        # Si salary_text vide, essayer d'extraire depuis description (WTTJ)
+        if not salary_text_to_parse:
+            salary_text_to_parse = self.extract_salary_from_description(offer.get("description", ""))
+        
+        salary_min, salary_max = self.parse_salary(salary_text_to_parse)
+        
+        return {
+            "source": source_id,
+            "date": date_id,
+            "loc": location_id,
+            "cat": category_id,
+            "eid": offer["external_id"],
+            "title": offer["title"],
+            "desc": self.clean_description(offer["description"]),
+            "url": offer.get("url"),  # ← URL ajoutée ici
+            "company": offer.get("company_name"),
+            "contract": offer.get("contract_type"),
+            "sal_min": salary_min,
+            "sal_max": salary_max,
+            "pub": pub_date
+        }
+    
+    def get_existing_external_ids(self, external_ids: List[str]) -> set:
+        """
+        Récupérer en une requête les external_id déjà présents en base
+        
+        Args:
+            external_ids: Identifiants à vérifier
+        
+        Returns:
+            Ensemble des external_id existants
+        """
+        if not external_ids:
+            return set()
+        
+        rows = self.session.execute(self.SELECT_EXISTING_IDS_SQL, {"ids": list(external_ids)})
+        return {r[0] for r in rows}
+    
+    def insert_rows_values(self, rows: List[Dict]) -> int:
+        """
+        Insérer des offres préparées en un seul INSERT multi-lignes (execute_values)
+        
+        Le commit est laissé à l'appelant.
+        
+        Args:
+            rows: Paramètres issus de prepare_offer_row
+        
+        Returns:
+            Nombre d'offres réellement insérées
+        """
+        cursor = self.session.connection().connection.cursor()
+        try:
+            returned = execute_values(
+                cursor,
+                self.INSERT_OFFER_VALUES_SQL,
+                rows,
+                template=self.INSERT_OFFER_VALUES_TEMPLATE,
+                page_size=len(rows),
+                fetch=True,
+            )
+            return len(returned)
+        finally:
+            cursor.close()
+    
+    def copy_insert_offers(self, rows: List[Dict]) -> int:
+        """
+        Charger des offres préparées via COPY FROM STDIN
+        
+        Les lignes sont copiées dans une table temporaire puis insérées avec
+        ON CONFLICT DO NOTHING (dédoublonnage sur external_id).
+        Le commit est laissé à l'appelant.
+        
+        Args:
+            rows: Paramètres issus de prepare_offer_row
+        
+        Returns:
+            Nombre d'offres réellement insérées
+        """
+        columns = ", ".join(col for _, col in self.COPY_COLUMNS)
+        
+        # CSV en mémoire (\N = NULL, pour distinguer NULL de la chaîne vide)
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        for row in rows:
+            writer.writerow([
+                "\\N" if row[key] is None else row[key]
+                for key, _ in self.COPY_COLUMNS
+            ])
+        buf.seek(0)
+        
+        # Même connexion/transaction que la session
+        cursor = self.session.connection().connection.cursor()
+        try:
+            cursor.execute(f"""
+                CREATE TEMP TABLE tmp_job_offers ON COMMIT DROP AS
+                SELECT {columns} FROM fact_job_offers WITH NO DATA
+            """)
+            cursor.copy_expert(
+                f"COPY tmp_job_offers ({columns}) FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+                buf
+            )
+            cursor.execute(f"""
+                INSERT INTO fact_job_offers ({columns}, collected_date)
+                SELECT {columns}, NOW() FROM tmp_job_offers
+                ON CONFLICT (external_id) DO NOTHING
+            """)
+            return cursor.rowcount
+        finally:
+            cursor.close()
+    
     def insert_offer(self, offer: Dict) -> bool:
         """
         Insérer une offre dans la base de données
@@ -393,78 +804,28 @@ class DBInserter:
             True si insertion réussie, False sinon
         """
         try:
-            # Vérifier doublon
-            q = text("SELECT offer_id FROM fact_job_offers WHERE external_id=:eid")
-            if self.session.execute(q, {"eid": offer["external_id"]}).fetchone():
+            # Doublon déjà connu (préchargé par insert_batch) : aucune requête
+            if offer["external_id"] in self._known_external_ids:
                 logger.debug(f"  ⏭️ Doublon: {offer['external_id']}")
                 return False
             
-            # Résoudre les dimensions
-            source_id = self.get_or_create_source(offer["source"])
-            date_id = self.get_or_create_date(offer.get("published_date"))
-            location_id = self.get_or_create_location(offer)
-            category_id = self.get_or_create_job_category(offer)
-            
-            # Parser le salaire
-            salary_text_to_parse = offer.get("salary_text", "")
-            
-            # Si salary_text vide, essayer d'extraire depuis description (WTTJ)
-            if not salary_text_to_parse:
-                salary_text_to_parse = self.extract_salary_from_description(offer.get("description", ""))
-            
-            salary_min, salary_max = self.parse_salary(salary_text_to_parse)
-            
-            # Date de publication
-            pub_date = None
-            if offer.get("published_date"):
-                try:
-                    pub_date = datetime.fromisoformat(
-                        offer["published_date"].replace("Z", "+00:00")
-                    ).date()
-                except:
-                    pass
-            
-            # Insertion
-            q = text("""
-                INSERT INTO fact_job_offers (
-                    source_id, date_id, location_id, job_category_id,
-                    external_id, title, description, url, company_name,
-                    contract_type, salary_min, salary_max,
-                    published_date, collected_date
-                ) VALUES (
-                    :source, :date, :loc, :cat,
-                    :eid, :title, :desc, :url, :company,
-                    :contract, :sal_min, :sal_max,
-                    :pub, NOW()
-                )
-            """)
-            
-            self.session.execute(q, {
-                "source": source_id,
-                "date": date_id,
-                "loc": location_id,
-                "cat": category_id,
-                "eid": offer["external_id"],
-                "title": offer["title"],
-                "desc": self.clean_description(offer["description"]),
-                "url": offer.get("url"),  # ← URL ajoutée ici
-                "company": offer.get("company_name"),
-                "contract": offer.get("contract_type"),
-                "sal_min": salary_min,
-                "sal_max": salary_max,
-                "pub": pub_date
-            })
+            # Insertion (ON CONFLICT : un doublon inconnu donne rowcount = 0)
+            result = self.session.execute(self.INSERT_OFFER_SQL, self.prepare_offer_row(offer))
             
             self.session.commit()
+            self._known_external_ids.add(offer["external_id"])
+            if result.rowcount == 0:
+                logger.debug(f"  ⏭️ Doublon: {offer['external_id']}")
+                return False
             logger.info(f"  ✅ {offer['title'][:50]}...")
             return True
         
         except IntegrityError:
-            self.session.rollback()
+            self._rollback()
             return False
         
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             logger.error(f"  ❌ Erreur: {e}")
             return False
     
@@ -472,6 +833,9 @@ class DBInserter:
         """
         Insérer un batch d'offres
         
+        Les doublons sont filtrés en une requête, puis les offres sont insérées
+        en INSERT multi-lignes par chunks de BATCH_SIZE (un commit par chunk).
+        
         Args:
             offers: Liste d'offres normalisées
         
@@ -486,16 +850,94 @@ class DBInserter:
         duplicates = 0
         errors = 0
         
-        for i, offer in enumerate(offers, 1):
-            if i % 10 == 0:
-                logger.info(f"\n⏳ Progression: {i}/{len(offers)}")
+        # 1. Doublons (base + intra-batch) en une seule requête
+        existing_ids = self.get_existing_external_ids(
+            [o["external_id"] for o in offers if o.get("external_id")]
+        )
+        self._known_external_ids.update(existing_ids)
+        seen_ids = set(existing_ids)
+        new_offers = []
+        for offer in offers:
+            eid = offer.get("external_id")
+            if eid in seen_ids:
+                duplicates += 1
+                continue
+            seen_ids.add(eid)
+            new_offers.append(offer)
+        
+        logger.info(f"⏭️ {duplicates} doublon(s) ignoré(s), {len(new_offers)} offre(s) à insérer")
+        
+        # 2. Résolution des dimensions et préparation des lignes
+        # Une seule transaction jusqu'au commit du premier chunk ; les savepoints
+        # isolent les échecs partiels sans tout annuler
+        try:
+            with self.session.begin_nested():
+                self.resolve_locations_bulk(new_offers)
+        except Exception as e:
+            logger.warning(f"⚠️ Résolution groupée des localisations échouée ({e})")
+        
+        try:
+            with self.session.begin_nested():
+                self.resolve_dates_bulk(new_offers)
+        except Exception as e:
+            logger.warning(f"⚠️ Résolution groupée des dates échouée ({e})")
+        
+        rows = []
+        for offer in new_offers:
+            try:
+                rows.append(self.prepare_offer_row(offer))
+            except Exception as e:
+                logger.error(f"  ❌ Erreur préparation {offer.get('external_id')}: {e}")
+                errors += 1
+        
+        # 3a. Gros volume : chargement COPY
+        if len(rows) > self.COPY_THRESHOLD:
+            try:
+                with self.session.begin_nested():
+                    copied = self.copy_insert_offers(rows)
+                self.session.commit()
+                inserted += copied
+                duplicates += len(rows) - copied
+                rows = []
+                logger.info(f"🚀 {copied} offre(s) chargée(s) via COPY")
+            except Exception as e:
+                logger.warning(f"⚠️ Échec du COPY ({e}), repli sur INSERT par chunks")
+        
+        # 3b. Insertion par chunks (un commit par chunk)
+        for start in range(0, len(rows), self.BATCH_SIZE):
+            chunk = rows[start:start + self.BATCH_SIZE]
             
-            result = self.insert_offer(offer)
+            try:
+                with self.session.begin_nested():
+                    chunk_inserted = self.insert_rows_values(chunk)
+                inserted += chunk_inserted
+                duplicates += len(chunk) - chunk_inserted
             
-            if result:
-                inserted += 1
-            else:
-                duplicates += 1
+            except Exception as e:
+                # Repli ligne par ligne (un savepoint par offre) pour isoler l'offre fautive
+                logger.warning(f"⚠️ Échec du chunk ({e}), repli ligne par ligne")
+                for row in chunk:
+                    try:
+                        with self.session.begin_nested():
+                            result = self.session.execute(self.INSERT_OFFER_SQL, row)
+                        if result.rowcount == 0:
+                            duplicates += 1
+                        else:
+                            inserted += 1
+                    except Exception as row_error:
+                        logger.error(f"  ❌ Erreur: {row_error}")
+                        errors += 1
+            
+            try:
+                self.session.commit()
+            except Exception as e:
+                self._rollback()
+                logger.error(f"  ❌ Échec du commit du chunk: {e}")
+            
+            logger.info(f"\n⏳ Progression: {min(start + self.BATCH_SIZE, len(rows))}/{len(rows)}")
+        
+        # Dimensions créées sans offre à insérer
+        self.session.commit()
         
         stats = {
             "total": len(offers),
@@ -16,17 +16,26 @@ Usage:
 """
 
 import os
+import re
 import logging
-from typing import Dict, List
-from datetime import datetime
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from html import unescape
+from typing import Dict, List, Optional
+from datetime import date, datetime
 from pathlib import Path
 
 from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.exc import IntegrityError
 from dotenv import load_dotenv
 
-from geo_matcher import GeoMatcher
+from geo_matcher import get_default_matcher
+
+# Parser HTML en C (optionnel) pour le nettoyage des descriptions
+try:
+    from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
 
 # Charger .env
 env_path = Path(__file__).parent.parent / '.env'
@@ -38,100 +47,247 @@ else:
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger("DBInserterV2")
 
+# Regex précompilées (appelées pour chaque offre)
+_RE_HTML_TAG = re.compile(r'<[^>]+>')
+_RE_WHITESPACE = re.compile(r'\s+')
+# "XXK - YYK", "XXK à YYK" ou "Entre XXK et YYK" en une seule passe
+_RE_SALARY = re.compile(r'(\d+K?\s*[-à]\s*\d+K?)|[Ee]ntre\s*(\d+K?\s*et\s*\d+K?)')
+# Un seul passage : (nombre, suffixe K éventuel)
+_RE_SALARY_AMOUNT = re.compile(r'(\d+(?:\.\d+)?)\s*(K)?', re.IGNORECASE)
+
+# Mapping titre → catégorie (par ordre de priorité) : (groupe, catégorie, mots-clés)
+TITLE_CATEGORY_RULES = [
+    ("DA", ('Data Analyst', 'WTTJ_DA'), ['data analyst', 'analyste de données', 'analyste data', 'business analyst data']),
+    ("DS", ('Data Scientist', 'WTTJ_DS'), ['data scientist', 'scientist']),
+    ("DE", ('Data Engineer', 'WTTJ_DE'), ['data engineer', 'ingénieur data', 'ingénieur données']),
+    ("ML", ('ML Engineer', 'WTTJ_ML'), ['machine learning', 'ml engineer', 'ai engineer']),
+    ("DEV", ('Développeur', 'DEV'), ['développeur', 'developer', 'dev ']),
+]
+_TITLE_CATEGORIES = {group: category for group, category, _ in TITLE_CATEGORY_RULES}
+_TITLE_PRIORITY = {group: i for i, (group, _, _) in enumerate(TITLE_CATEGORY_RULES)}
+
+# Une alternance à groupes nommés (m.lastgroup = catégorie) dans un lookahead :
+# un seul parcours du titre, mots-clés chevauchants compris
+_RE_TITLE_CATEGORY = re.compile(
+    "(?=" + "|".join(
+        f"(?P<{group}>" + "|".join(map(re.escape, keywords)) + ")"
+        for group, _, keywords in TITLE_CATEGORY_RULES
+    ) + ")"
+)
+
+
+@lru_cache(maxsize=1024)
+def _parse_iso(iso_date: str):
+    """
+    Parser une date ISO 8601 (suffixe "Z" accepté) en date
+
+    Mis en cache : les offres d'un batch partagent peu de dates distinctes
+    et chaque date est demandée plusieurs fois (dates groupées puis offre).
+
+    Returns:
+        date ou None si la chaîne est vide ou invalide
+    """
+    if not iso_date:
+        return None
+    try:
+        if iso_date.endswith("Z"):
+            iso_date = iso_date[:-1] + "+00:00"
+        return datetime.fromisoformat(iso_date).date()
+    except ValueError:
+        return None
+
 
 class DBInserterV2:
     """Inserteur d'offres dans PostgreSQL avec référentiel géographique"""
     
+    # Requêtes construites une seule fois (réutilisées à chaque offre)
+    SELECT_SOURCES_SQL = text("SELECT source_name, source_id FROM dim_sources")
+    SELECT_DATES_SQL = text("SELECT full_date, date_id FROM dim_dates")
+    # MIN() : une catégorie par code même sans contrainte unique
+    SELECT_CATEGORIES_SQL = text("""
+        SELECT category_code, MIN(job_category_id)
+        FROM dim_job_categories
+        WHERE category_code IS NOT NULL
+        GROUP BY category_code
+    """)
+    # Upserts : le DO UPDATE (sans effet) garantit que RETURNING renvoie l'id
+    # y compris si la ligne existe déjà (créée par un autre processus)
+    UPSERT_SOURCE_SQL = text("""
+        INSERT INTO dim_sources (source_name, source_type, is_official, description)
+        VALUES (:name, :type, :official, :desc)
+        ON CONFLICT (source_name) DO UPDATE SET source_name = EXCLUDED.source_name
+        RETURNING source_id
+    """)
+    # Attributs de la date calculés par PostgreSQL (colonnes générées)
+    UPSERT_DATE_SQL = text("""
+        INSERT INTO dim_dates (full_date)
+        VALUES (:d)
+        ON CONFLICT (full_date) DO UPDATE SET full_date = EXCLUDED.full_date
+        RETURNING date_id
+    """)
+    UPSERT_CATEGORY_SQL = text("""
+        INSERT INTO dim_job_categories (category_name, category_code, level)
+        VALUES (:name, :code, 1)
+        ON CONFLICT (category_name) DO UPDATE SET category_name = EXCLUDED.category_name
+        RETURNING job_category_id
+    """)
+    # Dates manquantes d'un batch insérées en un aller-retour (ids renvoyés)
+    UPSERT_DATES_SQL = text("""
+        INSERT INTO dim_dates (full_date)
+        SELECT unnest(CAST(:dates AS date[]))
+        ON CONFLICT (full_date) DO UPDATE SET full_date = EXCLUDED.full_date
+        RETURNING full_date, date_id
+    """)
+    SELECT_EXISTING_IDS_SQL = text(
+        "SELECT external_id FROM fact_job_offers WHERE external_id = ANY(:ids)"
+    )
+    
+    # Taille des chunks d'insertion multi-lignes
+    BATCH_SIZE = 500
+    
+    # Threads d'insertion des faits (une connexion du pool chacun)
+    INSERT_WORKERS = 4
+    
+    # Fréquence des logs de progression (en offres)
+    PROGRESS_EVERY = 100
+    
+    # Taille max du cache LRU des recherches de communes hors batch
+    COMMUNE_CACHE_SIZE = 50_000
+    
+    # INSERT des faits préparé côté serveur (une fois par connexion) : le texte
+    # de la requête ne dépend pas de la taille du chunk (tableaux + unnest),
+    # PostgreSQL réutilise le même plan et seuls les paramètres transitent
+    PREPARE_INSERT_OFFERS_SQL = """
+        PREPARE atlas_insert_offers (
+            int4[], int4[], int4[], int4[], text[], text[], text[],
+            text[], text[], text[], numeric[], numeric[], date[]
+        ) AS
+        INSERT INTO fact_job_offers (
+            source_id, date_id, commune_id, job_category_id,
+            external_id, title, description, url, company_name,
+            contract_type, salary_min, salary_max,
+            published_date, collected_date
+        )
+        SELECT s.*, NOW()
+        FROM unnest($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13) AS s
+        ON CONFLICT (external_id) DO NOTHING
+        RETURNING external_id
+    """
+    EXECUTE_INSERT_OFFERS_SQL = (
+        "EXECUTE atlas_insert_offers ("
+        "%s::int4[], %s::int4[], %s::int4[], %s::int4[], %s::text[], %s::text[], %s::text[], "
+        "%s::text[], %s::text[], %s::text[], %s::numeric[], %s::numeric[], %s::date[])"
+    )
+    PREPARED_INFO_KEY = "atlas_insert_offers_prepared"
+    # Clés de prepare_offer_row, dans l'ordre des paramètres de la requête préparée
+    OFFER_ROW_KEYS = (
+        "source", "date", "commune", "cat", "eid", "title", "desc",
+        "url", "company", "contract", "sal_min", "sal_max", "pub",
+    )
+    
     def __init__(self):
         """Initialiser la connexion PostgreSQL et le GeoMatcher"""
         database_url = os.getenv("DATABASE_URL")
         if not database_url:
             raise ValueError("❌ DATABASE_URL requis dans .env")
         
-        self.engine = create_engine(database_url)
-        Session = sessionmaker(bind=self.engine)
-        self.session = Session()
+        # Pool : la connexion principale + une par thread d'insertion des faits
+        self.engine = create_engine(
+            database_url, pool_size=self.INSERT_WORKERS + 1, max_overflow=0
+        )
+        # Connexion Core (requêtes text() uniquement : pas besoin de Session ORM)
+        self.conn = self.engine.connect()
         
-        # Initialiser le GeoMatcher
-        self.geo_matcher = GeoMatcher(database_url)
+        # GeoMatcher partagé (engine et index des communes créés une seule fois)
+        self.geo_matcher = get_default_matcher()
         
         # Compteurs pour stats
         self.communes_not_found = []
         
+        # Communes résolues en bloc pour le batch en cours ((ville, CP) -> commune_id)
+        self._commune_map = {}
+        
+        # Recherche unitaire mémoïsée par instance ((ville, CP) -> commune_id)
+        self._resolved_commune = lru_cache(maxsize=self.COMMUNE_CACHE_SIZE)(
+            self.geo_matcher.find_commune_id
+        )
+        
+        # Petites dimensions préchargées en mémoire (plus de SELECT par offre)
+        self._load_dimension_caches()
+        
         logger.info("✅ Connexion PostgreSQL établie")
         logger.info("✅ GeoMatcher initialisé")
     
+    def _load_dimension_caches(self):
+        """Précharger dim_sources, dim_dates et dim_job_categories"""
+        self._source_cache = dict(self.conn.execute(self.SELECT_SOURCES_SQL).fetchall())
+        self._date_cache = dict(self.conn.execute(self.SELECT_DATES_SQL).fetchall())
+        self._category_cache = dict(self.conn.execute(self.SELECT_CATEGORIES_SQL).fetchall())
+        
+        logger.info(
+            f"📦 Caches chargés: {len(self._source_cache)} sources, "
+            f"{len(self._date_cache)} dates, {len(self._category_cache)} catégories"
+        )
+    
+    def _rollback(self):
+        """Annuler la transaction et resynchroniser les caches (ids non commités)"""
+        self.conn.rollback()
+        self._load_dimension_caches()
+    
     def get_or_create_source(self, source_name: str) -> int:
         """Récupère ou crée une source"""
-        q = text("SELECT source_id FROM dim_sources WHERE source_name=:name")
-        r = self.session.execute(q, {"name": source_name}).fetchone()
-        
-        if r:
-            return r[0]
+        source_id = self._source_cache.get(source_name)
+        if source_id is not None:
+            return source_id
         
-        # Créer la source
+        # Créer la source (ou récupérer celle créée entre-temps)
         source_type = "api" if source_name == "france_travail" else "scraping"
         is_official = source_name == "france_travail"
         
-        q = text("""
-            INSERT INTO dim_sources (source_name, source_type, is_official, description)
-            VALUES (:name, :type, :official, :desc)
-            RETURNING source_id
-        """)
-        
-        r = self.session.execute(q, {
+        r = self.conn.execute(self.UPSERT_SOURCE_SQL, {
             "name": source_name,
             "type": source_type,
             "official": is_official,
             "desc": f"Source {source_name}"
         })
-        self.session.commit()
         
-        return r.fetchone()[0]
+        source_id = self._source_cache[source_name] = r.fetchone()[0]
+        return source_id
     
-    def get_or_create_date(self, iso_date: str) -> int:
-        """Récupère ou crée une date"""
-        if not iso_date:
-            return None
-        
-        try:
-            d = datetime.fromisoformat(iso_date.replace("Z", "+00:00")).date()
-        except:
+    def get_or_create_date(self, d: date) -> int:
+        """Récupère ou crée une date (déjà parsée, cf. _parse_iso)"""
+        if d is None:
             return None
         
         # Chercher date existante
-        q = text("SELECT date_id FROM dim_dates WHERE full_date=:d")
-        r = self.session.execute(q, {"d": d}).fetchone()
-        
-        if r:
-            return r[0]
+        date_id = self._date_cache.get(d)
+        if date_id is not None:
+            return date_id
         
         # Créer nouvelle date
-        month_names = ['', 'Janvier', 'Février', 'Mars', 'Avril', 'Mai', 'Juin',
-                       'Juillet', 'Août', 'Septembre', 'Octobre', 'Novembre', 'Décembre']
-        day_names = ['Lundi', 'Mardi', 'Mercredi', 'Jeudi', 'Vendredi', 'Samedi', 'Dimanche']
-        
-        q = text("""
-            INSERT INTO dim_dates
-            (full_date, year, quarter, month, month_name, week, day_of_week, day_name, is_weekend)
-            VALUES (:d, :y, :q, :m, :mn, :w, :dw, :dn, :we)
-            RETURNING date_id
-        """)
-        
-        r = self.session.execute(q, {
-            "d": d,
-            "y": d.year,
-            "q": (d.month - 1) // 3 + 1,
-            "m": d.month,
-            "mn": month_names[d.month],
-            "w": d.isocalendar()[1],
-            "dw": d.weekday() + 1,
-            "dn": day_names[d.weekday()],
-            "we": d.weekday() >= 5
-        })
-        self.session.commit()
+        r = self.conn.execute(self.UPSERT_DATE_SQL, {"d": d})
         
-        return r.fetchone()[0]
+        date_id = self._date_cache[d] = r.fetchone()[0]
+        return date_id
+    
+    def resolve_dates_bulk(self, dates) -> None:
+        """
+        Créer en une requête les dates manquantes dans dim_dates
+        
+        Les attributs (année, trimestre, ...) sont des colonnes générées :
+        seule full_date est envoyée. Les ids sont ajoutés au cache.
+        
+        Args:
+            dates: Dates de publication (déjà parsées, None ignorés)
+        """
+        missing = sorted({d for d in dates if d is not None and d not in self._date_cache})
+        if not missing:
+            return
+        
+        created = self.conn.execute(self.UPSERT_DATES_SQL, {"dates": missing}).fetchall()
+        self._date_cache.update(created)
+        
+        logger.info(f"📅 {len(created)} date(s) résolue(s)")
     
     def get_commune_id(self, offer: Dict) -> int:
         """
@@ -149,14 +305,24 @@ class DBInserterV2:
         if not city:
             return None
         
-        # Utiliser le GeoMatcher
-        commune_id = self.geo_matcher.find_commune_id(city, postal_code)
+        # Résolu en amont (pipeline_collect), en bloc par insert_batch,
+        # sinon recherche unitaire mémoïsée
+        key = (city, postal_code)
+        if "commune_id" in offer:
+            commune_id = offer["commune_id"]
+        elif key in self._commune_map:
+            commune_id = self._commune_map[key]
+        else:
+            # Casse ignorée par le matcher : "PARIS" et "Paris" partagent l'entrée
+            commune_id = self._resolved_commune(city.lower(), postal_code)
         
         # Logger si non trouvé
         if not commune_id:
             location_str = f"{city} ({postal_code})" if postal_code else city
             self.communes_not_found.append(location_str)
-            logger.warning(f"⚠️ Commune non trouvée: {location_str}")
+            # Détail par offre en DEBUG : la liste agrégée figure dans le résumé
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"⚠️ Commune non trouvée: {location_str}")
         
         return commune_id
     
@@ -167,26 +333,16 @@ class DBInserterV2:
         Returns:
             (category_name, category_code)
         """
-        title_lower = title.lower()
-        
-        # Mapping titre → catégorie
-        if any(kw in title_lower for kw in ['data analyst', 'analyste de données', 'analyste data', 'business analyst data']):
-            return ('Data Analyst', 'WTTJ_DA')
-        
-        elif any(kw in title_lower for kw in ['data scientist', 'scientist']):
-            return ('Data Scientist', 'WTTJ_DS')
-        
-        elif any(kw in title_lower for kw in ['data engineer', 'ingénieur data', 'ingénieur données']):
-            return ('Data Engineer', 'WTTJ_DE')
-        
-        elif any(kw in title_lower for kw in ['machine learning', 'ml engineer', 'ai engineer']):
-            return ('ML Engineer', 'WTTJ_ML')
-        
-        elif any(kw in title_lower for kw in ['développeur', 'developer', 'dev ']):
-            return ('Développeur', 'DEV')
-        
-        else:
+        # Catégorie la plus prioritaire parmi les mots-clés trouvés
+        best = min(
+            (m.lastgroup for m in _RE_TITLE_CATEGORY.finditer(title.lower())),
+            key=_TITLE_PRIORITY.__getitem__,
+            default=None,
+        )
+        
+        if best is None:
             return ('Autre', 'OTHER')
+        return _TITLE_CATEGORIES[best]
     
     def get_or_create_job_category(self, offer: Dict) -> int:
         """Récupère ou crée une catégorie d'emploi"""
@@ -202,67 +358,48 @@ class DBInserterV2:
             category_name, category_code = self.get_job_category_from_title(offer["title"])
         
         # Chercher catégorie existante
-        q = text("SELECT job_category_id FROM dim_job_categories WHERE category_code=:code")
-        r = self.session.execute(q, {"code": category_code}).fetchone()
-        
-        if r:
-            return r[0]
-        
-        # Créer nouvelle catégorie
-        q = text("""
-            INSERT INTO dim_job_categories (category_name, category_code, level)
-            VALUES (:name, :code, 1)
-            RETURNING job_category_id
-        """)
+        category_id = self._category_cache.get(category_code)
+        if category_id is not None:
+            return category_id
         
-        r = self.session.execute(q, {
+        # Créer nouvelle catégorie (libellé déjà présent : id existant)
+        r = self.conn.execute(self.UPSERT_CATEGORY_SQL, {
             "name": category_name,
             "code": category_code
         })
-        self.session.commit()
         
-        return r.fetchone()[0]
+        category_id = self._category_cache[category_code] = r.fetchone()[0]
+        return category_id
     
     def clean_description(self, description: str) -> str:
         """Nettoyer la description HTML"""
         if not description:
             return ""
         
-        import re
-        from html import unescape
-        
-        # Enlever les balises HTML
-        description = re.sub(r'<[^>]+>', ' ', description)
-        
-        # Décoder les entités HTML
-        description = unescape(description)
+        if SELECTOLAX_AVAILABLE:
+            # Texte extrait par le parseur (balises retirées, entités décodées)
+            description = HTMLParser(description).text(separator=' ')
+        else:
+            # Enlever les balises HTML
+            description = _RE_HTML_TAG.sub(' ', description)
+            
+            # Décoder les entités HTML
+            description = unescape(description)
         
         # Normaliser les espaces
-        description = re.sub(r'\s+', ' ', description)
+        description = _RE_WHITESPACE.sub(' ', description)
         
         return description.strip()
     
     def extract_salary_from_description(self, description: str) -> str:
         """Extraire le salaire depuis la description"""
-        import re
-        
         if not description:
             return ""
         
-        # Pattern 1: "XXK - YYK"
-        match = re.search(r'(\d+K?\s*-\s*\d+K?)', description)
-        if match:
-            return match.group(1)
-        
-        # Pattern 2: "XXK à YYK"
-        match = re.search(r'(\d+K?\s*à\s*\d+K?)', description)
-        if match:
-            return match.group(1)
-        
-        # Pattern 3: "Entre XXK et YYK"
-        match = re.search(r'[Ee]ntre\s*(\d+K?\s*et\s*\d+K?)', description)
+        # Première fourchette trouvée : "XXK - YYK", "XXK à YYK" ou "Entre XXK et YYK"
+        match = _RE_SALARY.search(description)
         if match:
-            return match.group(1)
+            return match.group(1) or match.group(2)
         
         return ""
     
@@ -271,20 +408,18 @@ class DBInserterV2:
         if not salary_text:
             return None, None
         
-        import re
-        
-        # Détecter format "K" (milliers)
-        has_k = bool(re.search(r'\d+\s*K', salary_text, re.IGNORECASE))
-        
-        # Capturer nombres
-        numbers = re.findall(r'(\d+(?:\.\d+)?)', salary_text)
+        # Capturer nombres et suffixe "K" (milliers) en un seul scan
+        matches = _RE_SALARY_AMOUNT.findall(salary_text)
+        if not matches:
+            return None, None
         
-        # Filtrage intelligent
+        # Filtrage intelligent ("35-45K" : le K s'applique à toute la fourchette)
+        has_k = any(k for _, k in matches)
         if has_k:
-            numbers = [float(n) for n in numbers]
+            numbers = [float(n) for n, _ in matches]
             numbers = [n * 1000 if n < 1000 else n for n in numbers]
         else:
-            numbers = [float(n) for n in numbers if float(n) >= 100]
+            numbers = [n for n in (float(v) for v, _ in matches) if n >= 100]
         
         salary_min = None
         salary_max = None
@@ -297,6 +432,145 @@ class DBInserterV2:
         
         return salary_min, salary_max
     
+    def prepare_offer_row(self, offer: Dict) -> Optional[Dict]:
+        """
+        Résoudre les dimensions et préparer les paramètres d'insertion d'une offre
+        
+        Args:
+            offer: Offre normalisée
+        
+        Returns:
+            Paramètres indexés par OFFER_ROW_KEYS, None si commune non trouvée
+        """
+        # Date de publication (parsée une seule fois)
+        pub_date = _parse_iso(offer.get("published_date"))
+        
+        # Résoudre les dimensions
+        source_id = self.get_or_create_source(offer["source"])
+        date_id = self.get_or_create_date(pub_date)
+        commune_id = self.get_commune_id(offer)  # ← CHANGEMENT ICI
+        category_id = self.get_or_create_job_category(offer)
+        
+        # Si commune non trouvée, skip l'offre
+        if not commune_id:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"  ⏭️ Skip (commune non trouvée): {offer['title'][:50]}")
+            return None
+        
+        # Parser le salaire
+        salary_text_to_parse = offer.get("salary_text", "")
+        
+        if not salary_text_to_parse:
+            salary_text_to_parse = self.extract_salary_from_description(offer.get("description", ""))
+        
+        salary_min, salary_max = self.parse_salary(salary_text_to_parse)
+        
+        return {
+            "source": source_id,
+            "date": date_id,
+            "commune": commune_id,  # ← commune_id au lieu de location_id
+            "cat": category_id,
+            "eid": offer["external_id"],
+            "title": offer["title"],
+            "desc": self.clean_description(offer["description"]),
+            "url": offer.get("url"),
+            "company": offer.get("company_name"),
+            "contract": offer.get("contract_type"),
+            "sal_min": salary_min,
+            "sal_max": salary_max,
+            "pub": pub_date
+        }
+    
+    def get_existing_external_ids(self, external_ids: List[str]) -> set:
+        """
+        Récupérer en une requête les external_id déjà présents en base
+        
+        Args:
+            external_ids: Identifiants à vérifier
+        
+        Returns:
+            Ensemble des external_id existants
+        """
+        if not external_ids:
+            return set()
+        
+        rows = self.conn.execute(self.SELECT_EXISTING_IDS_SQL, {"ids": list(external_ids)})
+        return {r[0] for r in rows}
+    
+    def insert_rows(self, rows: List[Dict], conn=None) -> set:
+        """
+        Insérer des offres préparées en un seul EXECUTE de la requête préparée
+        
+        Le dédoublonnage est fait par PostgreSQL dans le même aller-retour :
+        les external_id déjà présents sont ignorés (ON CONFLICT DO NOTHING)
+        et seuls ceux réellement insérés sont renvoyés (RETURNING).
+        Le commit est laissé à l'appelant.
+        
+        Args:
+            rows: Paramètres issus de prepare_offer_row
+            conn: Connexion SQLAlchemy à utiliser (défaut : connexion principale)
+        
+        Returns:
+            Ensemble des external_id réellement insérés
+        """
+        if not rows:
+            return set()
+        
+        # info : dictionnaire propre à la connexion DBAPI (survit aux checkouts du pool)
+        pooled = (conn or self.conn).connection
+        cursor = pooled.dbapi_connection.cursor()
+        try:
+            # PREPARE au premier usage de la connexion (non transactionnel : survit aux rollbacks)
+            if not pooled.info.get(self.PREPARED_INFO_KEY):
+                cursor.execute(self.PREPARE_INSERT_OFFERS_SQL)
+                pooled.info[self.PREPARED_INFO_KEY] = True
+            
+            # Une colonne = un tableau de paramètres
+            cursor.execute(
+                self.EXECUTE_INSERT_OFFERS_SQL,
+                [[row[key] for row in rows] for key in self.OFFER_ROW_KEYS],
+            )
+            inserted = {r[0] for r in cursor.fetchall()}
+        finally:
+            cursor.close()
+        
+        return inserted
+    
+    def _insert_shard(self, rows: List[Dict]):
+        """
+        Insérer un lot de faits dans sa propre transaction (exécuté par un thread)
+        
+        Si la requête groupée échoue, le lot est rejoué ligne par ligne (un
+        savepoint par offre) : seules les offres fautives sont perdues.
+        
+        Args:
+            rows: Paramètres issus de prepare_offer_row
+        
+        Returns:
+            (external_id insérés, liste des (external_id, erreur) en échec)
+        """
+        try:
+            with self.engine.begin() as conn:
+                return self.insert_rows(rows, conn), []
+        except Exception as e:
+            logger.warning(f"⚠️ Échec du lot ({e}), repli ligne par ligne")
+        
+        inserted = set()
+        failed = []
+        try:
+            with self.engine.begin() as conn:
+                for row in rows:
+                    try:
+                        with conn.begin_nested():
+                            inserted |= self.insert_rows([row], conn)
+                    except Exception as row_error:
+                        failed.append((row["eid"], row_error))
+        except Exception as e:
+            # Commit impossible : aucune ligne du lot n'est conservée
+            return set(), [(row["eid"], e) for row in rows]
+        
+        return inserted, failed
+    
     def insert_offer(self, offer: Dict) -> bool:
         """
         Insérer une offre dans la base de données
@@ -308,91 +582,37 @@ class DBInserterV2:
             True si insertion réussie, False sinon
         """
         try:
-            # Vérifier doublon
-            q = text("SELECT offer_id FROM fact_job_offers WHERE external_id=:eid")
-            if self.session.execute(q, {"eid": offer["external_id"]}).fetchone():
-                logger.debug(f"  ⏭️ Doublon: {offer['external_id']}")
+            row = self.prepare_offer_row(offer)
+            if row is None:
                 return False
             
-            # Résoudre les dimensions
-            source_id = self.get_or_create_source(offer["source"])
-            date_id = self.get_or_create_date(offer.get("published_date"))
-            commune_id = self.get_commune_id(offer)  # ← CHANGEMENT ICI
-            category_id = self.get_or_create_job_category(offer)
+            inserted = self.insert_rows([row])
+            self.conn.commit()
             
-            # Si commune non trouvée, skip l'offre
-            if not commune_id:
-                logger.warning(f"  ⏭️ Skip (commune non trouvée): {offer['title'][:50]}")
+            if not inserted:
+                logger.debug(f"  ⏭️ Doublon: {offer['external_id']}")
                 return False
             
-            # Parser le salaire
-            salary_text_to_parse = offer.get("salary_text", "")
-            
-            if not salary_text_to_parse:
-                salary_text_to_parse = self.extract_salary_from_description(offer.get("description", ""))
-            
-            salary_min, salary_max = self.parse_salary(salary_text_to_parse)
-            
-            # Date de publication
-            pub_date = None
-            if offer.get("published_date"):
-                try:
-                    pub_date = datetime.fromisoformat(
-                        offer["published_date"].replace("Z", "+00:00")
-                    ).date()
-                except:
-                    pass
-            
-            # Insertion
-            q = text("""
-                INSERT INTO fact_job_offers (
-                    source_id, date_id, commune_id, job_category_id,
-                    external_id, title, description, url, company_name,
-                    contract_type, salary_min, salary_max,
-                    published_date, collected_date
-                ) VALUES (
-                    :source, :date, :commune, :cat,
-                    :eid, :title, :desc, :url, :company,
-                    :contract, :sal_min, :sal_max,
-                    :pub, NOW()
-                )
-            """)
-            
-            self.session.execute(q, {
-                "source": source_id,
-                "date": date_id,
-                "commune": commune_id,  # ← commune_id au lieu de location_id
-                "cat": category_id,
-                "eid": offer["external_id"],
-                "title": offer["title"],
-                "desc": self.clean_description(offer["description"]),
-                "url": offer.get("url"),
-                "company": offer.get("company_name"),
-                "contract": offer.get("contract_type"),
-                "sal_min": salary_min,
-                "sal_max": salary_max,
-                "pub": pub_date
-            })
-            
-            self.session.commit()
             logger.info(f"  ✅ {offer['title'][:50]}...")
             return True
         
-        except IntegrityError:
-            self.session.rollback()
-            return False
-        
         except Exception as e:
-            self.session.rollback()
+            self._rollback()
             logger.error(f"  ❌ Erreur: {e}")
             return False
     
-    def insert_batch(self, offers: List[Dict]) -> Dict:
+    def insert_batch(self, offers: List[Dict], summary: bool = True) -> Dict:
         """
         Insérer un batch d'offres
         
+        Les dimensions sont résolues séquentiellement (un commit par chunk
+        de BATCH_SIZE offres), puis les faits sont insérés par lots de
+        BATCH_SIZE répartis sur INSERT_WORKERS connexions en parallèle.
+        
         Args:
             offers: Liste d'offres normalisées
+            summary: Si False, pas de résumé (appelant qui insère par paquets
+                et appelle log_summary une fois à la fin)
         
         Returns:
             Statistiques d'insertion
@@ -401,26 +621,106 @@ class DBInserterV2:
         logger.info(f"💾 INSERTION DE {len(offers)} OFFRES (avec référentiel géographique)")
         logger.info("=" * 70)
         
-        # Réinitialiser les stats
-        self.communes_not_found = []
-        
         inserted = 0
         duplicates = 0
         skipped = 0
         errors = 0
         
-        for i, offer in enumerate(offers, 1):
-            if i % 10 == 0:
-                logger.info(f"\n⏳ Progression: {i}/{len(offers)}")
+        # Doublons déjà en base : une seule requête pour tout le batch
+        existing = self.get_existing_external_ids(
+            [o["external_id"] for o in offers if o.get("external_id")]
+        )
+        
+        # Communes de tout le batch résolues en une requête GeoMatcher
+        self._commune_map = self.geo_matcher.find_commune_ids_bulk(
+            (o.get("location_city", "").strip(), o.get("location_postal_code", ""))
+            for o in offers
+            if o.get("external_id") not in existing and "commune_id" not in o
+        )
+        
+        # Dates de publication manquantes créées en une requête
+        try:
+            with self.conn.begin_nested():
+                self.resolve_dates_bulk(
+                    _parse_iso(o.get("published_date"))
+                    for o in offers
+                    if o.get("external_id") not in existing
+                )
+        except Exception as e:
+            # Repli : get_or_create_date offre par offre
+            logger.error(f"  ❌ Erreur création groupée des dates: {e}")
+            self._load_dimension_caches()
+        
+        # external_id déjà vus dans ce batch (doublons internes, O(1) par offre)
+        seen = set()
+        
+        debug = logger.isEnabledFor(logging.DEBUG)
+        
+        # 1. Résolution des dimensions, séquentielle (savepoint par offre : une
+        #    erreur n'annule pas les dimensions déjà créées), commit par chunk
+        #    pour que les connexions des threads voient les nouvelles dimensions
+        rows = []
+        for start in range(0, len(offers), self.BATCH_SIZE):
+            chunk = offers[start:start + self.BATCH_SIZE]
+            
+            chunk_rows = []
+            for i, offer in enumerate(chunk, start + 1):
+                if i % self.PROGRESS_EVERY == 0:
+                    logger.info(f"⏳ Progression: {i}/{len(offers)}")
+                
+                eid = offer.get("external_id")
+                is_dup = eid in existing or eid in seen
+                seen.add(eid)
+                if is_dup:
+                    if debug:
+                        logger.debug(f"  ⏭️ Doublon: {eid}")
+                    duplicates += 1
+                    continue
+                
+                try:
+                    with self.conn.begin_nested():
+                        row = self.prepare_offer_row(offer)
+                except Exception as e:
+                    logger.error(f"  ❌ Erreur: {e}")
+                    errors += 1
+                    # Ids créés dans le savepoint annulé : resynchroniser les caches
+                    self._load_dimension_caches()
+                    continue
+                
+                if row is None:
+                    skipped += 1
+                else:
+                    chunk_rows.append(row)
             
-            result = self.insert_offer(offer)
+            try:
+                self.conn.commit()
+            except Exception as e:
+                self._rollback()
+                logger.error(f"  ❌ Erreur création des dimensions: {e}")
+                errors += len(chunk_rows)
+                continue
             
-            if result:
-                inserted += 1
-            elif offer.get("external_id") in [o.get("external_id") for o in offers[:i-1]]:
-                duplicates += 1
-            else:
-                skipped += 1
+            rows.extend(chunk_rows)
+        
+        # 2. Insertion des faits en parallèle : un lot de BATCH_SIZE par
+        #    transaction, INSERT_WORKERS connexions simultanées
+        shards = [rows[i:i + self.BATCH_SIZE] for i in range(0, len(rows), self.BATCH_SIZE)]
+        with ThreadPoolExecutor(max_workers=self.INSERT_WORKERS) as executor:
+            results = executor.map(self._insert_shard, shards)
+            
+            for shard, (inserted_ids, failed) in zip(shards, results):
+                for eid, error in failed:
+                    logger.error(f"  ❌ Erreur insertion {eid}: {error}")
+                errors += len(failed)
+                failed_ids = {eid for eid, _ in failed}
+                
+                # Lignes non renvoyées par RETURNING = doublons (ex: insérées entre-temps)
+                inserted += len(inserted_ids)
+                for row in shard:
+                    if row["eid"] not in inserted_ids and row["eid"] not in failed_ids:
+                        if debug:
+                            logger.debug(f"  ⏭️ Doublon: {row['eid']}")
+                        duplicates += 1
         
         stats = {
             "total": len(offers),
@@ -431,15 +731,31 @@ class DBInserterV2:
             "communes_not_found": len(set(self.communes_not_found))
         }
         
+        if summary:
+            self.log_summary(stats)
+        
+        return stats
+    
+    def log_summary(self, stats: Dict) -> None:
+        """
+        Afficher le résumé des insertions et les statistiques GeoMatcher
+        
+        Les communes non trouvées sont celles cumulées depuis le résumé
+        précédent (plusieurs insert_batch possibles), puis remises à zéro.
+        
+        Args:
+            stats: Statistiques d'insertion (cumulées par l'appelant si besoin)
+        """
         logger.info("\n" + "=" * 70)
         logger.info("📊 RÉSUMÉ")
         logger.info("=" * 70)
         logger.info(f"Total:              {stats['total']}")
         logger.info(f"Insérées:           {stats['inserted']}")
         logger.info(f"Doublons:           {stats['duplicates']}")
-        logger.info(f"Skipped (no loc):   {stats['skipped']}")
+        logger.info(f"Skipped (no loc):   {stats.get('skipped', 0)}")
         logger.info(f"Erreurs:            {stats['errors']}")
-        logger.info(f"Succès:             {stats['inserted']/stats['total']*100:.1f}%")
+        if stats['total']:
+            logger.info(f"Succès:             {stats['inserted']/stats['total']*100:.1f}%")
         
         # Afficher les communes non trouvées
         if self.communes_not_found:
@@ -454,15 +770,20 @@ class DBInserterV2:
         geo_stats = self.geo_matcher.get_stats()
         logger.info(f"\n📍 GeoMatcher:")
         logger.info(f"   Cache: {geo_stats.get('cache_size', 0)} entrées")
+        lru_info = self._resolved_commune.cache_info()
+        logger.info(
+            f"   LRU unitaire: {lru_info.hits} hits / {lru_info.misses} misses "
+            f"({lru_info.currsize}/{lru_info.maxsize})"
+        )
         
         logger.info("=" * 70)
         
-        return stats
+        self.communes_not_found = []
     
     def close(self):
         """Fermer la connexion"""
-        self.session.close()
-        self.geo_matcher.close()
+        self.conn.close()
+        self.engine.dispose()
         logger.info("🔚 Connexion fermée")
 
 
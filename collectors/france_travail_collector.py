@@ -14,14 +14,25 @@ Usage:
 """
 
 import os
-import time
 import re
+import json
+import sqlite3
+import asyncio
+import importlib.util
+import multiprocessing
+import multiprocessing.util
+import tempfile
+import threading
 import requests
 import logging
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 from pathlib import Path
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 
 # Import extraction Météo Jobs
 try:
@@ -35,6 +46,44 @@ try:
 except ImportError:
     SELENIUM_AVAILABLE = False
 
+# Client HTTP asynchrone (optionnel) pour extraire Météo Jobs sans navigateur
+try:
+    import httpx
+    from lxml import html as lxml_html
+    HTTPX_AVAILABLE = True
+    HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+except ImportError:
+    HTTPX_AVAILABLE = False
+    HTTP2_AVAILABLE = False
+
+# Playwright asynchrone (optionnel) : extraction Météo Jobs concurrente dans un seul navigateur
+try:
+    from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+
+# Parseur JSON rapide (optionnel) pour les réponses de l'API
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# pandas (optionnel) : filtre Data/IA vectorisé quand pyahocorasick est absent
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
+# Automate Aho-Corasick (optionnel) pour le filtre Data/IA
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 # Configuration
 load_dotenv()
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -45,11 +94,171 @@ if not SELENIUM_AVAILABLE:
     logger.warning("⚠️ Selenium non disponible - extraction Météo Jobs désactivée")
 
 
+def _json_loads(content: bytes):
+    """Décoder une réponse JSON (orjson si disponible, json sinon)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _json_dumps(obj) -> bytes:
+    """Encoder en JSON (orjson si disponible, json sinon)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _keywords_to_trie_regex(keywords: List[str]) -> str:
+    """
+    Compiler une liste de mots-clés en alternance regex factorisée (trie)
+    
+    Le moteur re teste les alternatives une à une : factoriser les préfixes
+    communs évite de re-tester "data" pour chaque mot-clé qui en dérive.
+    
+    Args:
+        keywords: Mots-clés littéraux
+    
+    Returns:
+        Motif regex (sans groupe englobant) reconnaissant exactement ces mots-clés
+    """
+    trie: Dict[str, Dict] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}  # Fin de mot-clé
+    
+    return _trie_node_regex(trie)
+
+
+def _is_word_char(char: str) -> bool:
+    """Caractère de mot au sens de \\w (frontière de mot \\b)"""
+    return char.isalnum() or char == "_"
+
+
+def _trie_node_regex(node: Dict[str, Dict]) -> str:
+    """Motif regex d'un nœud du trie (récursif)"""
+    branches = [
+        re.escape(char) + _trie_node_regex(child)
+        for char, child in sorted(node.items()) if char
+    ]
+    if not branches:
+        return ""
+    
+    is_end = "" in node
+    if len(branches) == 1 and not is_end:
+        return branches[0]
+    
+    pattern = "(?:" + "|".join(branches) + ")"
+    return pattern + "?" if is_end else pattern
+
+
 class FranceTravailCollector:
     """Collecteur France Travail avec authentification OAuth2"""
     
     AUTH_URL = "https://entreprise.francetravail.fr/connexion/oauth2/access_token"
     API_URL = "https://api.francetravail.io/partenaire/offresdemploi/v2/offres/search"
+    DETAIL_URL = "https://candidat.francetravail.fr/offres/recherche/detail/{offer_id}"
+    
+    # Champs ATLAS ← champs API copiés tels quels par normalize_offer
+    OFFER_FIELDS = (
+        ("external_id", "id"),
+        ("title", "intitule"),
+        ("description", "description"),
+        ("romeCode", "romeCode"),
+        ("romeLibelle", "romeLibelle"),
+        ("published_date", "dateCreation"),
+        ("updated_date", "dateActualisation"),
+    )
+    # Champs ATLAS ← champs de lieuTravail
+    LOCATION_FIELDS = (
+        ("location_city", "libelle"),
+        ("location_postal_code", "codePostal"),
+        ("location_insee", "commune"),
+        ("location_lat", "latitude"),
+        ("location_lon", "longitude"),
+    )
+    _OFFER_KEYS, _OFFER_RAW_KEYS = zip(*OFFER_FIELDS)
+    _LOCATION_KEYS, _LOCATION_RAW_KEYS = zip(*LOCATION_FIELDS)
+    
+    # Requêtes de pagination simultanées (une connexion du pool chacune)
+    PAGINATION_WORKERS = 8
+    
+    # Processus Selenium simultanés (un Chrome chacun)
+    SELENIUM_WORKERS = 4
+    
+    # Offres Playwright simultanées (un contexte chacune, même navigateur)
+    PLAYWRIGHT_CONCURRENCY = 5
+    # Types de ressources non chargés par Playwright (équivalent de BLOCKED_URL_PATTERNS)
+    PLAYWRIGHT_BLOCKED_RESOURCES = {"image", "font", "media"}
+    
+    # Profils Chrome persistants (un par processus : un profil ne se partage pas)
+    CHROME_CACHE_DIR = Path(tempfile.gettempdir()) / "atlas_chrome"
+    CHROME_DISK_CACHE_SIZE = 100 * 1024 * 1024
+    
+    # Ressources inutiles à l'extraction, bloquées via CDP (images, polices, médias, traceurs)
+    BLOCKED_URL_PATTERNS = [
+        "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+        "*.woff", "*.woff2", "*.ttf", "*.mp4", "*.webm",
+        "*googletagmanager*", "*google-analytics*", "*doubleclick*", "*hotjar*",
+    ]
+    
+    # Token OAuth2 partagé entre exécutions (valide ~25 min)
+    TOKEN_CACHE_PATH = Path("~/.cache/atlas/ft_token.json").expanduser()
+    
+    # Offres normalisées des exécutions précédentes, par (id, dateActualisation)
+    OFFER_CACHE_PATH = Path("~/.cache/atlas/ft_offers.sqlite").expanduser()
+    CREATE_OFFER_CACHE_SQL = """
+        CREATE TABLE IF NOT EXISTS offers (
+            id TEXT PRIMARY KEY,
+            updated TEXT,
+            enriched INTEGER NOT NULL,
+            json BLOB NOT NULL
+        )
+    """
+    # enriched : offre normalisée avec extraction Météo Jobs (réutilisable sans)
+    SELECT_CACHED_OFFER_SQL = "SELECT json FROM offers WHERE id = ? AND updated IS ? AND enriched >= ?"
+    UPSERT_CACHED_OFFER_SQL = "INSERT OR REPLACE INTO offers (id, updated, enriched, json) VALUES (?, ?, ?, ?)"
+    
+    # Extraction Météo Jobs par HTTP (sans navigateur)
+    BROWSER_USER_AGENT = (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    )
+    HTTP_MAX_CONNECTIONS = 20
+    HTTP_TIMEOUT = 20
+    
+    # Lien "Postuler" vers Météo Jobs dans la page détail
+    METEOJOB_LINK_XPATH = "//a[@id='detail-apply']/@href | //a[contains(@href, 'meteojob')]/@href"
+    # Lien Météo Jobs embarqué dans le JSON de la page (slashs échappés retirés)
+    METEOJOB_URL_REGEX = re.compile(r"https?://[^\s\"'<>]*meteojob[^\s\"'<>]*", re.IGNORECASE)
+    
+    # Nom d'entreprise sur la page Météo Jobs (équivalents XPath des sélecteurs Selenium)
+    METEOJOB_COMPANY_XPATHS = [
+        ("cc-font-weight-headings", "//h1[contains(@class, 'cc-font-size-base')]//span[contains(@class, 'cc-font-weight-headings')]"),
+        ("h1 company span", "//h1//span[contains(@class, 'cc-font-weight-headings')]"),
+        ("company-name class", "//*[contains(@class, 'offer-company-name')]"),
+        ("h2.company", "//h2[contains(@class, 'company')]"),
+    ]
+    
+    # Nom d'entreprise sur la page Météo Jobs rendue (Selenium / Playwright)
+    METEOJOB_COMPANY_SELECTORS = [
+        ("cc-font-weight-headings", "h1.cc-font-size-base span.cc-font-weight-headings"),
+        ("h1 company span", "h1 span.cc-font-weight-headings"),
+        ("company-name class", ".offer-company-name"),
+        ("h2.company", "h2.company, h2[class*='company']"),
+    ]
+    METEOJOB_COMPANY_ANY_SELECTOR = (
+        "h1 span.cc-font-weight-headings, .offer-company-name, h2.company, h2[class*='company']"
+    )
+    # Liens du menu "Postuler" de la page détail France Travail
+    APPLY_LINKS_SELECTOR = "#contactZone a, .dropdown-apply a"
+    
+    # Libellés génériques à ne pas prendre pour un nom d'entreprise
+    COMPANY_BLACKLIST = {
+        'entreprise', 'company', 'voir', 'postuler',
+        'recruteurs', 'se connecter', 'rechercher',
+    }
     
     # Grands domaines pertinents pour Data/IA
     GRAND_DOMAINES = [
@@ -58,109 +267,124 @@ class FranceTravailCollector:
         "M17",  # Marketing / Stratégie commerciale (analytics)
     ]
     
-    # Regex pour filtrer les offres Data/IA
-    DATA_AI_REGEX = re.compile(
-        r"\b("
+    # Mots-clés Data/IA (en minuscules, cherchés entre frontières de mots)
+    DATA_AI_KEYWORDS = [
         # Data général
-        r"data|dataset|donnée|données|base de données|database|bdd|"
-        r"etl|elt|datawarehouse|data warehouse|datalake|data lake|lakehouse|"
-        r"bi\b|business intelligence|analytics|analytique|analyse de données|"
-        r"datamart|data mart|olap|oltp|"
+        "data", "dataset", "donnée", "données", "base de données", "database", "bdd",
+        "etl", "elt", "datawarehouse", "data warehouse", "datalake", "data lake", "lakehouse",
+        "bi", "business intelligence", "analytics", "analytique", "analyse de données",
+        "datamart", "data mart", "olap", "oltp",
         
         # SQL et bases de données
-        r"sql|postgres|postgresql|mysql|oracle|snowflake|bigquery|redshift|"
-        r"pl/sql|plsql|t-sql|tsql|nosql|mongodb|cassandra|dynamodb|elasticsearch|"
-        r"databricks|synapse|teradata|vertica|clickhouse|"
+        "sql", "postgres", "postgresql", "mysql", "oracle", "snowflake", "bigquery", "redshift",
+        "pl/sql", "plsql", "t-sql", "tsql", "nosql", "mongodb", "cassandra", "dynamodb", "elasticsearch",
+        "databricks", "synapse", "teradata", "vertica", "clickhouse",
         
         # Langages et outils Data
-        r"python|pandas|numpy|pyspark|scala|julia|r\b|matlab|"
-        r"spark|hadoop|kafka|airflow|dbt|dagster|prefect|luigi|"
-        r"tableau|power bi|powerbi|qlik|looker|metabase|superset|"
-        r"sas|spss|stata|alteryx|talend|informatica|"
+        "python", "pandas", "numpy", "pyspark", "scala", "julia", "r", "matlab",
+        "spark", "hadoop", "kafka", "airflow", "dbt", "dagster", "prefect", "luigi",
+        "tableau", "power bi", "powerbi", "qlik", "looker", "metabase", "superset",
+        "sas", "spss", "stata", "alteryx", "talend", "informatica",
         
         # Machine Learning et IA
-        r"machine learning|ml\b|deep learning|dl\b|apprentissage automatique|"
-        r"intelligence artificielle|\bia\b|ai\b|artificial intelligence|"
-        r"scikit|sklearn|tensorflow|pytorch|keras|xgboost|lightgbm|catboost|"
-        r"mlflow|mlops|kubeflow|sagemaker|vertex ai|"
-        r"classification|régression|clustering|prédiction|prediction|"
-        r"random forest|gradient boosting|neural network|réseau de neurones|"
+        "machine learning", "ml", "deep learning", "dl", "apprentissage automatique",
+        "intelligence artificielle", "ia", "ai", "artificial intelligence",
+        "scikit", "sklearn", "tensorflow", "pytorch", "keras", "xgboost", "lightgbm", "catboost",
+        "mlflow", "mlops", "kubeflow", "sagemaker", "vertex ai",
+        "classification", "régression", "clustering", "prédiction", "prediction",
+        "random forest", "gradient boosting", "neural network", "réseau de neurones",
         
         # NLP et LLM
-        r"nlp|natural language processing|traitement du langage naturel|"
-        r"llm|large language model|gpt|bert|transformer|attention|"
-        r"chatbot|conversationnel|dialogue|assistant virtuel|"
-        r"spacy|nltk|hugging face|huggingface|langchain|llamaindex|"
-        r"text mining|topic modeling|sentiment analysis|analyse de sentiment|"
-        r"word2vec|doc2vec|fasttext|glove|embedding|tokenization|"
-        r"ner|named entity recognition|pos tagging|lemmatization|stemming|"
+        "nlp", "natural language processing", "traitement du langage naturel",
+        "llm", "large language model", "gpt", "bert", "transformer", "attention",
+        "chatbot", "conversationnel", "dialogue", "assistant virtuel",
+        "spacy", "nltk", "hugging face", "huggingface", "langchain", "llamaindex",
+        "text mining", "topic modeling", "sentiment analysis", "analyse de sentiment",
+        "word2vec", "doc2vec", "fasttext", "glove", "embedding", "tokenization",
+        "ner", "named entity recognition", "pos tagging", "lemmatization", "stemming",
         
         # RAG et systèmes avancés
-        r"rag|retrieval augmented generation|retrieval-augmented|"
-        r"vector database|vectordb|chromadb|pinecone|weaviate|milvus|qdrant|faiss|"
-        r"semantic search|recherche sémantique|similarity search|"
-        r"prompt engineering|fine-tuning|finetuning|few-shot|zero-shot|"
-        r"foundation model|modèle de fondation|génératif|generative|"
+        "rag", "retrieval augmented generation", "retrieval-augmented",
+        "vector database", "vectordb", "chromadb", "pinecone", "weaviate", "milvus", "qdrant", "faiss",
+        "semantic search", "recherche sémantique", "similarity search",
+        "prompt engineering", "fine-tuning", "finetuning", "few-shot", "zero-shot",
+        "foundation model", "modèle de fondation", "génératif", "generative",
         
         # Computer Vision
-        r"computer vision|vision par ordinateur|image processing|traitement d'image|"
-        r"opencv|yolo|detectron|segmentation|object detection|détection d'objet|"
-        r"cnn|convolutional neural network|resnet|vgg|inception|"
-        r"ocr|reconnaissance de caractères|facial recognition|reconnaissance faciale|"
+        "computer vision", "vision par ordinateur", "image processing", "traitement d'image",
+        "opencv", "yolo", "detectron", "segmentation", "object detection", "détection d'objet",
+        "cnn", "convolutional neural network", "resnet", "vgg", "inception",
+        "ocr", "reconnaissance de caractères", "facial recognition", "reconnaissance faciale",
         
         # Cloud et Infrastructure
-        r"cloud|aws|gcp|google cloud|azure|microsoft azure|alibaba cloud|"
-        r"s3|ec2|lambda|emr|glue|athena|kinesis|redshift|"
-        r"bigquery|dataflow|dataproc|pub/sub|cloud functions|"
-        r"blob storage|cosmos db|synapse|databricks|"
-        r"docker|kubernetes|k8s|containerisation|microservices|"
+        "cloud", "aws", "gcp", "google cloud", "azure", "microsoft azure", "alibaba cloud",
+        "s3", "ec2", "lambda", "emr", "glue", "athena", "kinesis", "redshift",
+        "bigquery", "dataflow", "dataproc", "pub/sub", "cloud functions",
+        "blob storage", "cosmos db", "synapse", "databricks",
+        "docker", "kubernetes", "k8s", "containerisation", "microservices",
         
         # Métiers Data/IA
-        r"data engineer|data scientist|data analyst|bi analyst|"
-        r"analyste données|ingénieur données|scientifique des données|"
-        r"ml engineer|mlops engineer|ai engineer|nlp engineer|"
-        r"data architect|architecte données|chief data officer|cdo|"
-        r"analytics engineer|research scientist|chercheur|"
+        "data engineer", "data scientist", "data analyst", "bi analyst",
+        "analyste données", "ingénieur données", "scientifique des données",
+        "ml engineer", "mlops engineer", "ai engineer", "nlp engineer",
+        "data architect", "architecte données", "chief data officer", "cdo",
+        "analytics engineer", "research scientist", "chercheur",
         
         # Termes tech généraux
-        r"développeur|developer|ingénieur|engineer|architect|architecte|"
-        r"informatique|it\b|tech|digital|numérique|technologie|"
-        r"backend|back-end|frontend|front-end|fullstack|full-stack|"
-        r"devops|sre|site reliability|"
-        r"api|rest|graphql|microservice|"
+        "développeur", "developer", "ingénieur", "engineer", "architect", "architecte",
+        "informatique", "it", "tech", "digital", "numérique", "technologie",
+        "backend", "back-end", "frontend", "front-end", "fullstack", "full-stack",
+        "devops", "sre", "site reliability",
+        "api", "rest", "graphql", "microservice",
         
         # Big Data et temps réel
-        r"big data|hadoop|hdfs|mapreduce|hive|pig|impala|presto|trino|"
-        r"streaming|temps réel|real-time|realtime|flink|storm|samza|"
-        r"message queue|rabbitmq|kafka|pulsar|nats|redis|"
+        "big data", "hadoop", "hdfs", "mapreduce", "hive", "pig", "impala", "presto", "trino",
+        "streaming", "temps réel", "real-time", "realtime", "flink", "storm", "samza",
+        "message queue", "rabbitmq", "kafka", "pulsar", "nats", "redis",
         
         # Méthodes et concepts
-        r"agile|scrum|kanban|devops|ci/cd|mlops|dataops|"
-        r"a/b test|expérimentation|kpi|metrics|métriques|dashboard|reporting|"
-        r"data quality|qualité des données|data governance|gouvernance|"
-        r"data catalog|catalogue de données|metadata|métadonnées|lineage|"
-        r"etl pipeline|data pipeline|orchestration|workflow|"
+        "agile", "scrum", "kanban", "devops", "ci/cd", "mlops", "dataops",
+        "a/b test", "expérimentation", "kpi", "metrics", "métriques", "dashboard", "reporting",
+        "data quality", "qualité des données", "data governance", "gouvernance",
+        "data catalog", "catalogue de données", "metadata", "métadonnées", "lineage",
+        "etl pipeline", "data pipeline", "orchestration", "workflow",
         
         # Visualisation et dashboarding
-        r"visualisation|visualization|dataviz|dashboard|reporting|"
-        r"matplotlib|seaborn|plotly|bokeh|d3\.js|d3js|highcharts|"
-        r"grafana|kibana|prometheus|splunk|datadog|"
+        "visualisation", "visualization", "dataviz", "dashboard", "reporting",
+        "matplotlib", "seaborn", "plotly", "bokeh", "d3.js", "d3js", "highcharts",
+        "grafana", "kibana", "prometheus", "splunk", "datadog",
         
         # Statistiques et mathématiques
-        r"statistique|statistics|probabilité|probability|bayésien|bayesian|"
-        r"régression linéaire|linear regression|logistic regression|"
-        r"hypothesis testing|test statistique|p-value|correlation|"
-        r"time series|série temporelle|forecast|forecasting|prévision|arima|prophet|"
+        "statistique", "statistics", "probabilité", "probability", "bayésien", "bayesian",
+        "régression linéaire", "linear regression", "logistic regression",
+        "hypothesis testing", "test statistique", "p-value", "correlation",
+        "time series", "série temporelle", "forecast", "forecasting", "prévision", "arima", "prophet",
         
         # Domaines d'application
-        r"recommandation|recommendation system|système de recommandation|"
-        r"fraud detection|détection de fraude|anomaly detection|détection d'anomalie|"
-        r"churn prediction|prédiction d'attrition|credit scoring|"
-        r"personalization|personnalisation|optimisation|optimization|"
-        r")\b",
-        re.IGNORECASE
+        "recommandation", "recommendation system", "système de recommandation",
+        "fraud detection", "détection de fraude", "anomaly detection", "détection d'anomalie",
+        "churn prediction", "prédiction d'attrition", "credit scoring",
+        "personalization", "personnalisation", "optimisation", "optimization",
+    ]
+    
+    # Regex pour filtrer les offres Data/IA : alternance compactée en trie
+    # (préfixes communs factorisés, ex: "data(?: (?:engineer|lake|...))?").
+    # Sans IGNORECASE : appliquée au texte déjà en minuscules (cf. _offer_text)
+    DATA_AI_REGEX = re.compile(
+        r"\b(?:" + _keywords_to_trie_regex(DATA_AI_KEYWORDS) + r")\b"
+    )
+    
+    # Marqueurs Data/IA fréquents (sous-ensemble de DATA_AI_KEYWORDS), testés
+    # avant l'automate/la regex complète avec les mêmes frontières de mot :
+    # même résultat que le filtre exact ("data" seul accepterait "mandataire")
+    _FAST_KEYWORDS = ("data", "sql", "python", "ingénieur", "analytics", "machine learning")
+    _FAST_KEYWORDS_REGEX = re.compile(
+        r"\b(?:" + "|".join(map(re.escape, _FAST_KEYWORDS)) + r")\b"
     )
     
+    # Automate construit au premier filtrage (cf. _data_ai_automaton)
+    _DATA_AI_AUTOMATON = None
+    
     def __init__(self, use_selenium: bool = False):
         """
         Initialise le collecteur avec les credentials
@@ -178,40 +402,307 @@ class FranceTravailCollector:
         self.token_expires_at: Optional[datetime] = None
         self.use_selenium = use_selenium
         
+        # Driver Selenium réutilisé d'une offre à l'autre (cf. _get_driver)
+        self._driver = None
+        self.chrome_profile = "main"  # Sous-dossier de CHROME_CACHE_DIR
+        
+        # Cache SQLite des offres normalisées (ouvert au premier accès)
+        self._offer_cache: Optional[sqlite3.Connection] = None
+        
+        # company_name extraits de Météo Jobs en amont de normalize_offer
+        self._meteojob_companies: Dict[str, Optional[str]] = {}
+        
+        self._auth_lock = threading.Lock()
+        
+        # Pool de connexions dimensionné pour la pagination parallèle,
+        # erreurs transitoires (429, 5xx) relancées avec backoff par urllib3
         self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.3,
+                status_forcelist=[429, 502, 503, 504],
+                respect_retry_after_header=True
+            )
+        )
+        self.session.mount("https://", adapter)
         self.session.headers.update({
             "User-Agent": "ATLAS-Collector/1.0",
             "Accept": "application/json"
         })
+        # Réponses compressées : gzip/deflate, plus br/zstd si le décodeur est installé
+        self.session.headers.update(make_headers(accept_encoding=True))
         
         selenium_status = "ON" if (use_selenium and SELENIUM_AVAILABLE) else "OFF"
         logger.info(f"✅ FranceTravailCollector initialisé (Selenium: {selenium_status})")
     
-    def extract_company_from_meteojob(self, offer_id: str, headless: bool = True) -> Optional[str]:
+    def _clean_company_name(self, text: Optional[str]) -> Optional[str]:
+        """Retenir un texte comme company_name s'il est plausible"""
+        text = (text or "").strip()
+        if 3 < len(text) < 100 and text.lower() not in self.COMPANY_BLACKLIST:
+            return text
+        return None
+    
+    async def extract_company_async(self, offer_id: str, client: "httpx.AsyncClient") -> Optional[str]:
         """
-        Extraire company_name depuis Météo Jobs via Selenium
+        Extraire company_name depuis Météo Jobs par HTTP (sans navigateur)
+        
+        Récupère le lien Météo Jobs de la page détail France Travail
+        (bouton "Postuler" ou JSON embarqué), puis le nom de l'entreprise
+        sur la page Météo Jobs.
         
         Args:
-            offer_id: ID de l'offre France Travail
-            headless: Mode headless (True par défaut en production)
+            offer_id: ID numérique de l'offre France Travail
+            client: Client httpx partagé (pool de connexions)
         
         Returns:
-            company_name ou None si échec
+            company_name ou None si lien ou nom introuvable
+        """
+        try:
+            response = await client.get(self.DETAIL_URL.format(offer_id=offer_id))
+            response.raise_for_status()
+            
+            # ÉTAPE 1: Lien Météo Jobs (attribut href, sinon JSON de la page)
+            hrefs = lxml_html.fromstring(response.text).xpath(self.METEOJOB_LINK_XPATH)
+            meteojob_url = next((h for h in hrefs if "meteojob" in h.lower()), None)
+            if not meteojob_url:
+                match = self.METEOJOB_URL_REGEX.search(response.text.replace("\\/", "/"))
+                meteojob_url = match.group(0) if match else None
+            
+            if not meteojob_url:
+                return None
+            
+            # ÉTAPE 2: Page Météo Jobs
+            response = await client.get(meteojob_url)
+            response.raise_for_status()
+            tree = lxml_html.fromstring(response.text)
+            
+            # ÉTAPE 3: Extraire company_name
+            for name, xpath in self.METEOJOB_COMPANY_XPATHS:
+                for elem in tree.xpath(xpath)[:2]:
+                    company_name = self._clean_company_name(elem.text_content())
+                    if company_name:
+                        logger.debug("✅ Company trouvée via %s (HTTP): %s", name, company_name)
+                        return company_name
+        
+        except (httpx.HTTPError, ValueError) as e:
+            logger.debug("⚠️ Extraction HTTP Météo Jobs échouée pour %s: %s", offer_id, e)
+        
+        return None
+    
+    async def _extract_companies_async(self, offer_ids: List[str]) -> List[Optional[str]]:
+        """Extraire les company_name de plusieurs offres en parallèle"""
+        async with httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=self.HTTP_MAX_CONNECTIONS),
+            headers={"User-Agent": self.BROWSER_USER_AGENT},
+            timeout=self.HTTP_TIMEOUT,
+            follow_redirects=True,
+        ) as client:
+            return await asyncio.gather(
+                *(self.extract_company_async(offer_id, client) for offer_id in offer_ids)
+            )
+    
+    def _ids_missing_company(self, raw_offers: List[Dict]) -> List[str]:
+        """IDs des offres sans company_name pas encore passées par Météo Jobs"""
+        # Seuls les IDs numériques ont un lien Météo Jobs (cf. extract_company_from_meteojob)
+        return [
+            o["id"] for o in raw_offers
+            if o.get("id") and o["id"].isdigit()
+            and not (o.get("entreprise") or {}).get("nom")
+            and o["id"] not in self._meteojob_companies
+        ]
+    
+    def extract_companies_selenium(self, raw_offers: List[Dict]) -> None:
+        """
+        Extraire via Selenium, en parallèle, les company_name encore manquants
+        
+        Chaque processus du pool garde son propre driver Chrome pour toutes
+        ses offres. Les résultats (None compris) évitent un second passage
+        par Selenium dans normalize_offer.
+        
+        Args:
+            raw_offers: Offres brutes de l'API
         """
         if not SELENIUM_AVAILABLE:
-            logger.warning(f"⚠️ Selenium non disponible pour offre {offer_id}")
-            return None
+            return
         
-        # 🎯 OPTIMISATION: Skip si l'ID n'est pas numérique
-        # Les IDs alphanumériques (ex: 201PZTR) n'ont généralement pas de lien Météo Jobs
-        # Seuls les IDs numériques (ex: 6662091) ont ce lien
-        if not offer_id.isdigit():
-            logger.info(f"⏭️ ID non-numérique ({offer_id}) - skip Météo Jobs")
-            return None
+        offer_ids = self._ids_missing_company(raw_offers)
+        # Une seule offre : pas de pool, normalize_offer s'en charge
+        if len(offer_ids) < 2:
+            return
+        
+        workers = min(self.SELENIUM_WORKERS, len(offer_ids))
+        logger.info(f"🔍 Extraction Selenium Météo Jobs: {len(offer_ids)} offres sur {workers} processus...")
+        
+        try:
+            # spawn : collect() peut tourner dans un processus multi-threadé
+            # (pipeline_collect), où un fork risque un interblocage
+            mp_context = multiprocessing.get_context("spawn")
+            # Compteur partagé : chaque worker prend un profil Chrome distinct et stable
+            slots = mp_context.Value("i", 0)
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=mp_context,
+                initializer=_init_meteojob_worker, initargs=(slots,)
+            ) as executor:
+                companies = list(executor.map(_scrape_meteojob_company, offer_ids))
+        except Exception as e:
+            logger.error(f"❌ Pool Selenium indisponible, extraction séquentielle: {e}")
+            return
+        
+        self._meteojob_companies.update(zip(offer_ids, companies))
+        found = sum(1 for c in companies if c)
+        logger.info(f"✅ {found}/{len(offer_ids)} company_name extraits via Selenium")
+    
+    async def extract_company_playwright(self, offer_id: str, browser, semaphore: asyncio.Semaphore) -> Optional[str]:
+        """
+        Extraire company_name depuis Météo Jobs avec Playwright
+        
+        Même parcours que extract_company_from_meteojob, dans un contexte
+        isolé (cookies propres à l'offre) du navigateur partagé ; chaque
+        étape attend l'élément attendu au lieu d'une pause fixe.
+        
+        Args:
+            offer_id: ID numérique de l'offre France Travail
+            browser: Navigateur Playwright partagé
+            semaphore: Limite le nombre d'offres traitées simultanément
+        
+        Returns:
+            company_name ou None si échec
+        """
+        async with semaphore:
+            context = await browser.new_context(user_agent=self.BROWSER_USER_AGENT)
+            try:
+                page = await context.new_page()
+                await page.route("**/*", self._route_blocking_resources)
+                
+                # ÉTAPE 1: Page détail + cookies France Travail
+                await page.goto(self.DETAIL_URL.format(offer_id=offer_id), timeout=30000)
+                try:
+                    await page.get_by_role("button", name="Tout accepter").click(timeout=5000)
+                except PlaywrightTimeoutError:
+                    pass
+                
+                # ÉTAPE 2: Menu "Postuler" et lien Météo Jobs
+                await page.locator("#detail-apply").click(timeout=10000)
+                links = page.locator(self.APPLY_LINKS_SELECTOR)
+                await links.first.wait_for(timeout=10000)
+                
+                meteojob_url = None
+                for link in await links.all():
+                    href = await link.get_attribute("href") or ""
+                    if "meteojob" in href.lower() or "meteojob" in (await link.inner_text()).lower():
+                        meteojob_url = href
+                        break
+                
+                if not meteojob_url:
+                    logger.info("ℹ️ Pas de lien Météo Jobs pour %s - skip", offer_id)
+                    return None
+                
+                # ÉTAPE 3: Page Météo Jobs (même onglet) + cookies TarteAuCitron
+                await page.goto(meteojob_url, timeout=30000)
+                try:
+                    await page.locator("#tarteaucitronPersonalize2").click(timeout=5000)
+                except PlaywrightTimeoutError:
+                    pass
+                
+                # ÉTAPE 4: Extraire company_name
+                await page.wait_for_selector(self.METEOJOB_COMPANY_ANY_SELECTOR, timeout=10000)
+                for name, selector in self.METEOJOB_COMPANY_SELECTORS:
+                    for text in (await page.locator(selector).all_inner_texts())[:2]:
+                        company_name = self._clean_company_name(text)
+                        if company_name:
+                            logger.info("✅ Company trouvée via %s (Playwright): %s", name, company_name)
+                            return company_name
+            
+            except Exception as e:
+                logger.debug("⚠️ Extraction Playwright Météo Jobs échouée pour %s: %s", offer_id, e)
+            
+            finally:
+                await context.close()
+        
+        return None
+    
+    async def _route_blocking_resources(self, route) -> None:
+        """Abandonner les requêtes d'images, polices et médias (Playwright)"""
+        if route.request.resource_type in self.PLAYWRIGHT_BLOCKED_RESOURCES:
+            await route.abort()
+        else:
+            await route.continue_()
+    
+    async def _extract_companies_playwright(self, offer_ids: List[str], max_concurrency: int) -> List[Optional[str]]:
+        """Extraire les company_name de plusieurs offres dans un seul Chromium"""
+        semaphore = asyncio.Semaphore(max_concurrency)
+        async with async_playwright() as playwright:
+            browser = await playwright.chromium.launch(headless=True)
+            try:
+                return await asyncio.gather(
+                    *(self.extract_company_playwright(offer_id, browser, semaphore) for offer_id in offer_ids)
+                )
+            finally:
+                await browser.close()
+    
+    def extract_companies_playwright(self, raw_offers: List[Dict], max_concurrency: int = None) -> None:
+        """
+        Extraire via Playwright, en concurrence, les company_name encore manquants
+        
+        Un seul navigateur, un contexte par offre (au plus max_concurrency à
+        la fois). Seules les offres résolues évitent le passage par Selenium
+        (extract_companies_selenium, normalize_offer) ; les échecs y retombent.
+        
+        Args:
+            raw_offers: Offres brutes de l'API
+            max_concurrency: Offres simultanées (PLAYWRIGHT_CONCURRENCY par défaut)
+        """
+        if not PLAYWRIGHT_AVAILABLE:
+            return
+        
+        offer_ids = self._ids_missing_company(raw_offers)
+        if not offer_ids:
+            return
+        
+        logger.info(f"🎭 Extraction Playwright Météo Jobs: {len(offer_ids)} offres...")
+        try:
+            companies = asyncio.run(self._extract_companies_playwright(
+                offer_ids, max_concurrency or self.PLAYWRIGHT_CONCURRENCY
+            ))
+        except Exception as e:
+            # Chromium Playwright absent (playwright install) : Selenium prend le relais
+            logger.error(f"❌ Playwright indisponible, repli Selenium: {e}")
+            return
+        
+        found = {offer_id: c for offer_id, c in zip(offer_ids, companies) if c}
+        self._meteojob_companies.update(found)
+        logger.info(f"✅ {len(found)}/{len(offer_ids)} company_name extraits via Playwright")
+    
+    def prefetch_meteojob_companies(self, raw_offers: List[Dict]) -> None:
+        """
+        Extraire par HTTP les company_name manquants avant normalisation
+        
+        Les offres résolues ne passent plus par Selenium dans normalize_offer ;
+        les autres (lien introuvable, page rendue en JavaScript) y retombent.
+        
+        Args:
+            raw_offers: Offres brutes de l'API
+        """
+        if not HTTPX_AVAILABLE:
+            return
+        
+        offer_ids = self._ids_missing_company(raw_offers)
+        if not offer_ids:
+            return
         
-        url = f"https://candidat.francetravail.fr/offres/recherche/detail/{offer_id}"
-        logger.info(f"🔍 Extraction Météo Jobs pour offre {offer_id}")
+        logger.info(f"⚡ Extraction HTTP Météo Jobs pour {len(offer_ids)} offres...")
+        companies = asyncio.run(self._extract_companies_async(offer_ids))
         
+        found = {offer_id: c for offer_id, c in zip(offer_ids, companies) if c}
+        self._meteojob_companies.update(found)
+        logger.info(f"✅ {len(found)}/{len(offer_ids)} company_name extraits sans navigateur")
+    
+    def _start_chrome(self, headless: bool, profile_dir: Optional[Path] = None):
+        """Démarrer Chrome (profil et cache disque persistants si profile_dir)"""
         # Configuration Chrome
         chrome_options = Options()
         if headless:
@@ -222,21 +713,134 @@ class FranceTravailCollector:
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
         chrome_options.add_argument('--log-level=3')  # Réduire les logs
+        chrome_options.add_experimental_option(
+            "prefs", {"profile.managed_default_content_settings.images": 2}  # Images désactivées
+        )
+        if profile_dir is not None:
+            chrome_options.add_argument(f'--user-data-dir={profile_dir}')
+            chrome_options.add_argument(f'--disk-cache-dir={profile_dir / "cache"}')
+            chrome_options.add_argument(f'--disk-cache-size={self.CHROME_DISK_CACHE_SIZE}')
         
-        driver = None
-        company_name = None
+        driver = webdriver.Chrome(options=chrome_options)
+        driver.set_page_load_timeout(30)  # Timeout de 30s pour le chargement des pages
         
+        # Bloquer les ressources lourdes : pages chargées (et prêtes) plus vite
         try:
-            driver = webdriver.Chrome(options=chrome_options)
-            driver.set_page_load_timeout(30)  # Timeout de 30s pour le chargement des pages
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.BLOCKED_URL_PATTERNS})
         except Exception as e:
-            logger.error(f"❌ Erreur initialisation Chrome: {e}")
+            logger.debug("⚠️ Blocage CDP indisponible: %s", e)
+        
+        return driver
+    
+    def _get_driver(self, headless: bool = True):
+        """
+        Driver Chrome partagé entre les offres (démarré au premier appel)
+        
+        Returns:
+            WebDriver ou None si Chrome ne démarre pas
+        """
+        if self._driver is not None:
+            return self._driver
+        
+        # Profil persistant : CSS/JS/polices en cache disque d'une exécution à l'autre
+        profile_dir = self.CHROME_CACHE_DIR / self.chrome_profile
+        try:
+            profile_dir.mkdir(parents=True, exist_ok=True)
+            self._driver = self._start_chrome(headless, profile_dir)
+        except Exception as e:
+            # Profil verrouillé par un autre Chrome (exécution concurrente) : profil éphémère
+            logger.warning(f"⚠️ Profil Chrome {profile_dir} indisponible ({e}), profil temporaire")
+            try:
+                self._driver = self._start_chrome(headless)
+            except Exception as e:
+                logger.error(f"❌ Erreur initialisation Chrome: {e}")
+                self._driver = None
+        
+        return self._driver
+    
+    def _reset_driver_tabs(self) -> None:
+        """Fermer les onglets ouverts par une extraction (driver relancé si inutilisable)"""
+        if self._driver is None:
+            return
+        
+        try:
+            handles = self._driver.window_handles
+            for handle in handles[1:]:
+                self._driver.switch_to.window(handle)
+                self._driver.close()
+            self._driver.switch_to.window(handles[0])
+        except Exception:
+            # Driver dans un état incohérent : recréé au prochain appel
+            self._quit_driver()
+    
+    def _quit_driver(self) -> None:
+        """Arrêter le driver Chrome partagé"""
+        if self._driver is None:
+            return
+        
+        try:
+            self._driver.quit()
+        except Exception:
+            pass  # Ignorer les erreurs de quit
+        finally:
+            self._driver = None
+    
+    def close(self) -> None:
+        """Libérer le driver Chrome et le cache d'offres"""
+        self._quit_driver()
+        
+        if self._offer_cache is not None:
+            self._offer_cache.close()
+            self._offer_cache = None
+    
+    def __del__(self):
+        # __init__ peut avoir échoué avant la création des ressources
+        if getattr(self, "_driver", None) is not None or getattr(self, "_offer_cache", None) is not None:
+            self.close()
+    
+    def extract_company_from_meteojob(self, offer_id: str, headless: bool = True) -> Optional[str]:
+        """
+        Extraire company_name depuis Météo Jobs via Selenium
+        
+        Args:
+            offer_id: ID de l'offre France Travail
+            headless: Mode headless (True par défaut en production)
+        
+        Returns:
+            company_name ou None si échec
+        """
+        if not SELENIUM_AVAILABLE:
+            logger.warning(f"⚠️ Selenium non disponible pour offre {offer_id}")
+            return None
+        
+        # 🎯 OPTIMISATION: Skip si l'ID n'est pas numérique
+        # Les IDs alphanumériques (ex: 201PZTR) n'ont généralement pas de lien Météo Jobs
+        # Seuls les IDs numériques (ex: 6662091) ont ce lien
+        if not offer_id.isdigit():
+            logger.info("⏭️ ID non-numérique (%s) - skip Météo Jobs", offer_id)
             return None
         
+        url = self.DETAIL_URL.format(offer_id=offer_id)
+        logger.info("🔍 Extraction Météo Jobs pour offre %s", offer_id)
+        
+        driver = self._get_driver(headless)
+        if driver is None:
+            return None
+        
+        company_name = None
+        
         try:
-            # ÉTAPE 1: Charger la page
+            # ÉTAPE 1: Charger la page (état de l'offre précédente effacé)
+            driver.delete_all_cookies()
             driver.get(url)
-            time.sleep(3)
+            # Page utilisable dès que le bouton "Postuler" est dans le DOM
+            try:
+                WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located((By.ID, "detail-apply"))
+                )
+            except TimeoutException:
+                pass  # L'étape 3 réessaie et journalise l'échec
             
             # ÉTAPE 2: Cookies France Travail
             try:
@@ -244,7 +848,7 @@ class FranceTravailCollector:
                     EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Tout accepter')]"))
                 )
                 cookie_btn.click()
-                time.sleep(2)
+                WebDriverWait(driver, 5).until(EC.invisibility_of_element(cookie_btn))
             except TimeoutException:
                 try:
                     pe_cookies = driver.find_element(By.TAG_NAME, "pe-cookies")
@@ -256,7 +860,6 @@ class FranceTravailCollector:
                             if (acceptBtn) { acceptBtn.click(); }
                         }
                     """, pe_cookies)
-                    time.sleep(2)
                 except:
                     pass
             
@@ -268,7 +871,6 @@ class FranceTravailCollector:
                         EC.element_to_be_clickable((By.ID, "detail-apply"))
                     )
                     driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", postuler_btn)
-                    time.sleep(0.5)
                     
                     try:
                         postuler_btn.click()
@@ -280,25 +882,24 @@ class FranceTravailCollector:
                 except Exception as e:
                     if attempt == 2:
                         logger.error(f"❌ Impossible de cliquer sur Postuler: {e}")
-                    time.sleep(1)
             
             if not postuler_clicked:
                 return None
             
-            time.sleep(3)
-            
-            # ÉTAPE 4: Attendre le menu
+            # ÉTAPE 4: Attendre le menu et ses liens
             try:
                 WebDriverWait(driver, 10).until(
                     EC.visibility_of_element_located((By.ID, "contactZone"))
                 )
-                time.sleep(2)
+                WebDriverWait(driver, 5).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, self.APPLY_LINKS_SELECTOR))
+                )
             except TimeoutException:
                 logger.error("❌ Menu non chargé")
                 return None
             
             # ÉTAPE 5: Trouver le lien Météo Jobs
-            links = driver.find_elements(By.CSS_SELECTOR, "#contactZone a, .dropdown-apply a")
+            links = driver.find_elements(By.CSS_SELECTOR, self.APPLY_LINKS_SELECTOR)
             
             meteojob_link = None
             for link in links:
@@ -310,60 +911,52 @@ class FranceTravailCollector:
                     break
             
             if not meteojob_link:
-                logger.info(f"ℹ️ Pas de lien Météo Jobs pour {offer_id} - skip")
-                return None  # Le finally fermera le driver
+                logger.info("ℹ️ Pas de lien Météo Jobs pour %s - skip", offer_id)
+                return None  # Le finally ferme les onglets, le driver est conservé
             
             # ÉTAPE 6: Cliquer sur Météo Jobs
+            handles_before = len(driver.window_handles)
             try:
                 meteojob_link.click()
             except:
                 driver.execute_script("arguments[0].click();", meteojob_link)
             
-            time.sleep(4)
-            
-            # Basculer vers nouvelle fenêtre
-            if len(driver.window_handles) > 1:
+            # Basculer vers nouvelle fenêtre dès qu'elle s'ouvre (sinon même onglet)
+            try:
+                WebDriverWait(driver, 10).until(lambda d: len(d.window_handles) > handles_before)
                 driver.switch_to.window(driver.window_handles[-1])
+            except TimeoutException:
+                pass
             
-            # ÉTAPE 7: Cookies Météo Jobs (TarteAuCitron)
+            # Attendre l'affichage du nom d'entreprise (sélecteurs de l'étape 8)
             try:
-                accept_btn = WebDriverWait(driver, 5).until(
-                    EC.element_to_be_clickable((By.ID, "tarteaucitronPersonalize2"))
-                )
-                accept_btn.click()
-                time.sleep(2)
+                WebDriverWait(driver, 10).until(EC.presence_of_element_located((
+                    By.CSS_SELECTOR, self.METEOJOB_COMPANY_ANY_SELECTOR
+                )))
             except TimeoutException:
-                try:
-                    close_btn = WebDriverWait(driver, 3).until(
-                        EC.element_to_be_clickable((By.ID, "tarteaucitronCloseCross"))
-                    )
-                    close_btn.click()
-                    time.sleep(2)
-                except:
-                    pass
+                pass
             
-            time.sleep(2)
+            # ÉTAPE 7: Cookies Météo Jobs (TarteAuCitron) fermés seulement s'ils
+            # sont déjà affichés : le bandeau n'empêche pas la lecture du DOM
+            for button_id in ("tarteaucitronPersonalize2", "tarteaucitronCloseCross"):
+                buttons = driver.find_elements(By.ID, button_id)
+                if buttons and buttons[0].is_displayed():
+                    try:
+                        buttons[0].click()
+                    except Exception:
+                        pass
+                    break
             
             # ÉTAPE 8: Extraire company_name
-            selectors = [
-                ("cc-font-weight-headings", By.CSS_SELECTOR, "h1.cc-font-size-base span.cc-font-weight-headings"),
-                ("h1 company span", By.CSS_SELECTOR, "h1 span.cc-font-weight-headings"),
-                ("company-name class", By.CSS_SELECTOR, ".offer-company-name"),
-                ("h2.company", By.CSS_SELECTOR, "h2.company, h2[class*='company']"),
-            ]
-            
-            for name, by_type, selector in selectors:
+            for name, selector in self.METEOJOB_COMPANY_SELECTORS:
                 try:
-                    elements = driver.find_elements(by_type, selector)
+                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
                     if elements:
                         for elem in elements[:2]:
-                            text = elem.text.strip()
-                            if text and 3 < len(text) < 100:
-                                if text.lower() not in ['entreprise', 'company', 'voir', 'postuler', 
-                                                         'recruteurs', 'se connecter', 'rechercher']:
-                                    company_name = text
-                                    logger.info(f"✅ Company trouvée via {name}: {company_name}")
-                                    break
+                            company_name = self._clean_company_name(elem.text)
+                            if company_name:
+                                logger.info("✅ Company trouvée via %s: %s", name, company_name)
+                                break
                     if company_name:
                         break
                 except:
@@ -373,32 +966,64 @@ class FranceTravailCollector:
             logger.error(f"❌ Erreur extraction Météo Jobs: {e}")
         
         finally:
-            # 🔥 CRITIQUE : Fermeture propre du driver pour éviter les retries urllib3
-            if driver:
-                try:
-                    # Fermer tous les onglets ouverts
-                    while len(driver.window_handles) > 0:
-                        driver.close()
-                        if len(driver.window_handles) > 0:
-                            driver.switch_to.window(driver.window_handles[0])
-                except:
-                    pass  # Ignorer les erreurs de fermeture d'onglets
-                
-                try:
-                    driver.quit()
-                except:
-                    pass  # Ignorer les erreurs de quit
-                
-                # Petite pause pour laisser le driver se fermer complètement
-                time.sleep(0.3)
+            # Driver conservé pour l'offre suivante : seuls les onglets ouverts sont fermés
+            self._reset_driver_tabs()
         
         return company_name
     
+    def _load_cached_token(self) -> bool:
+        """Reprendre le token OAuth2 du cache disque s'il est encore valide"""
+        try:
+            with open(self.TOKEN_CACHE_PATH, encoding="utf-8") as f:
+                data = json.load(f)
+            expires_at = datetime.fromisoformat(data["expires_at"])
+        except (OSError, ValueError, KeyError):
+            return False
+        
+        # Token d'un autre client ou expiré
+        if data.get("client_id") != self.client_id or datetime.now() >= expires_at:
+            return False
+        
+        self.access_token = data["access_token"]
+        self.token_expires_at = expires_at
+        return True
+    
+    def _save_cached_token(self) -> None:
+        """Écrire le token OAuth2 sur disque (écriture atomique, mode 0600)"""
+        path = self.TOKEN_CACHE_PATH
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({
+                    "client_id": self.client_id,
+                    "access_token": self.access_token,
+                    "expires_at": self.token_expires_at.isoformat()
+                }, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"⚠️ Cache du token non écrit: {e}")
+    
     def authenticate(self) -> str:
-        """Obtenir un token OAuth2"""
+        """Obtenir un token OAuth2 (mémoire, puis cache disque, puis API)"""
+        if self.access_token and self.token_expires_at and datetime.now() < self.token_expires_at:
+            return self.access_token
+        
+        # Un seul renouvellement quand plusieurs threads de pagination arrivent ensemble
+        with self._auth_lock:
+            return self._refresh_token()
+    
+    def _refresh_token(self) -> str:
+        """Renouveler le token (appelé sous _auth_lock)"""
         if self.access_token and self.token_expires_at and datetime.now() < self.token_expires_at:
             return self.access_token
         
+        if self._load_cached_token():
+            logger.info("🔐 Token OAuth2 repris du cache disque")
+            return self.access_token
+        
         logger.info("🔐 Authentification OAuth2...")
         
         response = self.session.post(
@@ -413,11 +1038,12 @@ class FranceTravailCollector:
             timeout=30
         )
         response.raise_for_status()
-        data = response.json()
+        data = _json_loads(response.content)
         
         self.access_token = data["access_token"]
         expires_in = int(data.get("expires_in", 1500))
         self.token_expires_at = datetime.now() + timedelta(seconds=max(60, expires_in - 60))
+        self._save_cached_token()
         
         logger.info(f"✅ Token obtenu (expires in {expires_in}s)")
         return self.access_token
@@ -429,74 +1055,213 @@ class FranceTravailCollector:
         
         response = self.session.get(self.API_URL, headers=headers, params=params, timeout=30)
         
+        # Rate limit (429) déjà relancé par l'adaptateur (Retry-After respecté)
         if response.status_code == 204:  # Aucun résultat
             return []
         
-        if response.status_code == 429:  # Rate limit
-            logger.warning("⚠️ Rate limit atteint, pause 5s...")
-            time.sleep(5)
-            return self.search_page(params)  # Retry
-        
         response.raise_for_status()
-        data = response.json()
+        data = _json_loads(response.content)
         
         return data.get("resultats", [])
     
+    def _fetch_range(self, grand_domaine: str, start: int, end: int) -> List[Dict]:
+        """Récupérer une page (range start-end), liste vide en cas d'erreur"""
+        params = {
+            "range": f"{start}-{end}",
+            "grandDomaine": grand_domaine,
+            "sort": "1"  # Par date de création
+        }
+        
+        logger.info("  📡 Range %s-%s | Grand domaine: %s", start, end, grand_domaine)
+        
+        try:
+            items = self.search_page(params)
+        except Exception as e:
+            logger.error("  ❌ Erreur range %s-%s: %s", start, end, e)
+            return []
+        
+        # Pas de pause : le rate limit (429) est géré par le Retry de la session
+        return items
+    
     def search_with_pagination(
         self,
         grand_domaine: str,
         max_index: int = 3149,
         page_size: int = 150
     ) -> List[Dict]:
-        """Collecter avec pagination (0..max_index)"""
-        all_results = []
-        start = 0
+        """
+        Collecter avec pagination (0..max_index)
         
-        while start <= max_index:
-            end = min(start + page_size - 1, max_index)
-            
-            params = {
-                "range": f"{start}-{end}",
-                "grandDomaine": grand_domaine,
-                "sort": "1"  # Par date de création
-            }
-            
-            logger.info(f"  📡 Range {start}-{end} | Grand domaine: {grand_domaine}")
-            
-            try:
-                items = self.search_page(params)
+        La première page est lue seule : si elle est incomplète, il n'y a
+        rien d'autre à chercher. Les pages suivantes sont récupérées en
+        parallèle sur la session partagée (ordre des ranges conservé).
+        """
+        ranges = [
+            (start, min(start + page_size - 1, max_index))
+            for start in range(0, max_index + 1, page_size)
+        ]
+        
+        all_results = self._fetch_range(grand_domaine, *ranges[0])
+        if len(all_results) < ranges[0][1] - ranges[0][0] + 1 or len(ranges) == 1:
+            return all_results
+        
+        with ThreadPoolExecutor(max_workers=min(self.PAGINATION_WORKERS, len(ranges) - 1)) as executor:
+            pages = executor.map(lambda bounds: self._fetch_range(grand_domaine, *bounds), ranges[1:])
+            for items in pages:
                 all_results.extend(items)
-                
-                if len(items) == 0:
-                    break  # Plus de résultats
-                
-                logger.info(f"     ✅ {len(items)} offres | Total: {len(all_results)}")
-                
-            except Exception as e:
-                logger.error(f"  ❌ Erreur: {e}")
-                break
-            
-            start += page_size
-            time.sleep(0.2)  # Rate limiting
         
+        logger.info("     ✅ %s offres | %s pages", len(all_results), len(ranges))
         return all_results
     
+    @classmethod
+    def _data_ai_automaton(cls):
+        """Automate Aho-Corasick des mots-clés Data/IA (construit une seule fois)"""
+        if cls._DATA_AI_AUTOMATON is None:
+            automaton = ahocorasick.Automaton()
+            for keyword in cls.DATA_AI_KEYWORDS:
+                automaton.add_word(keyword, len(keyword))
+            automaton.make_automaton()
+            cls._DATA_AI_AUTOMATON = automaton
+        return cls._DATA_AI_AUTOMATON
+    
+    def _has_data_ai_keyword(self, text_lower: str) -> bool:
+        """
+        Chercher un mot-clé Data/IA en une seule passe (Aho-Corasick)
+        
+        Les occurrences à l'intérieur d'un mot sont ignorées, comme avec
+        les \\b de DATA_AI_REGEX (ex: "r" dans "recherche").
+        """
+        last = len(text_lower) - 1
+        for end, length in self._data_ai_automaton().iter(text_lower):
+            start = end - length + 1
+            if (start == 0 or not _is_word_char(text_lower[start - 1])) and \
+                    (end == last or not _is_word_char(text_lower[end + 1])):
+                return True
+        return False
+    
+    def _offer_text(self, offer: Dict) -> str:
+        """
+        Texte de l'offre en minuscules (titre, description, libellés ROME)
+        
+        Construit une seule fois puis mémorisé dans l'offre brute sous
+        "_atlas_text" (absent des offres normalisées).
+        """
+        text = offer.get("_atlas_text")
+        if text is None:
+            text = offer["_atlas_text"] = " ".join(
+                str(value).lower() for value in (
+                    offer.get("intitule"),
+                    offer.get("description"),
+                    offer.get("romeLibelle"),
+                    offer.get("appellationlibelle")
+                ) if value
+            )
+        return text
+    
     def is_data_ai_offer(self, offer: Dict) -> bool:
         """Vérifier si l'offre concerne Data/IA"""
-        text = " ".join([
-            str(offer.get("intitule", "") or ""),
-            str(offer.get("description", "") or ""),
-            str(offer.get("romeLibelle", "") or ""),
-            str(offer.get("appellationlibelle", "") or "")
-        ])
+        text_lower = self._offer_text(offer)
+        
+        # Raccourci : la plupart des offres retenues contiennent un marqueur évident
+        if self._FAST_KEYWORDS_REGEX.search(text_lower):
+            return True
+        
+        # Tous les mots-clés en une passe, regex en fallback sans pyahocorasick
+        if AHOCORASICK_AVAILABLE:
+            match = self._has_data_ai_keyword(text_lower)
+        else:
+            match = self.DATA_AI_REGEX.search(text_lower)
         
         # Debug log pour voir ce qui est filtré
-        match = self.DATA_AI_REGEX.search(text)
-        if not match:
-            logger.debug(f"❌ Filtré: {offer.get('intitule', '')[:50]}")
+        if not match and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("❌ Filtré: %s", (offer.get('intitule') or '')[:50])
         
         return bool(match)
     
+    def filter_data_ai_offers(self, raw_offers: List[Dict]) -> List[Dict]:
+        """
+        Garder les offres Data/IA d'un lot
+        
+        Avec pyahocorasick, chaque offre est testée par is_data_ai_offer
+        (une passe linéaire). Sinon la regex est appliquée à tout le lot
+        via pandas (boucle en C), à défaut offre par offre.
+        
+        Args:
+            raw_offers: Offres brutes de l'API
+        
+        Returns:
+            Offres retenues (ordre conservé)
+        """
+        if AHOCORASICK_AVAILABLE or not PANDAS_AVAILABLE or not raw_offers:
+            return [o for o in raw_offers if self.is_data_ai_offer(o)]
+        
+        texts = pd.Series([self._offer_text(o) for o in raw_offers], dtype=object)
+        mask = texts.str.contains(self.DATA_AI_REGEX, na=False)
+        
+        return [o for o, keep in zip(raw_offers, mask.tolist()) if keep]
+    
+    def _get_offer_cache(self) -> Optional[sqlite3.Connection]:
+        """Connexion au cache SQLite des offres (None si indisponible)"""
+        if self._offer_cache is None:
+            try:
+                self.OFFER_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+                self._offer_cache = sqlite3.connect(self.OFFER_CACHE_PATH)
+                self._offer_cache.execute(self.CREATE_OFFER_CACHE_SQL)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"⚠️ Cache d'offres indisponible: {e}")
+                self._offer_cache = None
+        return self._offer_cache
+    
+    def get_cached_offers(self, raw_offers: List[Dict]) -> Dict[str, Dict]:
+        """
+        Reprendre du cache les offres inchangées depuis leur dernière normalisation
+        
+        Une offre est inchangée si son dateActualisation est identique ; celles
+        normalisées sans Météo Jobs ne servent pas quand Selenium est activé.
+        
+        Returns:
+            {id: offre normalisée} pour les offres trouvées
+        """
+        cache = self._get_offer_cache()
+        if cache is None:
+            return {}
+        
+        collected_at = datetime.utcnow().isoformat()
+        cached = {}
+        for raw_offer in raw_offers:
+            row = cache.execute(self.SELECT_CACHED_OFFER_SQL, (
+                raw_offer["id"], raw_offer.get("dateActualisation"), int(self.use_selenium)
+            )).fetchone()
+            if row:
+                offer = _json_loads(row[0])
+                offer["collected_at"] = collected_at
+                cached[raw_offer["id"]] = offer
+        
+        return cached
+    
+    def cache_offers(self, pairs: List[tuple]) -> None:
+        """
+        Enregistrer des offres normalisées dans le cache
+        
+        Args:
+            pairs: Tuples (offre brute, offre normalisée)
+        """
+        cache = self._get_offer_cache()
+        if cache is None or not pairs:
+            return
+        
+        # Extraction Météo Jobs en échec (company_name absent) : enregistrée
+        # comme non enrichie pour être retentée par la prochaine collecte Selenium
+        with cache:
+            cache.executemany(self.UPSERT_CACHED_OFFER_SQL, [
+                (
+                    raw["id"], raw.get("dateActualisation"),
+                    int(self.use_selenium and bool(offer.get("company_name"))),
+                    _json_dumps(offer),
+                )
+                for raw, offer in pairs
+            ])
+    
     def normalize_offer(self, raw_offer: Dict) -> Dict:
         """Normaliser une offre au format ATLAS"""
         lieu = raw_offer.get("lieuTravail", {}) or {}
@@ -506,53 +1271,35 @@ class FranceTravailCollector:
         external_id = raw_offer.get("id")
         company_name = entreprise.get("nom")
         
-        # 🆕 Si company_name vide, tenter extraction via Météo Jobs (si activé)
-        if not company_name and external_id and SELENIUM_AVAILABLE and self.use_selenium:
-            logger.info(f"🔍 Company_name vide pour {external_id}, tentative Météo Jobs...")
+        # Company_name déjà extrait par HTTP (cf. prefetch_meteojob_companies)
+        if not company_name and external_id in self._meteojob_companies:
+            company_name = self._meteojob_companies[external_id]
+        # 🆕 Sinon, tenter extraction via Météo Jobs avec Selenium (si activé)
+        elif not company_name and external_id and SELENIUM_AVAILABLE and self.use_selenium:
+            logger.info("🔍 Company_name vide pour %s, tentative Météo Jobs...", external_id)
             try:
                 extracted_company = self.extract_company_from_meteojob(external_id, headless=True)
                 if extracted_company:
                     company_name = extracted_company
-                    logger.info(f"✅ Company extraite via Météo Jobs: {company_name}")
+                    logger.info("✅ Company extraite via Météo Jobs: %s", company_name)
                 # Si None, l'info a déjà été loggée dans extract_company_from_meteojob
             except Exception as e:
-                logger.error(f"❌ Erreur extraction Météo Jobs pour {external_id}: {e}")
+                logger.error("❌ Erreur extraction Météo Jobs pour %s: %s", external_id, e)
         elif not company_name and not self.use_selenium:
-            logger.debug(f"⏭️ Company_name vide pour {external_id} - Selenium désactivé")
-        
-        return {
-            "external_id": external_id,
-            "title": raw_offer.get("intitule"),
-            "description": raw_offer.get("description"),
-            "company_name": company_name,
-            "contract_type": raw_offer.get("typeContratLibelle") or raw_offer.get("typeContrat"),
-            "salary_text": salaire.get("libelle"),
-            "location_city": lieu.get("libelle"),
-            "location_postal_code": lieu.get("codePostal"),
-            "location_insee": lieu.get("commune"),
-            "location_lat": lieu.get("latitude"),
-            "location_lon": lieu.get("longitude"),
-            "romeCode": raw_offer.get("romeCode"),
-            "romeLibelle": raw_offer.get("romeLibelle"),
-            "published_date": raw_offer.get("dateCreation"),
-            "updated_date": raw_offer.get("dateActualisation"),
-            "url": f"https://candidat.francetravail.fr/offres/recherche/detail/{external_id}" if external_id else None,
-            "source": "france_travail",
-            "collected_at": datetime.utcnow().isoformat()
-        }
-    
-    def dedupe_by_id(self, offers: List[Dict]) -> List[Dict]:
-        seen = set()
-        unique_offers = []
-
-        for offer in offers:
-            offer_id = offer.get("id")
-            if offer_id and offer_id not in seen:
-                seen.add(offer_id)
-                unique_offers.append(offer)
-
-        return unique_offers
-
+            logger.debug("⏭️ Company_name vide pour %s - Selenium désactivé", external_id)
+        
+        # Champs copiés tels quels : lookups via map(dict.get) sur les tables de clés
+        offer = dict(zip(self._OFFER_KEYS, map(raw_offer.get, self._OFFER_RAW_KEYS)))
+        offer.update(zip(self._LOCATION_KEYS, map(lieu.get, self._LOCATION_RAW_KEYS)))
+        
+        offer["company_name"] = company_name
+        offer["contract_type"] = raw_offer.get("typeContratLibelle") or raw_offer.get("typeContrat")
+        offer["salary_text"] = salaire.get("libelle")
+        offer["url"] = self.DETAIL_URL.format(offer_id=external_id) if external_id else None
+        offer["source"] = "france_travail"
+        offer["collected_at"] = datetime.utcnow().isoformat()
+        
+        return offer
     
     def collect(self, max_offers: int = 150) -> List[Dict]:
         """
@@ -568,7 +1315,8 @@ class FranceTravailCollector:
         logger.info("🚀 COLLECTE FRANCE TRAVAIL")
         logger.info("=" * 70)
         
-        raw_offers = []
+        # Offres indexées par id : dédupliquées au fil des grands domaines
+        offers_by_id: Dict[str, Dict] = {}
         
         # Collecter depuis chaque grand domaine
         for grand_domaine in self.GRAND_DOMAINES:
@@ -579,13 +1327,12 @@ class FranceTravailCollector:
                 max_index=min(3149, max_offers)
             )
             
-            raw_offers.extend(offers)
+            offers_by_id.update((o["id"], o) for o in offers if o.get("id"))
             
-            if len(raw_offers) >= max_offers:
+            if len(offers_by_id) >= max_offers:
                 break
         
-        # Dédupliquer
-        raw_offers = self.dedupe_by_id(raw_offers)
+        raw_offers = list(offers_by_id.values())
         logger.info(f"\n📦 Total brut (dédupliqué): {len(raw_offers)} offres")
         
         # Debug: afficher quelques titres
@@ -595,7 +1342,7 @@ class FranceTravailCollector:
                 logger.info(f"  {i}. {o.get('intitule', 'N/A')[:60]}")
         
         # Filtrer Data/IA
-        filtered_offers = [o for o in raw_offers if self.is_data_ai_offer(o)]
+        filtered_offers = self.filter_data_ai_offers(raw_offers)
         logger.info(f"\n🧠 Après filtre Data/IA: {len(filtered_offers)} offres")
         
         # Si aucune offre après filtre, désactiver le filtre
@@ -603,8 +1350,27 @@ class FranceTravailCollector:
             logger.warning("⚠️ Aucune offre ne passe le filtre Data/IA, désactivation du filtre...")
             filtered_offers = raw_offers[:max_offers]
         
+        selected_offers = filtered_offers[:max_offers]
+        
+        # Offres inchangées depuis une collecte précédente : ni Météo Jobs ni normalisation
+        cached_offers = self.get_cached_offers(selected_offers)
+        new_offers = [o for o in selected_offers if o["id"] not in cached_offers]
+        if cached_offers:
+            logger.info(f"\n💾 {len(cached_offers)} offres reprises du cache")
+        
+        # company_name manquants : extraction HTTP concurrente, puis navigateur
+        # (Playwright asynchrone, Selenium en parallèle pour les offres restantes)
+        if self.use_selenium:
+            self.prefetch_meteojob_companies(new_offers)
+            self.extract_companies_playwright(new_offers)
+            self.extract_companies_selenium(new_offers)
+        
         # Normaliser
-        normalized_offers = [self.normalize_offer(o) for o in filtered_offers[:max_offers]]
+        normalized_by_id = {o["id"]: self.normalize_offer(o) for o in new_offers}
+        self.cache_offers([(o, normalized_by_id[o["id"]]) for o in new_offers])
+        
+        normalized_by_id.update(cached_offers)
+        normalized_offers = [normalized_by_id[o["id"]] for o in selected_offers]
         
         # 🚫 FILTRE CRITIQUE: Exclure les offres sans company_name
         before_filter = len(normalized_offers)
@@ -624,12 +1390,32 @@ class FranceTravailCollector:
         return normalized_offers
 
 
+# Collecteur du processus worker Selenium (cf. extract_companies_selenium)
+_worker_collector: Optional[FranceTravailCollector] = None
+
+
+def _init_meteojob_worker(slots) -> None:
+    """Initialiser un worker du pool Selenium (driver créé au premier appel)"""
+    global _worker_collector
+    with slots.get_lock():
+        slot = slots.value
+        slots.value += 1
+    
+    _worker_collector = FranceTravailCollector(use_selenium=True)
+    _worker_collector.chrome_profile = f"worker-{slot}"
+    # atexit n'est pas exécuté dans les workers multiprocessing : Finalize quitte Chrome
+    multiprocessing.util.Finalize(_worker_collector, _worker_collector.close, exitpriority=10)
+
+
+def _scrape_meteojob_company(offer_id: str) -> Optional[str]:
+    """Extraire le company_name d'une offre avec le driver du worker"""
+    return _worker_collector.extract_company_from_meteojob(offer_id, headless=True)
+
+
 # ============================================================================
 # TEST STANDALONE
 # ============================================================================
 if __name__ == "__main__":
-    import json
-    
     print("\n🧪 TEST FRANCE TRAVAIL COLLECTOR\n")
     
     collector = FranceTravailCollector()
@@ -9,18 +9,40 @@ Usage:
     matcher = GeoMatcher()
     commune_id = matcher.find_commune("Paris", "75001")
     
+    # Ou instance partagée par le processus (un seul engine / pool)
+    matcher = get_default_matcher()
+    
     # Ou avec un dictionnaire d'offre
     commune_id = matcher.find_commune_from_offer(offer)
 """
 
 import re
 import logging
-from typing import Optional, Dict
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from typing import Optional, Dict, Iterable, List, Sequence, Tuple
 from sqlalchemy import create_engine, text
 import os
 from dotenv import load_dotenv
 from pathlib import Path
 
+# NumPy optionnel : recherche vectorisée (np.searchsorted) dans batch_lookup
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Redis optionnel : cache partagé entre processus / workers du pipeline
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
 # Charger .env depuis le dossier parent si nécessaire
 env_path = Path(__file__).parent.parent / '.env'
 if env_path.exists():
@@ -28,32 +50,369 @@ if env_path.exists():
 else:
     load_dotenv()
 
+# URL par défaut, résolue une seule fois à l'import
+DATABASE_URL = os.getenv('DATABASE_URL')
+
 logger = logging.getLogger("GeoMatcher")
 
+# Expressions régulières du nettoyage des noms de ville (compilées une fois)
+_DEPT_PREFIX_RE = re.compile(r'^\d{2,3}\s*-\s*')
+_ARRDT_RE = re.compile(r'^(.+?)\s+(\d{1,2})[eèr]{1,2}\s+arrondissement', re.IGNORECASE)
+# Saint-/St- → "ST ", Sainte-/Ste- → "STE " (le "e" capturé est conservé)
+_SAINT_RE = re.compile(r'\bS(?:ain)?t(e?)-', re.IGNORECASE)
+_WS_RE = re.compile(r'\s+')
+
+# Accents retirés, identiques à la colonne générée nom_commune_normalise
+# (database/migration_communes_nom_normalise.sql)
+_ACCENTS = 'àâäéèêëïîôùûüÿçÀÂÄÉÈÊËÏÎÔÙÛÜŸÇ'
+_ACCENTS_ASCII = 'aaaeeeeiiouuuycAAAEEEEIIOUUUYC'
+
+# Table str.translate : accents + tirets et apostrophes remplacés par des espaces
+_ACCENT_TABLE = str.maketrans(_ACCENTS + "-'", _ACCENTS_ASCII + "  ")
+
+# Requêtes unitaires de find_commune_id préparées côté serveur, une fois par
+# connexion du pool : PostgreSQL ne les réanalyse ni ne les replanifie plus
+# STRATÉGIE 3 : similarité trigramme (pg_trgm, index GIN sur
+# f_unaccent(lower(nom_commune)), database/migration_communes_trigram.sql)
+_SQL_FUZZY = """
+    SELECT commune_id FROM ref_communes_france
+    WHERE f_unaccent(lower(nom_commune)) % $1
+    ORDER BY (code_postal = $2) DESC,
+             similarity(f_unaccent(lower(nom_commune)), $1) DESC,
+             population DESC NULLS LAST
+    LIMIT 1
+"""
+
+_PREPARE_FUZZY = f"PREPARE geo_fuzzy (text, text) AS {_SQL_FUZZY}"
+
+# STRATÉGIES 1, 2 puis 3 en un seul aller-retour (index non chargé) :
+# les branches de l'UNION ALL sont évaluées dans l'ordre et le LIMIT 1
+# externe arrête l'exécution dès la première ligne trouvée
+_PREPARE_COMBINED = f"""
+    PREPARE geo_combined (text, text) AS
+    SELECT commune_id FROM (
+        -- STRATÉGIE 1 : code postal + nom normalisé (index composite)
+        (SELECT commune_id FROM ref_communes_france
+         WHERE $2 <> '' AND code_postal = $2 AND nom_commune_normalise = $1
+         LIMIT 1)
+        UNION ALL
+        -- STRATÉGIE 2 : nom normalisé seul, commune la plus peuplée
+        (SELECT commune_id FROM ref_communes_france
+         WHERE nom_commune_normalise = $1
+         ORDER BY population DESC NULLS LAST
+         LIMIT 1)
+        UNION ALL
+        -- STRATÉGIE 3 : recherche approchée (trigrammes)
+        ({_SQL_FUZZY})
+    ) AS strategies
+    LIMIT 1
+"""
+
+_PREPARED_STATEMENTS = (_PREPARE_COMBINED, _PREPARE_FUZZY)
+_PREPARED_INFO_KEY = "geo_matcher_prepared"
+
+# Référentiel complet chargé en mémoire (plus peuplées d'abord)
+_SQL_LOAD_INDEX = """
+    SELECT commune_id, code_postal, nom_commune_normalise
+    FROM ref_communes_france
+    ORDER BY population DESC NULLS LAST
+"""
+
+# Fiche complète d'une commune (colonnes dans l'ordre de CommuneInfo)
+_SQL_COMMUNE_INFO = """
+    SELECT 
+        commune_id, code_insee, code_postal,
+        nom_commune, nom_departement, nom_region,
+        code_departement, code_region,
+        latitude, longitude, population
+    FROM ref_communes_france 
+    WHERE commune_id = :id
+"""
+
+# Stratégies 1 et 2 de find_commune_id appliquées à toute une liste de villes
+_SQL_FIND_COMMUNES_BULK = """
+    SELECT q.cache_key,
+           COALESCE(
+               (SELECT c.commune_id FROM ref_communes_france c
+                WHERE q.postal <> ''
+                  AND c.code_postal = q.postal
+                  AND c.nom_commune_normalise = q.city_norm
+                LIMIT 1),
+               (SELECT c.commune_id FROM ref_communes_france c
+                WHERE c.nom_commune_normalise = q.city_norm
+                ORDER BY c.population DESC NULLS LAST
+                LIMIT 1)
+           ) AS commune_id
+    FROM unnest(
+        CAST(:keys AS text[]), CAST(:norms AS text[]), CAST(:postals AS text[])
+    ) AS q(cache_key, city_norm, postal)
+"""
+
+
+def _normalize(city: str) -> str:
+    """
+    Minuscules, sans accents, tirets ni apostrophes, espaces simples
+    
+    Même résultat que la colonne nom_commune_normalise ; les noms ASCII
+    (cas le plus courant) évitent la table de traduction.
+    """
+    if city.isascii():
+        city = city.replace('-', ' ').replace("'", ' ')
+    else:
+        city = city.translate(_ACCENT_TABLE)
+    return " ".join(city.lower().split())
+
+
+def _sorted_lookup(keys, values, queries):
+    """
+    Recherche dichotomique vectorisée de queries dans keys (trié)
+    
+    Returns:
+        values correspondantes, -1 pour les clés absentes
+    """
+    if not len(keys):
+        return np.full(len(queries), -1, dtype=np.int64)
+    idx = np.searchsorted(keys, queries)
+    idx_clipped = np.minimum(idx, len(keys) - 1)
+    mask = (idx < len(keys)) & (keys[idx_clipped] == queries)
+    return np.where(mask, values[idx_clipped], -1)
+
+
+@dataclass(slots=True, frozen=True)
+class CommuneInfo:
+    """
+    Informations d'une commune du référentiel (retour de get_commune_info)
+    
+    Accès par attribut (info.nom_commune) ou par clé comme l'ancien
+    dictionnaire (info['nom_commune']).
+    """
+    commune_id: int
+    code_insee: str
+    code_postal: str
+    nom_commune: str
+    nom_departement: str
+    nom_region: str
+    code_departement: str
+    code_region: str
+    latitude: Optional[float]
+    longitude: Optional[float]
+    population: Optional[int]
+    
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def to_dict(self) -> Dict:
+        """Dictionnaire des champs (sérialisation JSON)"""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
 
 class GeoMatcher:
     """
     Classe pour matcher les localisations scrapées avec ref_communes_france
     """
     
-    def __init__(self, db_url: str = None):
+    # Nombre maximal de (ville, code postal) gardés dans le cache LRU
+    CACHE_SIZE = 65536
+    
+    # Nombre maximal de communes introuvables mémorisées (cache négatif)
+    MISS_CACHE_SIZE = 65536
+    
+    # Pool de connexions SQLAlchemy
+    POOL_SIZE = 10
+    POOL_MAX_OVERFLOW = 20
+    
+    # Cache partagé Redis (second niveau, après le LRU du processus)
+    REDIS_PREFIX = "atlas:geo:"
+    REDIS_TTL = 86400  # commune trouvée : 1 jour
+    REDIS_MISS_TTL = 3600  # commune introuvable : 1 heure
+    REDIS_MISS = ""  # valeur stockée pour une commune introuvable
+    
+    def __init__(self, db_url: str = None, preload_index: bool = True, redis_url: str = None):
         """
         Initialiser le matcher
         
         Args:
             db_url: URL de connexion PostgreSQL (ou depuis .env)
+            preload_index: Charger ref_communes_france en mémoire (stratégies
+                1 et 2 résolues sans requête SQL)
+            redis_url: URL Redis du cache partagé (ou REDIS_URL depuis .env,
+                désactivé si absent)
         """
-        self.db_url = db_url or os.getenv('DATABASE_URL')
+        self.db_url = db_url or DATABASE_URL
         if not self.db_url:
             raise ValueError("❌ DATABASE_URL requis (dans .env ou paramètre)")
         
-        self.engine = create_engine(self.db_url)
+        self.engine = create_engine(
+            self.db_url,
+            pool_size=self.POOL_SIZE,
+            max_overflow=self.POOL_MAX_OVERFLOW,
+            pool_pre_ping=True,
+        )
+        
+        # Connexion partagée ouverte par session(), propre à chaque thread
+        self._local = threading.local()
         
-        # Cache pour éviter les requêtes répétées
-        self.cache = {}
+        # Cache LRU borné pour éviter les requêtes répétées
+        self._lookup_cached = lru_cache(maxsize=self.CACHE_SIZE)(self._lookup)
+        self.cache_info = self._lookup_cached.cache_info
+        
+        # Cache négatif par nom normalisé : (nom normalisé, code postal) introuvables
+        self._misses = set()
+        
+        # Cache partagé Redis (optionnel)
+        self._redis = None
+        redis_url = redis_url or os.getenv('REDIS_URL')
+        if redis_url and REDIS_AVAILABLE:
+            self._redis = redis.Redis.from_url(redis_url)
+        elif redis_url:
+            logger.warning("⚠️ redis non installé - cache partagé désactivé")
+        
+        # Index en mémoire du référentiel (~35k communes)
+        self._by_postal_name: Dict[Tuple[str, str], int] = {}
+        self._by_name: Dict[str, int] = {}
+        self._index_loaded = False
+        if preload_index:
+            self._load_index()
         
         logger.info("✅ GeoMatcher initialisé")
     
+    @contextmanager
+    def session(self):
+        """
+        Partage une connexion entre toutes les recherches du bloc
+        
+        Examples:
+            >>> with matcher.session():
+            ...     ids = [matcher.find_commune_id(c, cp) for c, cp in pairs]
+        """
+        with self.engine.connect() as conn:
+            self._local.conn = conn
+            try:
+                yield conn
+            finally:
+                self._local.conn = None
+    
+    @contextmanager
+    def _connect(self):
+        """Connexion de session() si ouverte dans ce thread, sinon une du pool"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            with self.engine.connect() as conn:
+                yield conn
+            return
+        
+        try:
+            yield conn
+        except Exception:
+            # Transaction partagée inutilisable après une erreur SQL
+            conn.rollback()
+            raise
+    
+    def _load_index(self):
+        """
+        Charge ref_communes_france dans deux dictionnaires
+        
+        - (code postal, nom normalisé) → commune_id (stratégie 1)
+        - nom normalisé → commune_id la plus peuplée (stratégie 2)
+        
+        En cas d'échec, find_commune_id retombe sur les requêtes SQL.
+        """
+        try:
+            with self._connect() as conn:
+                rows = conn.execute(text(_SQL_LOAD_INDEX)).fetchall()
+        except Exception as e:
+            logger.warning("⚠️ Index des communes non chargé, recherche SQL: %s", e)
+            return
+        
+        by_postal_name = {}
+        by_name = {}
+        for commune_id, code_postal, nom_norm in rows:
+            # Lignes triées par population : la première occurrence est conservée
+            by_postal_name.setdefault((code_postal or '', nom_norm), commune_id)
+            by_name.setdefault(nom_norm, commune_id)
+        
+        self._by_postal_name = by_postal_name
+        self._by_name = by_name
+        self._index_loaded = True
+        
+        if NUMPY_AVAILABLE:
+            # Mêmes index en tableaux triés contigus pour batch_lookup
+            names = sorted(by_name)
+            self._names_norm = np.array(names, dtype=str)
+            self._name_ids = np.array([by_name[n] for n in names], dtype=np.int64)
+            postal_keys = sorted(by_postal_name)
+            self._postal_keys = np.array([f"{cp}|{n}" for cp, n in postal_keys], dtype=str)
+            self._postal_ids = np.array([by_postal_name[k] for k in postal_keys], dtype=np.int64)
+        logger.info("📍 Index des communes chargé: %d noms, %d lignes", len(by_name), len(rows))
+    
+    def _find_in_index(self, city_normalized: str, postal_code: str = None) -> Optional[int]:
+        """
+        Stratégies 1 et 2 sur l'index en mémoire
+        
+        Args:
+            city_normalized: Nom normalisé (clean_and_normalize)
+            postal_code: Code postal (optionnel)
+        
+        Returns:
+            commune_id ou None
+        """
+        commune_id = None
+        if postal_code:
+            commune_id = self._by_postal_name.get((postal_code, city_normalized))
+        return commune_id or self._by_name.get(city_normalized)
+    
+    def batch_lookup(
+        self, names_norm: Sequence[str], postal_codes: Sequence[str] = None
+    ) -> Sequence[int]:
+        """
+        Stratégies 1 et 2 sur l'index en mémoire, pour tout un lot à la fois
+        
+        Avec NumPy, recherche dichotomique vectorisée (np.searchsorted) dans
+        les tableaux triés construits par _load_index.
+        
+        Args:
+            names_norm: Noms normalisés (clean_and_normalize)
+            postal_codes: Codes postaux alignés sur names_norm (optionnel)
+        
+        Returns:
+            commune_id par nom (-1 si absent de l'index) : np.ndarray avec
+            NumPy, liste sinon
+        """
+        if not NUMPY_AVAILABLE or not self._index_loaded:
+            postal_codes = postal_codes or [''] * len(names_norm)
+            return [
+                self._find_in_index(name, postal) or -1
+                for name, postal in zip(names_norm, postal_codes)
+            ]
+        
+        names = np.asarray(names_norm, dtype=str)
+        found = _sorted_lookup(self._names_norm, self._name_ids, names)
+        if postal_codes is not None:
+            keys = np.char.add(np.char.add(np.asarray(postal_codes, dtype=str), "|"), names)
+            by_postal = _sorted_lookup(self._postal_keys, self._postal_ids, keys)
+            found = np.where(by_postal >= 0, by_postal, found)
+        return found
+    
+    def _batch_find_in_index(
+        self, pairs: Iterable[Tuple[str, Optional[str]]]
+    ) -> Dict[Tuple[str, Optional[str]], int]:
+        """
+        Résout via batch_lookup les (ville brute, code postal) présents dans l'index
+        
+        Returns:
+            Dictionnaire {(ville, code postal): commune_id}, sans les absents
+        """
+        pairs = [pair for pair in pairs if pair[0]]
+        if not pairs or not self._index_loaded:
+            return {}
+        
+        names = [self.clean_and_normalize(city)[1] for city, _ in pairs]
+        found = self.batch_lookup(names, [postal or '' for _, postal in pairs])
+        return {pair: int(cid) for pair, cid in zip(pairs, found) if cid >= 0}
+    
     def clean_city_name(self, city: str) -> str:
         """
         Nettoie le nom de ville
@@ -78,15 +437,11 @@ class GeoMatcher:
             return ""
         
         # Enlever préfixe département (ex: "75 - Paris" -> "Paris")
-        city = re.sub(r'^\d{2,3}\s*-\s*', '', city)
+        city = _DEPT_PREFIX_RE.sub('', city)
         
         # Convertir les arrondissements au format "XX 01", "XX 02", etc.
         # Pattern: "Paris 1er Arrondissement" → "Paris 01"
-        match = re.search(
-            r'^(.+?)\s+(\d{1,2})[eèr]{1,2}\s+arrondissement',
-            city,
-            flags=re.IGNORECASE
-        )
+        match = _ARRDT_RE.search(city)
         
         if match:
             ville = match.group(1).strip()
@@ -94,13 +449,10 @@ class GeoMatcher:
             city = f"{ville} {numero}"
         
         # Normaliser "Saint" et "Sainte" en "ST" et "STE"
-        city = re.sub(r'\bSaint-', 'ST ', city, flags=re.IGNORECASE)
-        city = re.sub(r'\bSainte-', 'STE ', city, flags=re.IGNORECASE)
-        city = re.sub(r'\bSt-', 'ST ', city, flags=re.IGNORECASE)
-        city = re.sub(r'\bSte-', 'STE ', city, flags=re.IGNORECASE)
+        city = _SAINT_RE.sub(r'ST\1 ', city)
         
         # Normaliser espaces multiples
-        city = re.sub(r'\s+', ' ', city)
+        city = _WS_RE.sub(' ', city)
         
         # Normaliser casse (UPPERCASE pour matcher avec la base)
         city = city.strip().upper()
@@ -123,34 +475,33 @@ class GeoMatcher:
             "Nîmes" → "nimes"
             "ÉPINAL" → "epinal"
         """
-        import unicodedata
-        
         if not city:
             return ""
         
         # Normaliser "Saint" et "Sainte" en "ST" et "STE"
-        city = re.sub(r'\bSaint-', 'ST ', city, flags=re.IGNORECASE)
-        city = re.sub(r'\bSainte-', 'STE ', city, flags=re.IGNORECASE)
-        city = re.sub(r'\bSt-', 'ST ', city, flags=re.IGNORECASE)
-        city = re.sub(r'\bSte-', 'STE ', city, flags=re.IGNORECASE)
-        
-        # Enlever les accents
-        city = unicodedata.normalize('NFD', city)
-        city = ''.join(char for char in city if unicodedata.category(char) != 'Mn')
+        city = _SAINT_RE.sub(r'ST\1 ', city)
         
-        # Remplacer tirets par espaces
-        city = city.replace('-', ' ')
+        # Accents, tirets et apostrophes en une seule passe, puis espaces et casse
+        return _normalize(city)
+    
+    def clean_and_normalize(self, city: str) -> Tuple[str, str]:
+        """
+        Nettoie et normalise un nom de ville en une seule passe
         
-        # Remplacer apostrophes par espaces
-        city = city.replace("'", ' ')
+        Équivaut à clean_city_name suivi de normalize_for_search, sans
+        réappliquer les expressions régulières au nom déjà nettoyé.
         
-        # Normaliser espaces multiples
-        city = re.sub(r'\s+', ' ', city)
+        Args:
+            city: Nom de ville brut
         
-        # Minuscules
-        city = city.lower().strip()
+        Returns:
+            Tuple (nom nettoyé, nom normalisé pour recherche)
         
-        return city
+        Examples:
+            "Saint-Étienne" → ("ST ÉTIENNE", "st etienne")
+        """
+        city_clean = self.clean_city_name(city)
+        return city_clean, _normalize(city_clean)
     
     def find_commune_id(self, city_name: str, postal_code: str = None) -> Optional[int]:
         """
@@ -173,89 +524,315 @@ class GeoMatcher:
         if not city_name:
             return None
         
-        # Nettoyer le nom de ville
-        city_clean = self.clean_city_name(city_name)
+        # Nettoyer et normaliser (sans accents, sans tirets) le nom de ville
+        city_clean, city_normalized = self.clean_and_normalize(city_name)
         
-        # Clé de cache
-        cache_key = f"{city_clean}|{postal_code or ''}"
-        if cache_key in self.cache:
-            return self.cache[cache_key]
+        try:
+            return self._lookup_cached(city_clean, city_normalized, postal_code or '')
+        except Exception as e:
+            # Non mis en cache (lru_cache ignore les exceptions) : nouvel essai au prochain appel
+            logger.error("❌ Erreur recherche commune '%s': %s", city_clean, e)
+            return None
+    
+    def _lookup(self, city_clean: str, city_normalized: str, postal_code: str) -> Optional[int]:
+        """
+        Applique les trois stratégies de recherche (mise en cache LRU par __init__)
         
-        commune_id = None
+        Une erreur de base est propagée à l'appelant : ni le LRU, ni Redis,
+        ni le cache négatif ne la retiennent, la commune sera recherchée à nouveau.
         
-        try:
-            with self.engine.connect() as conn:
-                # Normaliser pour recherche (sans accents, sans tirets)
-                city_normalized = self.normalize_for_search(city_clean)
-                
-                # STRATÉGIE 1: Recherche exacte avec code postal
-                if postal_code:
-                    result = conn.execute(
-                        text("""
-                            SELECT commune_id FROM ref_communes_france
-                            WHERE code_postal = :postal
-                              AND (
-                                  LOWER(nom_commune) = LOWER(:city)
-                                  OR LOWER(REPLACE(REPLACE(
-                                      TRANSLATE(nom_commune, 
-                                          'àâäéèêëïîôùûüÿçÀÂÄÉÈÊËÏÎÔÙÛÜŸÇ',
-                                          'aaaeeeeiioouuuycAAAEEEEIIOUUUYC'),
-                                      '-', ' '), '''', ' ')
-                                  ) = :city_norm
-                              )
-                            LIMIT 1
-                        """),
-                        {"city": city_clean, "postal": postal_code, "city_norm": city_normalized}
-                    )
-                    commune_id = result.scalar()
-                
-                # STRATÉGIE 2: Si pas trouvé, recherche par nom normalisé seul
-                if not commune_id:
-                    result = conn.execute(
-                        text("""
-                            SELECT commune_id FROM ref_communes_france
-                            WHERE LOWER(REPLACE(REPLACE(
-                                  TRANSLATE(nom_commune, 
-                                      'àâäéèêëïîôùûüÿçÀÂÄÉÈÊËÏÎÔÙÛÜŸÇ',
-                                      'aaaeeeeiioouuuycAAAEEEEIIOUUUYC'),
-                                  '-', ' '), '''', ' ')
-                              ) = :city_norm
-                            ORDER BY population DESC NULLS LAST
-                            LIMIT 1
-                        """),
-                        {"city_norm": city_normalized}
-                    )
-                    commune_id = result.scalar()
-                
-                # STRATÉGIE 3: Utiliser la fonction PostgreSQL find_commune() en dernier recours
-                if not commune_id:
-                    if postal_code:
-                        result = conn.execute(
-                            text("SELECT find_commune(:city, :postal)"),
-                            {"city": city_clean, "postal": postal_code}
-                        )
-                    else:
-                        result = conn.execute(
-                            text("SELECT find_commune(:city)"),
-                            {"city": city_clean}
-                        )
-                    
-                    commune_id = result.scalar()
+        Args:
+            city_clean: Nom nettoyé (clé de cache avec le code postal)
+            city_normalized: Nom normalisé, dérivé de city_clean
+            postal_code: Code postal ou chaîne vide
         
-        except Exception as e:
-            logger.error(f"❌ Erreur recherche commune '{city_clean}': {e}")
-            commune_id = None
+        Returns:
+            commune_id ou None
+        """
+        # STRATÉGIES 1 et 2: index en mémoire (aucun aller-retour réseau)
+        commune_id = self._find_in_index(city_normalized, postal_code)
+        miss_key = (city_normalized, postal_code)
         
-        # Mettre en cache
-        self.cache[cache_key] = commune_id
+        if not commune_id:
+            # Déjà introuvable (autre graphie de la même ville, ou sortie du
+            # LRU) : ni requête ni nouvel avertissement
+            if miss_key in self._misses:
+                return None
+            
+            # Cache partagé avant la base : évite de relancer la recherche approchée
+            hit, commune_id = self._shared_cache_get(city_normalized, postal_code)
+            
+            if not hit:
+                with self._connect() as conn:
+                    if self._index_loaded:
+                        # STRATÉGIE 3 seule : 1 et 2 ont déjà échoué sur l'index
+                        commune_id = self._find_commune_fuzzy(conn, city_normalized, postal_code)
+                    else:
+                        # STRATÉGIES 1, 2 et 3 en une seule requête
+                        commune_id = self._execute_prepared(
+                            conn, "geo_combined", city_normalized, postal_code
+                        )
+                
+                self._shared_cache_set(city_normalized, postal_code, commune_id)
         
         if commune_id:
-            logger.debug(f"✅ Commune trouvée: {city_clean} ({postal_code}) → ID {commune_id}")
+            logger.debug("✅ Commune trouvée: %s (%s) → ID %s", city_clean, postal_code, commune_id)
         else:
-            logger.warning(f"⚠️ Commune non trouvée: {city_clean} ({postal_code})")
+            if len(self._misses) >= self.MISS_CACHE_SIZE:
+                self._misses.clear()
+            self._misses.add(miss_key)
+            logger.warning("⚠️ Commune non trouvée: %s (%s)", city_clean, postal_code)
         
         return commune_id
     
+    def _shared_cache_get(self, city_normalized: str, postal_code: str) -> Tuple[bool, Optional[int]]:
+        """
+        Lit le cache partagé Redis
+        
+        Returns:
+            Tuple (trouvé dans le cache, commune_id ou None)
+        """
+        if self._redis is None:
+            return False, None
+        
+        try:
+            value = self._redis.get(f"{self.REDIS_PREFIX}{postal_code}|{city_normalized}")
+        except Exception as e:
+            # Cache indisponible : la recherche continue en base
+            logger.debug("Redis indisponible: %s", e)
+            return False, None
+        
+        if value is None:
+            return False, None
+        value = value.decode()
+        return True, (None if value == self.REDIS_MISS else int(value))
+    
+    def _shared_cache_set(self, city_normalized: str, postal_code: str, commune_id: Optional[int]):
+        """Écrit un résultat (introuvable compris, TTL plus court) dans le cache Redis"""
+        if self._redis is None:
+            return
+        
+        try:
+            if commune_id:
+                self._redis.setex(
+                    f"{self.REDIS_PREFIX}{postal_code}|{city_normalized}",
+                    self.REDIS_TTL, str(commune_id)
+                )
+            else:
+                self._redis.setex(
+                    f"{self.REDIS_PREFIX}{postal_code}|{city_normalized}",
+                    self.REDIS_MISS_TTL, self.REDIS_MISS
+                )
+        except Exception as e:
+            logger.debug("Redis indisponible: %s", e)
+    
+    def _find_commune_fuzzy(self, conn, city_normalized: str, postal_code: str = None) -> Optional[int]:
+        """
+        Recherche approchée par similarité trigramme (dernier recours)
+        
+        Tolère les fautes de frappe et variantes d'écriture ; à similarité
+        égale, la commune du code postal donné puis la plus peuplée l'emporte.
+        
+        Args:
+            conn: Connexion SQLAlchemy ouverte
+            city_normalized: Nom de ville normalisé (clean_and_normalize)
+            postal_code: Code postal (optionnel)
+        
+        Returns:
+            commune_id ou None
+        """
+        return self._execute_prepared(conn, "geo_fuzzy", city_normalized, postal_code or '')
+    
+    def _execute_prepared(self, conn, name: str, *params) -> Optional[int]:
+        """
+        Exécute une requête préparée de _PREPARED_STATEMENTS (EXECUTE name(...))
+        
+        Les PREPARE sont envoyés au premier usage de la connexion DBAPI :
+        ils ne sont pas transactionnels et survivent aux rollbacks.
+        
+        Args:
+            conn: Connexion SQLAlchemy ouverte
+            name: Nom de la requête préparée
+            *params: Paramètres positionnels ($1, $2, ...)
+        
+        Returns:
+            Première colonne de la première ligne, ou None
+        """
+        # info : dictionnaire propre à la connexion DBAPI (survit aux checkouts du pool)
+        pooled = conn.connection
+        cursor = pooled.dbapi_connection.cursor()
+        try:
+            if not pooled.info.get(_PREPARED_INFO_KEY):
+                for statement in _PREPARED_STATEMENTS:
+                    cursor.execute(statement)
+                pooled.info[_PREPARED_INFO_KEY] = True
+            
+            cursor.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(params))})", params)
+            row = cursor.fetchone()
+        except Exception:
+            # Transaction DBAPI en erreur : annulée pour les requêtes suivantes
+            pooled.dbapi_connection.rollback()
+            raise
+        finally:
+            cursor.close()
+        
+        return row[0] if row else None
+    
+    def find_commune_ids_bulk(
+        self, pairs: Iterable[Tuple[str, Optional[str]]]
+    ) -> Dict[Tuple[str, Optional[str]], Optional[int]]:
+        """
+        Trouve les commune_id d'une liste de (ville, code postal) en une requête
+        
+        Mêmes stratégies que find_commune_id : les stratégies 1 et 2 sont
+        évaluées sur l'index en mémoire et les résultats passent par le cache
+        LRU. Sans index, elles sont évaluées pour toutes les villes en un seul
+        aller-retour et la recherche approchée n'est lancée que pour les restantes.
+        
+        Args:
+            pairs: Couples (nom de ville brut, code postal ou None)
+        
+        Returns:
+            Dictionnaire {(ville, code postal): commune_id ou None}
+        
+        Examples:
+            >>> matcher.find_commune_ids_bulk([("Paris", "75001"), ("Lyon", None)])
+            {('Paris', '75001'): 123, ('Lyon', None): 456}
+        """
+        pairs = set(pairs)
+        
+        # Stratégies 1 et 2 vectorisées sur l'index pour tout le lot
+        results = self._batch_find_in_index(pairs)
+        pending = {}  # cache_key -> (city_clean, city_normalized, postal_code, [pairs])
+        
+        for pair in pairs - results.keys():
+            city_name, postal_code = pair
+            if not city_name:
+                results[pair] = None
+                continue
+            
+            city_clean, city_normalized = self.clean_and_normalize(city_name)
+            if self._index_loaded:
+                # Absent de l'index : recherche approchée (mise en cache LRU)
+                try:
+                    results[pair] = self._lookup_cached(city_clean, city_normalized, postal_code or '')
+                except Exception as e:
+                    logger.error("❌ Erreur recherche commune '%s': %s", city_clean, e)
+                    results[pair] = None
+                continue
+            
+            cache_key = f"{city_clean}|{postal_code or ''}"
+            pending.setdefault(
+                cache_key, (city_clean, city_normalized, postal_code, [])
+            )[3].append(pair)
+        
+        if not pending:
+            return results
+        
+        keys = list(pending)
+        
+        try:
+            with self._connect() as conn:
+                rows = conn.execute(
+                    text(_SQL_FIND_COMMUNES_BULK),
+                    {
+                        "keys": keys,
+                        "norms": [pending[k][1] for k in keys],
+                        "postals": [pending[k][2] or '' for k in keys],
+                    }
+                )
+                found = dict(rows.fetchall())
+                
+                # STRATÉGIE 3 pour les villes non trouvées
+                for key in keys:
+                    if not found.get(key):
+                        _, city_normalized, postal_code, _ = pending[key]
+                        found[key] = self._find_commune_fuzzy(conn, city_normalized, postal_code)
+        
+        except Exception as e:
+            logger.error("❌ Erreur recherche groupée de %d communes: %s", len(keys), e)
+            return results
+        
+        for key in keys:
+            commune_id = found.get(key)
+            for pair in pending[key][3]:
+                results[pair] = commune_id
+        
+        logger.debug("📍 %d communes résolues en bloc", len(keys))
+        return results
+    
+    def find_commune_ids(
+        self, pairs: Iterable[Tuple[str, Optional[str]]]
+    ) -> List[Optional[int]]:
+        """
+        Trouve les commune_id d'une liste de (ville, code postal), dans l'ordre
+        
+        Version ordonnée de find_commune_ids_bulk : chaque couple distinct
+        n'est résolu qu'une fois, pour tout le lot.
+        
+        Args:
+            pairs: Couples (nom de ville brut, code postal ou None)
+        
+        Returns:
+            Liste de commune_id (ou None), alignée sur pairs
+        
+        Examples:
+            >>> matcher.find_commune_ids([("Paris", "75001"), ("Lyon", None)])
+            [123, 456]
+        """
+        pairs = list(pairs)
+        found = self.find_commune_ids_bulk(pairs)
+        return [found.get(pair) for pair in pairs]
+    
+    def find_commune_ids_parallel(self, offers: List[Dict], workers: int = 8) -> List[Optional[int]]:
+        """
+        Trouve les communes d'une liste d'offres avec un pool de threads
+        
+        Les couples (ville, code postal) distincts sont d'abord cherchés en
+        bloc dans l'index (batch_lookup). Les absents, triés par (code postal,
+        ville), sont découpés en paquets contigus, chacun résolu par un thread
+        sur sa propre connexion (session()) : les requêtes de repli se
+        recouvrent au lieu de s'enchaîner, et chaque thread parcourt des codes
+        postaux voisins (mêmes pages du référentiel). Le cache LRU est partagé
+        (lru_cache est thread-safe).
+        
+        Args:
+            offers: Offres avec 'location_city' et optionnellement 'location_postal_code'
+            workers: Nombre de threads (≤ POOL_SIZE + POOL_MAX_OVERFLOW)
+        
+        Returns:
+            Liste de commune_id (ou None), alignée sur offers
+        """
+        pairs = [
+            (o.get("location_city", ""), o.get("location_postal_code", ""))
+            for o in offers
+        ]
+        distinct = list(dict.fromkeys(pairs))
+        
+        # Index en mémoire vectorisé d'abord : seuls les absents partent en threads
+        found = self._batch_find_in_index(distinct)
+        misses = sorted(
+            (pair for pair in distinct if pair not in found),
+            key=lambda pair: (pair[1] or "", pair[0] or ""),
+        )
+        size = max(-(-len(misses) // workers), 1)  # arrondi supérieur
+        chunks = [misses[i:i + size] for i in range(0, len(misses), size)]
+        
+        def resolve(chunk):
+            try:
+                with self.session():
+                    return [self.find_commune_id(city, postal) for city, postal in chunk]
+            except Exception as e:
+                # Connexion de session() impossible : paquet non résolu, rien en cache
+                logger.error("❌ Erreur recherche de %d communes: %s", len(chunk), e)
+                return [None] * len(chunk)
+        
+        with ThreadPoolExecutor(max_workers=max(len(chunks), 1)) as executor:
+            for chunk, commune_ids in zip(chunks, executor.map(resolve, chunks)):
+                found.update(zip(chunk, commune_ids))
+        
+        return [found[pair] for pair in pairs]
+    
     def find_commune_from_offer(self, offer: Dict) -> Optional[int]:
         """
         Trouve la commune à partir d'un dictionnaire d'offre
@@ -279,7 +856,7 @@ class GeoMatcher:
         
         return self.find_commune_id(city, postal_code)
     
-    def get_commune_info(self, commune_id: int) -> Optional[Dict]:
+    def get_commune_info(self, commune_id: int) -> Optional[CommuneInfo]:
         """
         Récupère les informations complètes d'une commune
         
@@ -287,51 +864,32 @@ class GeoMatcher:
             commune_id: ID de la commune
         
         Returns:
-            Dictionnaire avec les infos ou None
+            CommuneInfo ou None
         
         Examples:
             >>> info = matcher.get_commune_info(123)
-            >>> print(info['nom_commune'], info['nom_region'])
+            >>> print(info.nom_commune, info.nom_region)
             Paris Île-de-France
         """
         if not commune_id:
             return None
         
         try:
-            with self.engine.connect() as conn:
-                result = conn.execute(
-                    text("""
-                        SELECT 
-                            commune_id, code_insee, code_postal,
-                            nom_commune, nom_departement, nom_region,
-                            code_departement, code_region,
-                            latitude, longitude, population
-                        FROM ref_communes_france 
-                        WHERE commune_id = :id
-                    """),
-                    {"id": commune_id}
-                )
-                
-                row = result.fetchone()
+            with self._connect() as conn:
+                row = conn.execute(text(_SQL_COMMUNE_INFO), {"id": commune_id}).fetchone()
                 if not row:
                     return None
                 
-                return {
-                    'commune_id': row[0],
-                    'code_insee': row[1],
-                    'code_postal': row[2],
-                    'nom_commune': row[3],
-                    'nom_departement': row[4],
-                    'nom_region': row[5],
-                    'code_departement': row[6],
-                    'code_region': row[7],
-                    'latitude': float(row[8]) if row[8] else None,
-                    'longitude': float(row[9]) if row[9] else None,
-                    'population': row[10]
-                }
+                latitude, longitude = row[8], row[9]
+                return CommuneInfo(
+                    *row[:8],
+                    float(latitude) if latitude is not None else None,
+                    float(longitude) if longitude is not None else None,
+                    row[10],
+                )
         
         except Exception as e:
-            logger.error(f"❌ Erreur récupération commune {commune_id}: {e}")
+            logger.error("❌ Erreur récupération commune %s: %s", commune_id, e)
             return None
     
     def get_stats(self) -> Dict:
@@ -342,7 +900,7 @@ class GeoMatcher:
             Dictionnaire avec les stats
         """
         try:
-            with self.engine.connect() as conn:
+            with self._connect() as conn:
                 result = conn.execute(text("""
                     SELECT 
                         COUNT(*) as total_communes,
@@ -358,19 +916,46 @@ class GeoMatcher:
                     'nb_departements': row[1],
                     'nb_regions': row[2],
                     'nb_avec_gps': row[3],
-                    'cache_size': len(self.cache)
+                    'cache_size': self.cache_info().currsize
                 }
         
         except Exception as e:
-            logger.error(f"❌ Erreur stats: {e}")
+            logger.error("❌ Erreur stats: %s", e)
             return {}
     
+    def cache_clear(self):
+        """Vider les caches des recherches (tests, référentiel rechargé)"""
+        self._lookup_cached.cache_clear()
+        self._misses.clear()
+    
     def close(self):
         """Fermer la connexion"""
         self.engine.dispose()
+        if self._redis is not None:
+            self._redis.close()
         logger.info("🔚 GeoMatcher fermé")
 
 
+# Instance globale (singleton) partagée par les collecteurs et l'API
+_default_matcher = None
+_default_matcher_lock = threading.Lock()
+
+
+def get_default_matcher() -> GeoMatcher:
+    """
+    Retourne le GeoMatcher partagé du processus (créé au premier appel)
+    
+    L'engine, son pool et l'index des communes ne sont construits qu'une fois ;
+    l'instance ne doit pas être fermée par ses utilisateurs.
+    """
+    global _default_matcher
+    if _default_matcher is None:
+        with _default_matcher_lock:
+            if _default_matcher is None:
+                _default_matcher = GeoMatcher()
+    return _default_matcher
+
+
 # ============================================================================
 # TEST STANDALONE
 # ============================================================================
@@ -414,8 +999,8 @@ if __name__ == "__main__":
             if commune_id:
                 info = matcher.get_commune_info(commune_id)
                 print(f"✅ '{city}' ({postal or 'sans CP'})")
-                print(f"   → ID: {info['commune_id']} | {info['nom_commune']} ({info['code_postal']})")
-                print(f"   → {info['nom_departement']} - {info['nom_region']}")
+                print(f"   → ID: {info.commune_id} | {info.nom_commune} ({info.code_postal})")
+                print(f"   → {info.nom_departement} - {info.nom_region}")
             else:
                 print(f"❌ '{city}' ({postal or 'sans CP'}) - NON TROUVÉ")
             
@@ -434,10 +1019,10 @@ if __name__ == "__main__":
         if commune_id:
             info = matcher.get_commune_info(commune_id)
             print(f"✅ Offre → Commune ID {commune_id}")
-            print(f"   {info['nom_commune']} - {info['nom_region']}")
+            print(f"   {info.nom_commune} - {info.nom_region}")
         
         # Stats finales
-        print(f"\n📊 Cache: {len(matcher.cache)} entrées")
+        print(f"\n📊 Cache: {matcher.cache_info().currsize} entrées")
         
         print("\n" + "=" * 60)
         print("✅ Tests terminés avec succès")
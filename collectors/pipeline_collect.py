@@ -6,6 +6,8 @@ Collecte depuis France Travail et WTTJ, puis insère dans PostgreSQL.
 ⚡ PERFORMANCES:
   - France Travail: API REST (rapide) + option Selenium pour company_name
   - WTTJ: Selenium (lent, optionnel)
+  - France Travail et WTTJ collectés en parallèle (un thread par source)
+  - Insertion PostgreSQL par paquets pendant la collecte (file producteur/consommateur)
 
 Usage:
     # 🚀 COLLECTE RAPIDE (recommandé - France Travail uniquement)
@@ -19,8 +21,13 @@ Usage:
 """
 
 import argparse
+import gzip
 import json
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 
 from france_travail_collector import FranceTravailCollector
@@ -28,6 +35,21 @@ from wttj_collector import WTTJCollector
 #from db_inserter import DBInserter
 from db_inserter_v2 import DBInserterV2 as DBInserter
 
+# Sérialiseur JSON rapide (optionnel) pour les backups
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# File collecte → insertion : taille des paquets insérés (un lot du
+# DBInserter : une seule requête préparée par paquet) et taille maximale
+INSERT_CHUNK_SIZE = DBInserter.BATCH_SIZE
+INSERT_QUEUE_SIZE = 2 * INSERT_CHUNK_SIZE
+
+# Fin de collecte signalée au consommateur
+_END_OF_OFFERS = object()
+
 
 def print_separator(title: str):
     """Afficher un séparateur stylisé"""
@@ -51,7 +73,10 @@ def collect_france_travail(max_offers: int, use_selenium: bool = False) -> list:
     
     try:
         collector = FranceTravailCollector(use_selenium=use_selenium)
-        offers = collector.collect(max_offers=max_offers)
+        try:
+            offers = collector.collect(max_offers=max_offers)
+        finally:
+            collector.close()  # Driver Selenium partagé
         
         print(f"\n✅ France Travail: {len(offers)} offres collectées")
         return offers
@@ -111,7 +136,7 @@ def collect_wttj(max_offers: int) -> list:
 
 def save_backup(offers: list, source: str):
     """
-    Sauvegarder un backup JSON
+    Sauvegarder un backup JSON compressé (gzip, lisible avec zcat ... | jq .)
     
     Args:
         offers: Liste d'offres
@@ -121,47 +146,118 @@ def save_backup(offers: list, source: str):
         return
     
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    filename = f"backup_{source}_{timestamp}.json"
+    filename = f"backup_{source}_{timestamp}.json.gz"
     
     Path("backups").mkdir(exist_ok=True)
     filepath = Path("backups") / filename
     
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(offers, f, ensure_ascii=False, indent=2)
+    if ORJSON_AVAILABLE:
+        data = orjson.dumps(offers, option=orjson.OPT_NON_STR_KEYS)
+    else:
+        data = json.dumps(offers, ensure_ascii=False).encode("utf-8")
+    
+    # Compression rapide : le backup n'est relu qu'occasionnellement
+    with gzip.open(filepath, 'wb', compresslevel=1) as f:
+        f.write(data)
     
     print(f"  💾 Backup: {filepath}")
 
 
-def insert_to_database(offers: list, dry_run: bool = False):
+def insert_to_database(
+    offers: list, dry_run: bool = False, inserter: DBInserter = None, summary: bool = True
+):
     """
     Insérer les offres dans PostgreSQL
     
     Args:
         offers: Liste d'offres normalisées
         dry_run: Si True, simulation sans insertion
+        inserter: DBInserter déjà ouvert (sinon créé puis fermé ici)
+        summary: Afficher le résumé du DBInserter (False pour un paquet intermédiaire)
     """
     if not offers:
-        print("\n⚠️ Aucune offre à insérer")
         return {"total": 0, "inserted": 0, "duplicates": 0, "errors": 0}
     
-    print_separator("💾 INSERTION DANS POSTGRESQL")
-    
     if dry_run:
-        print("\n⚠️ MODE DRY-RUN: Simulation sans insertion réelle\n")
         return {"total": len(offers), "inserted": len(offers), "duplicates": 0, "errors": 0}
     
+    own_inserter = inserter is None
+    
     try:
-        inserter = DBInserter()
-        stats = inserter.insert_batch(offers)
-        inserter.close()
+        if own_inserter:
+            inserter = DBInserter()
         
-        return stats
+        # Communes de toutes les offres résolues en un seul lot,
+        # réparti sur un pool de threads (une connexion par thread)
+        commune_ids = inserter.geo_matcher.find_commune_ids_parallel(offers)
+        for offer, commune_id in zip(offers, commune_ids):
+            offer["commune_id"] = commune_id
+        resolved = sum(1 for commune_id in commune_ids if commune_id)
+        print(f"\n📍 Communes résolues: {resolved}/{len(offers)}")
+        
+        return inserter.insert_batch(offers, summary=summary)
     
     except Exception as e:
         print(f"\n❌ Erreur insertion: {e}")
         import traceback
         traceback.print_exc()
         return {"total": len(offers), "inserted": 0, "duplicates": 0, "errors": len(offers)}
+    
+    finally:
+        if own_inserter and inserter is not None:
+            inserter.close()
+
+
+def insert_worker(offer_queue: queue.Queue, stats: dict, dry_run: bool = False):
+    """
+    Consommateur : insère les offres de la file par paquets pendant la collecte
+    
+    Args:
+        offer_queue: File alimentée par main, terminée par _END_OF_OFFERS
+        stats: Statistiques d'insertion, cumulées sur place
+        dry_run: Si True, simulation sans insertion
+    """
+    inserter = None
+    started = False
+    
+    def flush(chunk: list):
+        nonlocal inserter, started
+        
+        # Connexion ouverte au premier paquet seulement
+        if not started:
+            started = True
+            print_separator("💾 INSERTION DANS POSTGRESQL")
+            if dry_run:
+                print("\n⚠️ MODE DRY-RUN: Simulation sans insertion réelle\n")
+            else:
+                try:
+                    inserter = DBInserter()
+                except Exception as e:
+                    # La file est quand même vidée pour ne pas bloquer la collecte
+                    print(f"\n❌ Erreur connexion PostgreSQL: {e}")
+        
+        if inserter is None and not dry_run:
+            chunk_stats = {"total": len(chunk), "errors": len(chunk)}
+        else:
+            chunk_stats = insert_to_database(
+                chunk, dry_run=dry_run, inserter=inserter, summary=False
+            )
+        for key in stats:
+            stats[key] += chunk_stats.get(key, 0)
+    
+    try:
+        # Offres de la file jusqu'au marqueur de fin, par paquets de INSERT_CHUNK_SIZE
+        offers = iter(offer_queue.get, _END_OF_OFFERS)
+        while chunk := list(islice(offers, INSERT_CHUNK_SIZE)):
+            flush(chunk)
+        
+        # Résumé DBInserter (et stats GeoMatcher) une seule fois, pour tous les paquets
+        if inserter is not None:
+            inserter.log_summary(stats)
+    
+    finally:
+        if inserter is not None:
+            inserter.close()
 
 
 def main():
@@ -269,29 +365,67 @@ Exemples d'utilisation:
     print(f"  💾 Backups JSON: OUI")
     
     # ========================================================================
-    # ÉTAPE 1: COLLECTE
+    # ÉTAPES 1 & 2: COLLECTE → INSERTION (consommateur en parallèle)
     # ========================================================================
-    all_offers = []
+    stats = {"total": 0, "inserted": 0, "duplicates": 0, "skipped": 0, "errors": 0}
     
-    # France Travail (API + optionnel Selenium)
-    if not args.skip_france_travail and args.france_travail > 0:
-        ft_offers = collect_france_travail(args.france_travail, use_selenium=args.use_selenium)
-        all_offers.extend(ft_offers)
-        save_backup(ft_offers, "france_travail")
+    # Les offres de chaque source sont insérées pendant que l'autre est collectée
+    offer_queue = None
+    consumer = None
+    if not args.no_insert:
+        offer_queue = queue.Queue(maxsize=INSERT_QUEUE_SIZE)
+        consumer = threading.Thread(
+            target=insert_worker,
+            args=(offer_queue, stats, args.dry_run),
+            name="insert-worker",
+        )
+        consumer.start()
     
-    # WTTJ (Selenium - lent)
-    if not args.skip_wttj and args.wttj > 0:
-        wttj_offers = collect_wttj(args.wttj)
-        all_offers.extend(wttj_offers)
-        save_backup(wttj_offers, "wttj")
+    def publish(offers: list, source: str):
+        save_backup(offers, source)
+        if offer_queue is not None:
+            for offer in offers:
+                offer_queue.put(offer)
     
-    # ========================================================================
-    # ÉTAPE 2: INSERTION
-    # ========================================================================
-    stats = {"total": 0, "inserted": 0, "duplicates": 0, "errors": 0}
+    def collect_and_publish(collect, source: str, *collect_args, **collect_kwargs) -> int:
+        offers = collect(*collect_args, **collect_kwargs)
+        publish(offers, source)
+        return len(offers)
     
-    if all_offers and not args.no_insert:
-        stats = insert_to_database(all_offers, dry_run=args.dry_run)
+    ft_count = 0
+    wttj_count = 0
+    
+    try:
+        # Sources indépendantes (API REST / Chrome dédié) collectées en parallèle :
+        # la durée est celle de la plus longue collecte, pas leur somme
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="collect") as executor:
+            ft_future = wttj_future = None
+            
+            # France Travail (API + optionnel Selenium)
+            if not args.skip_france_travail and args.france_travail > 0:
+                ft_future = executor.submit(
+                    collect_and_publish, collect_france_travail, "france_travail",
+                    args.france_travail, use_selenium=args.use_selenium,
+                )
+            
+            # WTTJ (Selenium - lent)
+            if not args.skip_wttj and args.wttj > 0:
+                wttj_future = executor.submit(
+                    collect_and_publish, collect_wttj, "wttj", args.wttj,
+                )
+            
+            if ft_future is not None:
+                ft_count = ft_future.result()
+            if wttj_future is not None:
+                wttj_count = wttj_future.result()
+    
+    finally:
+        if consumer is not None:
+            offer_queue.put(_END_OF_OFFERS)
+            consumer.join()
+    
+    if not args.no_insert and stats['total'] == 0:
+        print("\n⚠️ Aucune offre à insérer")
     
     # ========================================================================
     # RÉSUMÉ FINAL
@@ -304,20 +438,19 @@ Exemples d'utilisation:
     print(f"\n⏱️  Durée totale: {duration:.0f}s ({duration/60:.1f} minutes)")
     
     print("\n📦 Collecte:")
-    print(f"  Total offres collectées: {len(all_offers)}")
+    print(f"  Total offres collectées: {ft_count + wttj_count}")
     
     if not args.skip_france_travail and args.france_travail > 0:
-        ft_count = sum(1 for o in all_offers if o.get('source') == 'france_travail')
         print(f"  - France Travail: {ft_count}")
     
     if not args.skip_wttj and args.wttj > 0:
-        wttj_count = sum(1 for o in all_offers if o.get('source') == 'welcome_to_the_jungle')
         print(f"  - WTTJ: {wttj_count}")
     
     if not args.no_insert:
         print("\n💾 Insertion:")
         print(f"  Offres insérées: {stats['inserted']}")
         print(f"  Doublons ignorés: {stats['duplicates']}")
+        print(f"  Sans localisation: {stats['skipped']}")
         print(f"  Erreurs: {stats['errors']}")
         
         if stats['total'] > 0:
@@ -0,0 +1,100 @@
+"""
+test_france_travail_filter.py
+
+Tests du filtre Data/IA de FranceTravailCollector (sans appel à l'API).
+
+Teste :
+- Regex factorisée en trie (_keywords_to_trie_regex) ≡ alternance simple
+- Raccourci _FAST_KEYWORDS_REGEX : n'accepte que des offres acceptées par la regex
+- Recherche Aho-Corasick (_has_data_ai_keyword) ≡ DATA_AI_REGEX
+"""
+
+import re
+import sys
+from pathlib import Path
+
+# Ajouter le dossier collectors
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from france_travail_collector import (
+    AHOCORASICK_AVAILABLE,
+    FranceTravailCollector,
+    _keywords_to_trie_regex,
+)
+
+KEYWORDS = FranceTravailCollector.DATA_AI_KEYWORDS
+
+# Textes d'offres : cas limites des frontières de mot
+SAMPLE_TEXTS = [
+    "mandataire immobilier indépendant",
+    "data engineer confirmé (h/f)",
+    "ingénieurs d'affaires",
+    "développeur python / django",
+    "chef de projet sql server",
+    "responsable marketing digital",
+    "conducteur poids lourd",
+    "technicien de maintenance html et css",
+    "assistant social",
+    "machine learning engineer",
+    "big-data et temps réel",
+    "",
+]
+
+
+def _texts_around_keywords():
+    """Chaque mot-clé seul, dans une phrase, préfixé et suffixé (hors mot)"""
+    for keyword in KEYWORDS:
+        yield keyword
+        yield f"poste de {keyword} à paris"
+        yield f"x{keyword}"
+        yield f"{keyword}x"
+        yield keyword[:-1]
+
+
+def _all_texts():
+    return SAMPLE_TEXTS + list(_texts_around_keywords())
+
+
+def test_trie_regex_matches_plain_alternation():
+    """La regex en trie reconnaît exactement les mêmes textes que l'alternance simple"""
+    trie = re.compile(r"\b(?:" + _keywords_to_trie_regex(KEYWORDS) + r")\b")
+    plain = re.compile(r"\b(?:" + "|".join(map(re.escape, KEYWORDS)) + r")\b")
+
+    for keyword in KEYWORDS:
+        assert re.fullmatch(_keywords_to_trie_regex(KEYWORDS), keyword), keyword
+
+    for text in _all_texts():
+        assert bool(trie.search(text)) == bool(plain.search(text)), text
+
+
+def test_fast_keywords_subset_of_regex():
+    """Le raccourci n'accepte aucune offre rejetée par DATA_AI_REGEX"""
+    assert all(k in KEYWORDS for k in FranceTravailCollector._FAST_KEYWORDS)
+
+    for text in _all_texts():
+        if FranceTravailCollector._FAST_KEYWORDS_REGEX.search(text):
+            assert FranceTravailCollector.DATA_AI_REGEX.search(text), text
+
+    # "data" à l'intérieur d'un mot
+    assert not FranceTravailCollector._FAST_KEYWORDS_REGEX.search("mandataire immobilier")
+
+
+def test_aho_corasick_matches_regex():
+    """_has_data_ai_keyword donne le même résultat que DATA_AI_REGEX"""
+    if not AHOCORASICK_AVAILABLE:
+        print("⏭️ pyahocorasick non installé - test ignoré")
+        return
+
+    # Instance sans __init__ : pas de credentials nécessaires pour le filtre
+    collector = FranceTravailCollector.__new__(FranceTravailCollector)
+
+    for text in _all_texts():
+        expected = bool(FranceTravailCollector.DATA_AI_REGEX.search(text))
+        assert collector._has_data_ai_keyword(text) == expected, text
+
+
+if __name__ == "__main__":
+    test_trie_regex_matches_plain_alternation()
+    test_fast_keywords_subset_of_regex()
+    test_aho_corasick_matches_regex()
+    print("✅ Tests du filtre Data/IA réussis")
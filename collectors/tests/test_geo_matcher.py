@@ -0,0 +1,152 @@
+"""
+test_geo_matcher.py
+
+Tests de la normalisation et de l'index en mémoire du GeoMatcher
+(sans base de données : référentiel simulé).
+
+Teste :
+- _normalize ≡ colonne générée nom_commune_normalise (translate + espaces + lower)
+- Chemin ASCII rapide ≡ table de traduction
+- batch_lookup (NumPy ou non) ≡ _find_in_index, clés absentes comprises
+- Erreur de base non mise en cache : la recherche suivante aboutit
+"""
+
+import re
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+# Ajouter le dossier collectors
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import geo_matcher
+from geo_matcher import GeoMatcher, _ACCENT_TABLE, _ACCENTS, _ACCENTS_ASCII, _normalize
+
+# Référentiel simulé : (commune_id, code_postal, nom_commune_normalise), plus peuplées d'abord
+COMMUNES = [
+    (1, "75001", "paris"),
+    (2, "97400", "st denis"),
+    (3, "93200", "st denis"),
+    (4, "42000", "st etienne"),
+    (5, "25000", "besancon"),
+    (6, "08000", "charleville mezieres"),
+]
+
+
+def _sql_normalise(name: str) -> str:
+    """Équivalent Python de l'expression SQL de nom_commune_normalise"""
+    translated = name.translate(str.maketrans(_ACCENTS + "-'", _ACCENTS_ASCII + "  "))
+    return re.sub(r"\s+", " ", translated).strip().lower()
+
+
+class _FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def fetchall(self):
+        return self.rows
+
+
+class _FakeConnection:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, *args, **kwargs):
+        return _FakeResult(COMMUNES)
+
+
+def _matcher_with_index() -> GeoMatcher:
+    """GeoMatcher sans engine, index chargé depuis COMMUNES"""
+    matcher = GeoMatcher.__new__(GeoMatcher)
+    matcher._index_loaded = False
+    matcher._connect = _FakeConnection
+    matcher._load_index()
+    assert matcher._index_loaded
+    return matcher
+
+
+def test_normalize_matches_generated_column():
+    """_normalize reproduit la colonne générée de la migration"""
+    assert len(_ACCENTS) == len(_ACCENTS_ASCII)
+
+    names = [
+        "Saint-Étienne", "L'Haÿ-les-Roses", "  Besançon  ", "CHARLEVILLE-MÉZIÈRES",
+        "Paris 01", "Plœuc", "Île-d'Yeu", "Lyon   3e", "",
+    ]
+    for name in names:
+        assert _normalize(name) == _sql_normalise(name), name
+
+    assert _normalize("Saint-Étienne") == "saint etienne"
+    assert _normalize("L'Haÿ-les-Roses") == "l hay les roses"
+
+
+def test_ascii_fast_path_matches_translate():
+    """Le chemin ASCII donne le même résultat que la table de traduction"""
+    for name in ["Saint-Denis", "L'Isle-Adam", "Aix en  Provence", "st-malo"]:
+        expected = " ".join(name.translate(_ACCENT_TABLE).lower().split())
+        assert _normalize(name) == expected, name
+
+
+def test_batch_lookup_matches_find_in_index():
+    """batch_lookup renvoie le commune_id de _find_in_index, -1 si absent"""
+    matcher = _matcher_with_index()
+
+    queries = [
+        ("paris", "75001"),
+        ("st denis", "93200"),
+        ("st denis", "97400"),
+        ("st denis", ""),         # Sans code postal : la plus peuplée
+        ("st denis", "99999"),    # Code postal inconnu : repli sur le nom
+        ("besancon", None),
+        ("inconnue", "75001"),
+        ("", ""),
+    ]
+    names = [name for name, _ in queries]
+    postals = [postal or "" for _, postal in queries]
+    expected = [matcher._find_in_index(name, postal) or -1 for name, postal in queries]
+
+    assert [int(cid) for cid in matcher.batch_lookup(names, postals)] == expected
+
+    # Sans codes postaux : stratégie 2 seule
+    expected_by_name = [matcher._by_name.get(name, -1) for name in names]
+    assert [int(cid) for cid in matcher.batch_lookup(names)] == expected_by_name
+
+    # Même résultat sans NumPy
+    if geo_matcher.NUMPY_AVAILABLE:
+        geo_matcher.NUMPY_AVAILABLE = False
+        try:
+            assert list(matcher.batch_lookup(names, postals)) == expected
+        finally:
+            geo_matcher.NUMPY_AVAILABLE = True
+
+
+def test_database_error_not_cached():
+    """Une erreur de base n'est retenue par aucun cache : nouvel essai au prochain appel"""
+    matcher = _matcher_with_index()
+    matcher._lookup_cached = lru_cache(maxsize=GeoMatcher.CACHE_SIZE)(matcher._lookup)
+    matcher._misses = set()
+    matcher._redis = None
+    matcher._find_commune_fuzzy = lambda conn, city_normalized, postal_code=None: 42
+
+    def failing_connect():
+        raise ConnectionError("base indisponible")
+
+    matcher._connect = failing_connect
+    assert matcher.find_commune_id("Lyon", "69001") is None
+    assert matcher.find_commune_ids_bulk([("Lyon", "69001")]) == {("Lyon", "69001"): None}
+    assert not matcher._misses
+
+    matcher._connect = _FakeConnection
+    assert matcher.find_commune_id("Lyon", "69001") == 42
+    assert matcher.find_commune_ids_bulk([("Lyon", "69001")]) == {("Lyon", "69001"): 42}
+
+
+if __name__ == "__main__":
+    test_normalize_matches_generated_column()
+    test_ascii_fast_path_matches_translate()
+    test_batch_lookup_matches_find_in_index()
+    test_database_error_not_cached()
+    print("✅ Tests GeoMatcher réussis")
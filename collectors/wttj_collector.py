@@ -155,7 +155,6 @@ class WTTJCollector:
             Nom de l'entreprise en majuscules
         """
         try:
-            import re
             match = re.search(r'/companies/([^/]+)/jobs/', url)
             if match:
                 company_slug = match.group(1)
@@ -180,7 +179,6 @@ class WTTJCollector:
             Nom de la ville
         """
         try:
-            import re
             # Format: job-title_city_code
             match = re.search(r'/jobs/[^_]+_([^_/]+)', url)
             if match:
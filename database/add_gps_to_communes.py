@@ -8,6 +8,13 @@ Utilise geopy (Nominatim) pour géocoder les communes françaises
 - Pour 35,000 communes ≈ 10 heures
 - Recommandé : géocoder par batch ou utiliser une API payante
 
+Les requêtes sont asynchrones (geopy AioHTTPAdapter) : l'AsyncRateLimiter
+espace les appels, le traitement des réponses et les écritures en base
+ne s'ajoutent plus au délai de 1 s.
+
+Pour un rattrapage massif, --provider geoapify utilise l'API batch de
+Geoapify (jusqu'à 1000 adresses par requête, GEOAPIFY_API_KEY dans .env).
+
 Usage:
     # Géocoder toutes les communes sans GPS
     python add_gps_to_communes.py --all
@@ -17,14 +24,19 @@ Usage:
 
     # Géocoder une région spécifique
     python add_gps_to_communes.py --region "Île-de-France"
+
+    # Rattrapage massif via l'API batch Geoapify
+    python add_gps_to_communes.py --all --provider geoapify
 """
 
 import pandas as pd
+import numpy as np
 from sqlalchemy import create_engine, text
 import os
 from dotenv import load_dotenv
-from time import sleep
 from tqdm import tqdm
+import asyncio
+import io
 import argparse
 from pathlib import Path
 
@@ -35,62 +47,382 @@ if env_path.exists():
 else:
     load_dotenv()
 
-# Installer avec: pip install geopy
+# Installer avec: pip install geopy aiohttp
 try:
+    import aiohttp
     from geopy.geocoders import Nominatim
-    from geopy.exc import GeocoderTimedOut, GeocoderServiceError
+    from geopy.adapters import AioHTTPAdapter
+    from geopy.extra.rate_limiter import AsyncRateLimiter
 except ImportError:
-    print("❌ geopy non installé. Installez avec: pip install geopy")
+    print("❌ geopy/aiohttp non installé. Installez avec: pip install geopy aiohttp")
     exit(1)
 
+# Nombre de communes géocodées avant chaque écriture en base
+# (~8 min à 1 req/s : limite la perte en cas d'interruption)
+GEOCODE_CHUNK_SIZE = 500
+
+# API batch Geoapify : taille max d'un job et intervalle de polling
+GEOAPIFY_BATCH_URL = "https://api.geoapify.com/v1/batch/geocode/search"
+GEOAPIFY_BATCH_SIZE = 1000
+GEOAPIFY_POLL_SECONDS = 3.0
+GEOAPIFY_TIMEOUT_SECONDS = 600
+
+# Colonnes identifiant une requête de géocodage (communes partageant
+# nom + code postal + département => une seule requête)
+GEO_KEY_COLUMNS = ["nom_commune", "code_postal", "nom_departement"]
 
-def geocode_commune(row, geolocator, retries=3):
+
+def add_geo_keys(df):
     """
-    Géocode une commune française
+    Attribuer à chaque commune l'identifiant de sa requête de géocodage
+
+    Args:
+        df: Communes à géocoder (modifié en place : colonne geo_key)
+
+    Returns:
+        DataFrame des requêtes distinctes (une ligne par geo_key)
+    """
+    df["geo_key"] = df.groupby(GEO_KEY_COLUMNS, dropna=False, sort=False).ngroup()
+    return df.drop_duplicates("geo_key")
+
+
+def build_query(row):
+    """
+    Construit la requête de géocodage d'une commune
 
     Args:
         row: Ligne du DataFrame (commune)
-        geolocator: Instance de Nominatim
-        retries: Nombre de tentatives
 
     Returns:
-        (latitude, longitude) ou (None, None)
+        Adresse texte "commune, code postal, département, France"
     """
-    # Construire la requête optimale
-    query = (
+    return (
         f"{row['nom_commune']}, {row['code_postal']}, {row['nom_departement']}, France"
     )
 
-    for attempt in range(retries):
-        try:
-            location = geolocator.geocode(query, timeout=10)
-            if location:
-                return location.latitude, location.longitude
 
-            # Si échec, essayer sans département
-            query_simple = f"{row['nom_commune']}, {row['code_postal']}, France"
-            location = geolocator.geocode(query_simple, timeout=10)
-            if location:
-                return location.latitude, location.longitude
+class GeoapifyBatchGeocoder:
+    """
+    Géocodeur batch Geoapify (une requête POST par lot d'adresses)
 
-            return None, None
+    Le POST crée un job asynchrone côté Geoapify, dont le résultat est
+    récupéré en interrogeant l'URL retournée jusqu'à ce qu'il soit prêt.
+    Une seule session aiohttp est partagée entre tous les lots.
+    """
+
+    def __init__(self, api_key: str):
+        """
+        Args:
+            api_key: Clé API Geoapify
+        """
+        self.api_key = api_key
+        self.session = None
+
+    async def __aenter__(self):
+        self.session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=60)
+        )
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.session.close()
+        self.session = None
+
+    async def geocode_batch(self, queries):
+        """
+        Géocode un lot d'adresses (dédoublonnées avant envoi)
 
-        except (GeocoderTimedOut, GeocoderServiceError):
-            if attempt < retries - 1:
-                sleep(2)
-            else:
-                return None, None
+        Args:
+            queries: Liste d'adresses texte (<= GEOAPIFY_BATCH_SIZE distinctes)
+
+        Returns:
+            Liste de (latitude, longitude) ou (None, None), dans l'ordre des requêtes
+        """
+        unique_queries = list(dict.fromkeys(queries))
+        params = {
+            "apiKey": self.api_key,
+            "filter": "countrycode:fr",
+            "lang": "fr",
+            "type": "city",
+        }
+
+        async with self.session.post(
+            GEOAPIFY_BATCH_URL, params=params, json=unique_queries
+        ) as resp:
+            if resp.status not in (200, 202):
+                raise RuntimeError(
+                    f"Geoapify batch: HTTP {resp.status} - {await resp.text()}"
+                )
+            job = await resp.json()
+
+        results = await self._wait_for_job(job)
+
+        # Les résultats suivent l'ordre des adresses envoyées
+        coords = {}
+        for query, result in zip(unique_queries, results):
+            lat = result.get("lat") if isinstance(result, dict) else None
+            lon = result.get("lon") if isinstance(result, dict) else None
+            coords[query] = (lat, lon) if lat is not None and lon is not None else (None, None)
+
+        return [coords.get(q, (None, None)) for q in queries]
+
+    async def _wait_for_job(self, job):
+        """
+        Attendre la fin d'un job batch Geoapify
+
+        Args:
+            job: Réponse JSON du POST (id, url)
+
+        Returns:
+            Liste des résultats du job
+        """
+        url = job.get("url") or f"{GEOAPIFY_BATCH_URL}?id={job['id']}&apiKey={self.api_key}"
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + GEOAPIFY_TIMEOUT_SECONDS
+
+        while loop.time() < deadline:
+            await asyncio.sleep(GEOAPIFY_POLL_SECONDS)
+            async with self.session.get(url) as resp:
+                if resp.status == 202:
+                    continue  # Job encore en cours
+                if resp.status != 200:
+                    raise RuntimeError(
+                        f"Geoapify batch: HTTP {resp.status} - {await resp.text()}"
+                    )
+                return await resp.json()
+
+        raise TimeoutError(f"Geoapify batch: job {job.get('id')} non terminé")
+
+
+async def geocode_commune(row, geocode):
+    """
+    Géocode une commune française
+
+    Args:
+        row: Ligne du DataFrame (commune)
+        geocode: geolocator.geocode encapsulé dans un AsyncRateLimiter
+
+    Returns:
+        (latitude, longitude) ou (None, None)
+    """
+    # Construire la requête optimale
+    query = build_query(row)
+
+    location = await geocode(query, timeout=10)
+    if location:
+        return location.latitude, location.longitude
+
+    # Si échec, essayer sans département
+    query_simple = f"{row['nom_commune']}, {row['code_postal']}, France"
+    location = await geocode(query_simple, timeout=10)
+    if location:
+        return location.latitude, location.longitude
 
     return None, None
 
 
-def add_gps_to_communes(limit=None, region=None):
+async def geocode_communes(rows, geocode, pbar):
+    """
+    Géocode une liste de communes en respectant la limite Nominatim
+
+    Toutes les requêtes sont lancées d'un coup ; l'AsyncRateLimiter les
+    espace d'au moins 1 s et relance en cas d'erreur réseau.
+
+    Args:
+        rows: Liste de lignes du DataFrame
+        geocode: geolocator.geocode encapsulé dans un AsyncRateLimiter
+        pbar: Barre de progression tqdm
+
+    Returns:
+        Liste de (latitude, longitude), dans l'ordre des lignes
+    """
+
+    async def geocode_and_track(row):
+        result = await geocode_commune(row, geocode)
+        pbar.update(1)
+        return result
+
+    return await asyncio.gather(*(geocode_and_track(row) for row in rows))
+
+
+async def geocode_dataframe(df, engine):
+    """
+    Géocode toutes les communes du DataFrame et écrit les résultats en base
+
+    Un seul géocodeur (et donc une seule session HTTP aiohttp, connexions
+    TCP/TLS réutilisées) sert pour tous les chunks.
+
+    Args:
+        df: Communes à géocoder (modifié en place : latitude, longitude)
+        engine: Engine SQLAlchemy
+
+    Returns:
+        (nombre de succès, nombre d'échecs)
+    """
+    success_count = 0
+    fail_count = 0
+
+    async with Nominatim(
+        user_agent="atlas_job_analysis", adapter_factory=AioHTTPAdapter
+    ) as geolocator:
+        geocode = AsyncRateLimiter(
+            geolocator.geocode,
+            min_delay_seconds=1.0,
+            max_retries=2,
+            error_wait_seconds=2.0,
+            swallow_exceptions=True,
+            return_value_on_exception=None,
+        )
+
+        unique = add_geo_keys(df)
+
+        with tqdm(total=len(unique), desc="Géocodage") as pbar:
+            for start in range(0, len(unique), GEOCODE_CHUNK_SIZE):
+                chunk = unique.iloc[start : start + GEOCODE_CHUNK_SIZE]
+                rows = chunk.to_dict("records")
+
+                results = await geocode_communes(rows, geocode, pbar)
+
+                found, total = store_chunk_results(df, chunk, results, engine)
+                success_count += found
+                fail_count += total - found
+
+    return success_count, fail_count
+
+
+async def geocode_dataframe_geoapify(df, engine, api_key):
+    """
+    Géocode toutes les communes du DataFrame via l'API batch Geoapify
+
+    Args:
+        df: Communes à géocoder (modifié en place : latitude, longitude)
+        engine: Engine SQLAlchemy
+        api_key: Clé API Geoapify
+
+    Returns:
+        (nombre de succès, nombre d'échecs)
+    """
+    success_count = 0
+    fail_count = 0
+
+    async with GeoapifyBatchGeocoder(api_key) as geocoder:
+        unique = add_geo_keys(df)
+
+        with tqdm(total=len(unique), desc="Géocodage (Geoapify)") as pbar:
+            for start in range(0, len(unique), GEOAPIFY_BATCH_SIZE):
+                chunk = unique.iloc[start : start + GEOAPIFY_BATCH_SIZE]
+                queries = [build_query(row) for row in chunk.to_dict("records")]
+
+                results = await geocoder.geocode_batch(queries)
+                pbar.update(len(queries))
+
+                found, total = store_chunk_results(df, chunk, results, engine)
+                success_count += found
+                fail_count += total - found
+
+    return success_count, fail_count
+
+
+def store_chunk_results(df, chunk, results, engine):
+    """
+    Reporter les résultats d'un chunk dans le DataFrame et en base
+
+    Chaque résultat est propagé à toutes les communes partageant la même
+    requête (geo_key).
+
+    Args:
+        df: DataFrame complet (modifié en place : latitude, longitude)
+        chunk: Requêtes distinctes géocodées (lignes de df, colonne geo_key)
+        results: Liste de (latitude, longitude), dans l'ordre de chunk
+        engine: Engine SQLAlchemy
+
+    Returns:
+        (communes géocodées avec succès, communes couvertes par le chunk)
+    """
+    # Résultats par geo_key (NaN = échec)
+    coords = np.array(
+        [(lat, lon) if lat and lon else (np.nan, np.nan) for lat, lon in results],
+        dtype=float,
+    ).reshape(-1, 2)
+    found = ~np.isnan(coords).any(axis=1)
+    coords_by_key = dict(zip(chunk["geo_key"].to_numpy()[found], coords[found]))
+
+    # Report vectorisé sur toutes les communes du chunk
+    covered = df["geo_key"].isin(chunk["geo_key"])
+    mask = covered & df["geo_key"].isin(list(coords_by_key))
+    idxs = df.index[mask]
+    if len(idxs):
+        matched = np.vstack([coords_by_key[k] for k in df.loc[idxs, "geo_key"]])
+        df.loc[idxs, ["latitude", "longitude"]] = matched
+
+        update_communes_gps(
+            engine,
+            df.loc[idxs, "commune_id"].astype(int).tolist(),
+            matched[:, 0].tolist(),
+            matched[:, 1].tolist(),
+        )
+
+    return len(idxs), int(covered.sum())
+
+
+def update_communes_gps(engine, ids, lats, lons):
+    """
+    Écrire les coordonnées GPS en base (COPY + UPDATE ciblé)
+
+    Les coordonnées sont chargées par COPY dans une table temporaire, puis
+    un seul UPDATE ... FROM ne touche que les communes géocodées.
+
+    Args:
+        engine: Engine SQLAlchemy
+        ids: commune_id à mettre à jour
+        lats: Latitudes
+        lons: Longitudes
+    """
+    if not ids:
+        return
+
+    buf = io.StringIO()
+    buf.writelines(f"{i}\t{lat!r}\t{lon!r}\n" for i, lat, lon in zip(ids, lats, lons))
+    buf.seek(0)
+
+    raw_conn = engine.raw_connection()
+    try:
+        cursor = raw_conn.cursor()
+        cursor.execute(
+            """
+            CREATE TEMP TABLE tmp_communes_gps (
+                commune_id integer,
+                latitude double precision,
+                longitude double precision
+            ) ON COMMIT DROP
+        """
+        )
+        cursor.copy_expert("COPY tmp_communes_gps FROM STDIN", buf)
+        cursor.execute(
+            """
+            UPDATE ref_communes_france AS c
+            SET latitude = t.latitude, longitude = t.longitude, updated_at = NOW()
+            FROM tmp_communes_gps AS t
+            WHERE c.commune_id = t.commune_id
+        """
+        )
+        cursor.close()
+        raw_conn.commit()
+    except Exception:
+        raw_conn.rollback()
+        raise
+    finally:
+        raw_conn.close()
+
+
+def add_gps_to_communes(limit=None, region=None, provider="nominatim"):
     """
     Ajouter les coordonnées GPS aux communes
 
     Args:
         limit: Limiter à N communes (pour test)
         region: Ne traiter qu'une région spécifique
+        provider: "nominatim" (1 req/s) ou "geoapify" (API batch)
     """
     print("=" * 70)
     print("AJOUT DES COORDONNÉES GPS À REF_COMMUNES_FRANCE")
@@ -101,25 +433,37 @@ def add_gps_to_communes(limit=None, region=None):
     if not db_url:
         raise ValueError("❌ DATABASE_URL requis dans .env")
 
+    geoapify_key = None
+    if provider == "geoapify":
+        geoapify_key = os.getenv("GEOAPIFY_API_KEY")
+        if not geoapify_key:
+            raise ValueError("❌ GEOAPIFY_API_KEY requis dans .env")
+
     engine = create_engine(db_url)
 
     # Charger les communes sans GPS
     print("\n📥 Chargement des communes sans GPS...")
 
+    # Seulement les colonnes utiles au géocodage (filtrage côté serveur)
     query = """
-        SELECT * FROM ref_communes_france
-        WHERE latitude IS NULL OR longitude IS NULL
+        SELECT commune_id, nom_commune, code_postal, nom_departement,
+               latitude, longitude
+        FROM ref_communes_france
+        WHERE (latitude IS NULL OR longitude IS NULL)
     """
+    params = {}
 
     if region:
-        query += f" AND nom_region = '{region}'"
+        query += " AND nom_region = :region"
+        params["region"] = region
 
     query += " ORDER BY population DESC NULLS LAST"
 
     if limit:
-        query += f" LIMIT {limit}"
+        query += " LIMIT :limit"
+        params["limit"] = int(limit)
 
-    df = pd.read_sql(query, engine)
+    df = pd.read_sql(text(query), engine, params=params)
 
     print(f"   ✅ {len(df)} communes à géocoder")
 
@@ -127,14 +471,22 @@ def add_gps_to_communes(limit=None, region=None):
         print("\n✅ Toutes les communes ont déjà des coordonnées GPS !")
         return
 
-    # Estimation temps
-    estimated_minutes = (len(df) * 1.2) / 60
+    # Estimation temps (une requête par combinaison distincte)
+    n_queries = len(df.drop_duplicates(GEO_KEY_COLUMNS))
+    print(f"   • Requêtes distinctes: {n_queries}")
 
-    print(f"\n⏱️  Estimation:")
-    print(
-        f"   • Temps: ~{estimated_minutes:.0f} minutes ({estimated_minutes/60:.1f} heures)"
-    )
-    print(f"   • Limite Nominatim: 1 requête/seconde")
+    if provider == "nominatim":
+        estimated_minutes = (n_queries * 1.2) / 60
+
+        print(f"\n⏱️  Estimation:")
+        print(
+            f"   • Temps: ~{estimated_minutes:.0f} minutes ({estimated_minutes/60:.1f} heures)"
+        )
+        print(f"   • Limite Nominatim: 1 requête/seconde")
+    else:
+        n_jobs = -(-n_queries // GEOAPIFY_BATCH_SIZE)
+        print(f"\n⏱️  Estimation:")
+        print(f"   • Jobs batch Geoapify: {n_jobs} (≤ {GEOAPIFY_BATCH_SIZE} adresses)")
 
     # Afficher échantillon
     print(f"\n📋 Échantillon des communes à géocoder:")
@@ -152,44 +504,15 @@ def add_gps_to_communes(limit=None, region=None):
         print("❌ Annulé")
         return
 
-    # Initialiser le géocodeur
-    print("\n🌍 Initialisation du géocodeur Nominatim...")
-    geolocator = Nominatim(user_agent="atlas_job_analysis")
-
-    # Géocoder
-    print("\n🔄 Géocodage en cours...")
-
-    success_count = 0
-    fail_count = 0
-
-    for idx in tqdm(df.index, desc="Géocodage"):
-        row = df.loc[idx]
-
-        lat, lon = geocode_commune(row, geolocator)
-
-        if lat and lon:
-            # Mettre à jour directement en base
-            with engine.begin() as conn:
-                conn.execute(
-                    text(
-                        """
-                        UPDATE ref_communes_france
-                        SET latitude = :lat, longitude = :lon, updated_at = NOW()
-                        WHERE commune_id = :id
-                    """
-                    ),
-                    {
-                        "lat": float(lat),
-                        "lon": float(lon),
-                        "id": int(row["commune_id"]),
-                    },
-                )
-            success_count += 1
-        else:
-            fail_count += 1
-
-        # Respecter la limite de taux (1 req/sec)
-        sleep(1.1)
+    # Géocoder (par chunks, une écriture en base par chunk)
+    if provider == "geoapify":
+        print("\n🔄 Géocodage en cours (Geoapify batch)...")
+        success_count, fail_count = asyncio.run(
+            geocode_dataframe_geoapify(df, engine, geoapify_key)
+        )
+    else:
+        print("\n🔄 Géocodage en cours (Nominatim, asynchrone)...")
+        success_count, fail_count = asyncio.run(geocode_dataframe(df, engine))
 
     # Résultats
     print(f"\n" + "=" * 70)
@@ -241,6 +564,13 @@ def main():
         help="Géocoder toutes les communes (peut prendre 10h+)",
     )
 
+    parser.add_argument(
+        "--provider",
+        choices=["nominatim", "geoapify"],
+        default="nominatim",
+        help="Service de géocodage (geoapify : API batch, GEOAPIFY_API_KEY requis)",
+    )
+
     args = parser.parse_args()
 
     if not args.all and not args.limit and not args.region:
@@ -248,7 +578,7 @@ def main():
 
     limit = args.limit if args.limit else (None if args.all else 100)
 
-    add_gps_to_communes(limit=limit, region=args.region)
+    add_gps_to_communes(limit=limit, region=args.region, provider=args.provider)
 
 
 if __name__ == "__main__":
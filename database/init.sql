@@ -20,14 +20,28 @@ CREATE TABLE dim_sources (
 CREATE TABLE dim_dates (
     date_id SERIAL PRIMARY KEY,
     full_date DATE UNIQUE NOT NULL,
-    year INTEGER,
-    quarter INTEGER,
-    month INTEGER,
-    month_name VARCHAR(20),
-    week INTEGER,
-    day_of_week INTEGER,
-    day_name VARCHAR(20),
-    is_weekend BOOLEAN
+    -- Attributs générés depuis full_date
+    year INTEGER GENERATED ALWAYS AS (EXTRACT(YEAR FROM full_date)::int) STORED,
+    quarter INTEGER GENERATED ALWAYS AS (EXTRACT(QUARTER FROM full_date)::int) STORED,
+    month INTEGER GENERATED ALWAYS AS (EXTRACT(MONTH FROM full_date)::int) STORED,
+    month_name VARCHAR(20) GENERATED ALWAYS AS (
+        CASE EXTRACT(MONTH FROM full_date)::int
+            WHEN 1 THEN 'Janvier' WHEN 2 THEN 'Février' WHEN 3 THEN 'Mars'
+            WHEN 4 THEN 'Avril' WHEN 5 THEN 'Mai' WHEN 6 THEN 'Juin'
+            WHEN 7 THEN 'Juillet' WHEN 8 THEN 'Août' WHEN 9 THEN 'Septembre'
+            WHEN 10 THEN 'Octobre' WHEN 11 THEN 'Novembre' WHEN 12 THEN 'Décembre'
+        END
+    ) STORED,
+    week INTEGER GENERATED ALWAYS AS (EXTRACT(WEEK FROM full_date)::int) STORED,
+    day_of_week INTEGER GENERATED ALWAYS AS (EXTRACT(ISODOW FROM full_date)::int) STORED,
+    day_name VARCHAR(20) GENERATED ALWAYS AS (
+        CASE EXTRACT(ISODOW FROM full_date)::int
+            WHEN 1 THEN 'Lundi' WHEN 2 THEN 'Mardi' WHEN 3 THEN 'Mercredi'
+            WHEN 4 THEN 'Jeudi' WHEN 5 THEN 'Vendredi' WHEN 6 THEN 'Samedi'
+            WHEN 7 THEN 'Dimanche'
+        END
+    ) STORED,
+    is_weekend BOOLEAN GENERATED ALWAYS AS (EXTRACT(ISODOW FROM full_date) >= 6) STORED
 );
 
 CREATE TABLE dim_locations (
@@ -39,13 +53,14 @@ CREATE TABLE dim_locations (
     region VARCHAR(100) NOT NULL,
     latitude DECIMAL(10,7),
     longitude DECIMAL(10,7),
-    created_at TIMESTAMP DEFAULT NOW()
+    created_at TIMESTAMP DEFAULT NOW(),
+    UNIQUE (city, department_code)
 );
 
 CREATE TABLE dim_job_categories (
     job_category_id SERIAL PRIMARY KEY,
     category_name VARCHAR(255) UNIQUE NOT NULL,
-    category_code VARCHAR(50),
+    category_code VARCHAR(50) UNIQUE,
     parent_category_id INTEGER REFERENCES dim_job_categories(job_category_id),
     level INTEGER DEFAULT 1,
     created_at TIMESTAMP DEFAULT NOW()
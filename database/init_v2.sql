@@ -7,14 +7,25 @@
 CREATE TABLE public.dim_dates (
 	date_id serial4 NOT NULL,
 	full_date date NOT NULL,
-	"year" int4 NULL,
-	quarter int4 NULL,
-	"month" int4 NULL,
-	month_name varchar(20) NULL,
-	week int4 NULL,
-	day_of_week int4 NULL,
-	day_name varchar(20) NULL,
-	is_weekend bool NULL,
+	"year" int4 GENERATED ALWAYS AS (EXTRACT(year FROM full_date)::int4) STORED NULL,
+	quarter int4 GENERATED ALWAYS AS (EXTRACT(quarter FROM full_date)::int4) STORED NULL,
+	"month" int4 GENERATED ALWAYS AS (EXTRACT(month FROM full_date)::int4) STORED NULL,
+	month_name varchar(20) GENERATED ALWAYS AS (
+CASE EXTRACT(month FROM full_date)::int4
+    WHEN 1 THEN 'Janvier'::text WHEN 2 THEN 'Février'::text WHEN 3 THEN 'Mars'::text
+    WHEN 4 THEN 'Avril'::text WHEN 5 THEN 'Mai'::text WHEN 6 THEN 'Juin'::text
+    WHEN 7 THEN 'Juillet'::text WHEN 8 THEN 'Août'::text WHEN 9 THEN 'Septembre'::text
+    WHEN 10 THEN 'Octobre'::text WHEN 11 THEN 'Novembre'::text WHEN 12 THEN 'Décembre'::text
+END) STORED NULL,
+	week int4 GENERATED ALWAYS AS (EXTRACT(week FROM full_date)::int4) STORED NULL,
+	day_of_week int4 GENERATED ALWAYS AS (EXTRACT(isodow FROM full_date)::int4) STORED NULL,
+	day_name varchar(20) GENERATED ALWAYS AS (
+CASE EXTRACT(isodow FROM full_date)::int4
+    WHEN 1 THEN 'Lundi'::text WHEN 2 THEN 'Mardi'::text WHEN 3 THEN 'Mercredi'::text
+    WHEN 4 THEN 'Jeudi'::text WHEN 5 THEN 'Vendredi'::text WHEN 6 THEN 'Samedi'::text
+    WHEN 7 THEN 'Dimanche'::text
+END) STORED NULL,
+	is_weekend bool GENERATED ALWAYS AS (EXTRACT(isodow FROM full_date) >= 6::numeric) STORED NULL,
 	CONSTRAINT dim_dates_full_date_key UNIQUE (full_date),
 	CONSTRAINT dim_dates_pkey PRIMARY KEY (date_id)
 );
@@ -94,6 +105,7 @@ CREATE TABLE public.ref_communes_france (
 	superficie_km2 numeric(10, 2) NULL,
 	created_at timestamp DEFAULT now() NULL,
 	updated_at timestamp DEFAULT now() NULL,
+	nom_commune_normalise text GENERATED ALWAYS AS (lower(btrim(regexp_replace(translate(nom_commune::text, 'àâäéèêëïîôùûüÿçÀÂÄÉÈÊËÏÎÔÙÛÜŸÇ-'''::text, 'aaaeeeeiiouuuycAAAEEEEIIOUUUYC  '::text), '\s+'::text, ' '::text, 'g'::text)))) STORED NULL,
 	CONSTRAINT ref_communes_france_code_insee_code_postal_key UNIQUE (code_insee, code_postal),
 	CONSTRAINT ref_communes_france_code_insee_key UNIQUE (code_insee),
 	CONSTRAINT ref_communes_france_pkey PRIMARY KEY (commune_id)
@@ -103,6 +115,8 @@ CREATE INDEX idx_commune_code_postal ON public.ref_communes_france USING btree (
 CREATE INDEX idx_commune_departement ON public.ref_communes_france USING btree (code_departement);
 CREATE INDEX idx_commune_nom ON public.ref_communes_france USING btree (nom_commune);
 CREATE INDEX idx_commune_nom_trgm ON public.ref_communes_france USING gin (nom_commune gin_trgm_ops);
+CREATE INDEX idx_commune_nom_normalise_population ON public.ref_communes_france USING btree (nom_commune_normalise, population DESC NULLS LAST);
+CREATE INDEX idx_commune_postal_nom_normalise ON public.ref_communes_france USING btree (code_postal, nom_commune_normalise);
 CREATE INDEX idx_commune_region ON public.ref_communes_france USING btree (code_region);
 COMMENT ON TABLE public.ref_communes_france IS 'Référentiel officiel des communes françaises (source: data.gouv.fr)';
 
@@ -215,6 +229,8 @@ CREATE TABLE public.job_embeddings (
 	embedding_id serial4 NOT NULL,
 	offer_id int4 NULL,
 	embedding public.vector NULL,
+	embedding_q bytea NULL,
+	embedding_scale float4 NULL,
 	model_name varchar(100) NULL,
 	created_at timestamp DEFAULT now() NULL,
 	CONSTRAINT job_embeddings_offer_id_key UNIQUE (offer_id),
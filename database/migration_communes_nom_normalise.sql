@@ -0,0 +1,35 @@
+-- ============================================================================
+-- MIGRATION COMMUNES NOM NORMALISÉ
+-- ============================================================================
+-- Nom de commune normalisé (sans accents, tirets ni apostrophes, minuscules)
+-- stocké en colonne générée et indexé : les recherches de collectors/geo_matcher.py
+-- ne recalculent plus TRANSLATE sur les ~35k lignes à chaque requête
+-- Date: 2026-10-16
+-- ============================================================================
+
+BEGIN;
+
+-- 1. COLONNE GÉNÉRÉE (même table de correspondance que _ACCENT_TABLE côté Python)
+ALTER TABLE public.ref_communes_france
+    ADD COLUMN IF NOT EXISTS nom_commune_normalise text GENERATED ALWAYS AS (
+        lower(btrim(regexp_replace(
+            translate(nom_commune,
+                'àâäéèêëïîôùûüÿçÀÂÄÉÈÊËÏÎÔÙÛÜŸÇ-''',
+                'aaaeeeeiiouuuycAAAEEEEIIOUUUYC  '),
+            '\s+', ' ', 'g')))
+    ) STORED;
+
+-- 2. INDEX
+-- Stratégie 1 : code postal + nom normalisé
+CREATE INDEX IF NOT EXISTS idx_commune_postal_nom_normalise
+    ON public.ref_communes_france USING btree (code_postal, nom_commune_normalise);
+
+-- Stratégie 2 : nom normalisé, commune la plus peuplée en premier
+CREATE INDEX IF NOT EXISTS idx_commune_nom_normalise_population
+    ON public.ref_communes_france USING btree (nom_commune_normalise, population DESC NULLS LAST);
+
+COMMIT;
+
+-- ============================================================================
+-- FIN DE LA MIGRATION
+-- ============================================================================
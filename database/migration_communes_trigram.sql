@@ -0,0 +1,34 @@
+-- ============================================================================
+-- MIGRATION COMMUNES TRIGRAM
+-- ============================================================================
+-- Recherche approchée des communes (stratégie 3 de collectors/geo_matcher.py) :
+-- unaccent + pg_trgm et index GIN trigramme sur le nom sans accents
+-- Date: 2026-10-17
+-- ============================================================================
+
+BEGIN;
+
+-- 1. EXTENSIONS
+CREATE EXTENSION IF NOT EXISTS unaccent;
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- 2. WRAPPER IMMUTABLE
+-- unaccent() est STABLE (dépend du search_path) et ne peut pas être indexée :
+-- dictionnaire qualifié par son schéma pour pouvoir déclarer IMMUTABLE
+CREATE OR REPLACE FUNCTION public.f_unaccent(text)
+    RETURNS text
+    LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+AS $$
+    SELECT public.unaccent('public.unaccent'::regdictionary, $1)
+$$;
+
+-- 3. INDEX GIN TRIGRAMME (utilisé par l'opérateur % et similarity())
+-- L'expression doit être identique à celle des requêtes de GeoMatcher
+CREATE INDEX IF NOT EXISTS idx_commune_nom_unaccent_trgm
+    ON public.ref_communes_france USING gin (public.f_unaccent(lower(nom_commune)) gin_trgm_ops);
+
+COMMIT;
+
+-- ============================================================================
+-- FIN DE LA MIGRATION
+-- ============================================================================
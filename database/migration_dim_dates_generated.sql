@@ -0,0 +1,51 @@
+-- ============================================================================
+-- MIGRATION DIM_DATES GENERATED COLUMNS
+-- ============================================================================
+-- Les attributs de dim_dates deviennent des colonnes générées à partir de
+-- full_date : les inserteurs n'envoient plus que la date (PostgreSQL >= 12)
+-- Date: 2026-10-16
+-- ============================================================================
+
+BEGIN;
+
+-- 1. SUPPRESSION DES COLONNES CALCULÉES CÔTÉ PYTHON
+-- (une colonne existante ne peut pas être convertie en colonne générée)
+ALTER TABLE public.dim_dates
+    DROP COLUMN IF EXISTS "year",
+    DROP COLUMN IF EXISTS quarter,
+    DROP COLUMN IF EXISTS "month",
+    DROP COLUMN IF EXISTS month_name,
+    DROP COLUMN IF EXISTS week,
+    DROP COLUMN IF EXISTS day_of_week,
+    DROP COLUMN IF EXISTS day_name,
+    DROP COLUMN IF EXISTS is_weekend;
+
+-- 2. RECRÉATION EN COLONNES GÉNÉRÉES (recalculées pour les lignes existantes)
+ALTER TABLE public.dim_dates
+    ADD COLUMN "year" int4 GENERATED ALWAYS AS (EXTRACT(YEAR FROM full_date)::int4) STORED,
+    ADD COLUMN quarter int4 GENERATED ALWAYS AS (EXTRACT(QUARTER FROM full_date)::int4) STORED,
+    ADD COLUMN "month" int4 GENERATED ALWAYS AS (EXTRACT(MONTH FROM full_date)::int4) STORED,
+    ADD COLUMN month_name varchar(20) GENERATED ALWAYS AS (
+        CASE EXTRACT(MONTH FROM full_date)::int4
+            WHEN 1 THEN 'Janvier' WHEN 2 THEN 'Février' WHEN 3 THEN 'Mars'
+            WHEN 4 THEN 'Avril' WHEN 5 THEN 'Mai' WHEN 6 THEN 'Juin'
+            WHEN 7 THEN 'Juillet' WHEN 8 THEN 'Août' WHEN 9 THEN 'Septembre'
+            WHEN 10 THEN 'Octobre' WHEN 11 THEN 'Novembre' WHEN 12 THEN 'Décembre'
+        END
+    ) STORED,
+    ADD COLUMN week int4 GENERATED ALWAYS AS (EXTRACT(WEEK FROM full_date)::int4) STORED,  -- Semaine ISO
+    ADD COLUMN day_of_week int4 GENERATED ALWAYS AS (EXTRACT(ISODOW FROM full_date)::int4) STORED,  -- 1 = lundi
+    ADD COLUMN day_name varchar(20) GENERATED ALWAYS AS (
+        CASE EXTRACT(ISODOW FROM full_date)::int4
+            WHEN 1 THEN 'Lundi' WHEN 2 THEN 'Mardi' WHEN 3 THEN 'Mercredi'
+            WHEN 4 THEN 'Jeudi' WHEN 5 THEN 'Vendredi' WHEN 6 THEN 'Samedi'
+            WHEN 7 THEN 'Dimanche'
+        END
+    ) STORED,
+    ADD COLUMN is_weekend bool GENERATED ALWAYS AS (EXTRACT(ISODOW FROM full_date) >= 6) STORED;
+
+COMMIT;
+
+-- ============================================================================
+-- FIN DE LA MIGRATION
+-- ============================================================================
@@ -0,0 +1,26 @@
+-- ============================================================================
+-- MIGRATION EMBEDDING QUANTIZATION
+-- ============================================================================
+-- Stockage compact des embeddings : int8 + échelle par vecteur
+-- (embedding ≈ embedding_q * embedding_scale, cf. NLP/modules/embedding_generator.py)
+-- ============================================================================
+
+-- 1. AJOUT DES COLONNES QUANTIFIÉES à job_embeddings
+ALTER TABLE public.job_embeddings
+    ADD COLUMN IF NOT EXISTS embedding_q BYTEA NULL,  -- Vecteur int8 (1 octet/dimension)
+    ADD COLUMN IF NOT EXISTS embedding_scale REAL NULL;  -- Échelle (max(|x|) / 127)
+
+-- 2. COMMENTAIRES sur les nouvelles colonnes
+COMMENT ON COLUMN public.job_embeddings.embedding_q IS 'Embedding quantifié en int8 (4x plus compact que float32)';
+COMMENT ON COLUMN public.job_embeddings.embedding_scale IS 'Échelle de déquantification (embedding = embedding_q * embedding_scale)';
+
+-- 3. OPTION pgvector >= 0.7 : demi-précision native (fp16, 2x plus compact)
+-- La colonne embedding reste utilisée pour la détection de doublons (<=>).
+-- ALTER TABLE public.job_embeddings ALTER COLUMN embedding TYPE halfvec(384);
+-- DROP INDEX IF EXISTS idx_job_embeddings_vector;
+-- CREATE INDEX idx_job_embeddings_vector ON public.job_embeddings
+--     USING ivfflat (embedding halfvec_cosine_ops) WITH (lists = 100);
+
+-- ============================================================================
+-- FIN DE LA MIGRATION
+-- ============================================================================
@@ -0,0 +1,27 @@
+-- ============================================================================
+-- MIGRATION INSERT PERFORMANCE
+-- ============================================================================
+-- Index et contraintes pour la résolution des dimensions (collectors/db_inserter.py)
+-- Date: 2026-10-16
+-- ============================================================================
+
+-- 1. CONTRAINTES UNIQUES pour les UPSERT (INSERT ... ON CONFLICT ... RETURNING)
+-- ⚠️ Échoue si des doublons existent déjà, à vérifier avant avec :
+--   SELECT category_code, COUNT(*) FROM dim_job_categories
+--   WHERE category_code IS NOT NULL GROUP BY 1 HAVING COUNT(*) > 1;
+--   SELECT city, department_code, COUNT(*) FROM dim_locations
+--   GROUP BY 1, 2 HAVING COUNT(*) > 1;
+-- (dim_sources.source_name et dim_dates.full_date sont déjà UNIQUE)
+ALTER TABLE dim_job_categories
+    ADD CONSTRAINT dim_job_categories_category_code_key UNIQUE (category_code);
+
+-- L'index unique sert aussi aux recherches par (city, department_code)
+ALTER TABLE dim_locations
+    ADD CONSTRAINT dim_locations_city_department_code_key UNIQUE (city, department_code);
+
+-- Remplacé par l'index de la contrainte unique
+DROP INDEX IF EXISTS idx_dim_locations_city_dept;
+
+-- ============================================================================
+-- FIN DE LA MIGRATION
+-- ============================================================================
@@ -1,11 +1,16 @@
 """
-Script pour exécuter la migration SQL NLP
-==========================================
-Exécute le fichier migration_nlp_enrichment.sql
+Script pour exécuter une migration SQL
+=======================================
+Exécute le fichier migration_nlp_enrichment.sql (par défaut)
+
+Usage:
+    python run_migration.py
+    python run_migration.py migration_insert_performance.sql
 """
 
 import psycopg2
 import os
+import sys
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -16,8 +21,10 @@ conn = psycopg2.connect(DATABASE_URL)
 conn.autocommit = True
 cursor = conn.cursor()
 
-print("🏗️  Exécution de la migration NLP...")
-with open("migration_nlp_enrichment.sql", "r", encoding="utf-8") as f:
+migration_file = sys.argv[1] if len(sys.argv) > 1 else "migration_nlp_enrichment.sql"
+
+print(f"🏗️  Exécution de la migration {migration_file}...")
+with open(migration_file, "r", encoding="utf-8") as f:
     migration_sql = f.read()
 
 try:
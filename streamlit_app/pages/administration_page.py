@@ -34,7 +34,12 @@ def scrape_offer(source: str, identifier: str, save_to_db: bool = False) -> dict
     try:
         response = requests.post(
             f"{API_BASE_URL}/api/scrape",
-            json={"source": source, "identifier": identifier, "save_to_db": save_to_db},
+            json={
+                "source": source,
+                "identifier": identifier,
+                "save_to_db": save_to_db,
+                "include_embedding": True,  # Vecteur affiché dans l'étape "Embedding"
+            },
             timeout=300,
         )
         response.raise_for_status()